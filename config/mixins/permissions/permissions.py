@@ -2,6 +2,8 @@ from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect
 from django.utils.decorators import method_decorator
 
+from core.authentication.services.group_permissions import GroupPermissionCache
+
 
 class PermissionMixin(object):
     permission_required = ''
@@ -15,12 +17,14 @@ class PermissionMixin(object):
 
             user.set_group_session(request)
 
-            if 'group_id' not in request.session:
+            group_id = request.session.get('group_id')
+
+            if not group_id:
                 return redirect('authentication:login')
 
-            group = user.get_group_session(request)
+            group_permissions = GroupPermissionCache().get_codenames(group_id)
 
-            if not group:
+            if group_permissions is None:
                 return redirect('authentication:login')
 
             permissions_to_validate = self._get_permissions_to_validate()
@@ -28,7 +32,7 @@ class PermissionMixin(object):
             if not len(permissions_to_validate):
                 return super().dispatch(request, *args, **kwargs)
 
-            has_permission = group.permissions.filter(codename__in=permissions_to_validate).exists()
+            has_permission = not group_permissions.isdisjoint(permissions_to_validate)
 
             if has_permission:
                 return super().dispatch(request, *args, **kwargs)
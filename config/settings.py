@@ -133,6 +133,10 @@ DATABASES = {
 #    }
 # }
 
+# Cache
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -152,6 +156,22 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+PASSWORD_HASHERS = [
+    'core.authentication.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Every row is hashed with Argon2 inside the request, tens of milliseconds each with the parameters below.
+# Larger imports should go through the bulk_register_users command, which batches off the request path.
+BULK_REGISTER_MAX_USERS = env.int('BULK_REGISTER_MAX_USERS', default=50)
+
+ARGON2_TIME_COST = env.int('ARGON2_TIME_COST', default=2)
+ARGON2_MEMORY_COST_KIB = env.int('ARGON2_MEMORY_COST_KIB', default=19456)
+ARGON2_PARALLELISM = env.int('ARGON2_PARALLELISM', default=1)
+
 AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
     'allauth.account.auth_backends.AuthenticationBackend',
@@ -160,7 +180,7 @@ AUTHENTICATION_BACKENDS = [
 # rest framework configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'core.authentication.api.auth.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -194,9 +214,68 @@ LOGIN_URL = '/login/'
 
 AUTH_USER_MODEL = 'authentication.User'
 
+# Group permissions are only cached with a shared CACHE_URL; with the locmem default every check hits the
+# database so a revoked permission is never served by a worker that missed the invalidation signal.
+PERMISSION_CACHE_TIMEOUT_SECONDS = env.int('PERMISSION_CACHE_TIMEOUT_SECONDS', default=300)
+
+AUTH_TOKEN_TTL_DAYS = env.int('AUTH_TOKEN_TTL_DAYS', default=30)
+# Profile edits invalidate the payload only in the worker's cache unless CACHE_URL is shared, so other
+# workers may serve the previous name or alias for up to this many seconds. Raise it only with a shared cache.
+LOGIN_PAYLOAD_CACHE_TIMEOUT_SECONDS = env.int('LOGIN_PAYLOAD_CACHE_TIMEOUT_SECONDS', default=60)
+USER_LOCATION_PING_MIN_DISTANCE_METERS = env.int('USER_LOCATION_PING_MIN_DISTANCE_METERS', default=50)
+USER_LOCATION_HEARTBEAT_FLUSH_SECONDS = env.int('USER_LOCATION_HEARTBEAT_FLUSH_SECONDS', default=30)
+USER_LOCATION_HEARTBEAT_MAX_BUFFERED = env.int('USER_LOCATION_HEARTBEAT_MAX_BUFFERED', default=500)
+# Token lookups are only cached when TOKEN_AUTH_SHARED_CACHE names a shared backend; with the locmem default
+# every request reads the token. Logout, rotation and deactivation clear the shared entry at once, but a
+# worker's in-process copy can still accept the revoked token for up to TOKEN_AUTH_CACHE_TTL_SECONDS.
+TOKEN_AUTH_CACHE_TTL_SECONDS = env.int('TOKEN_AUTH_CACHE_TTL_SECONDS', default=5)
+TOKEN_AUTH_CACHE_MAX_ENTRIES = env.int('TOKEN_AUTH_CACHE_MAX_ENTRIES', default=2048)
+TOKEN_AUTH_SHARED_CACHE = env('TOKEN_AUTH_SHARED_CACHE', default='default')
+TOKEN_AUTH_SHARED_CACHE_TTL_SECONDS = env.int('TOKEN_AUTH_SHARED_CACHE_TTL_SECONDS', default=300)
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_ACCEL_REDIRECT = env.bool('MEDIA_ACCEL_REDIRECT', default=not DEBUG)
+MEDIA_ACCEL_PREFIX = env('MEDIA_ACCEL_PREFIX', default='/protected-media/')
+MEDIA_PRIVATE_CACHE_SECONDS = env.int('MEDIA_PRIVATE_CACHE_SECONDS', default=86400)
+
+# Incidents
+INCIDENT_IDEMPOTENCY_TTL_HOURS = env.int('INCIDENT_IDEMPOTENCY_TTL_HOURS', default=24)
+INCIDENT_IDEMPOTENCY_PROCESSING_LEASE_SECONDS = env.int('INCIDENT_IDEMPOTENCY_PROCESSING_LEASE_SECONDS', default=120)
+INCIDENT_DEDUP_RADIUS_METERS = env.int('INCIDENT_DEDUP_RADIUS_METERS', default=150)
+INCIDENT_DEDUP_WINDOW_MINUTES = env.int('INCIDENT_DEDUP_WINDOW_MINUTES', default=30)
+INCIDENT_MEDIA_ASYNC_PROCESSING = env.bool('INCIDENT_MEDIA_ASYNC_PROCESSING', default=True)
+INCIDENT_MEDIA_DISPLAY_MAX_PX = env.int('INCIDENT_MEDIA_DISPLAY_MAX_PX', default=1280)
+INCIDENT_MEDIA_THUMBNAIL_MAX_PX = env.int('INCIDENT_MEDIA_THUMBNAIL_MAX_PX', default=320)
+INCIDENT_MEDIA_QUALITY = env.int('INCIDENT_MEDIA_QUALITY', default=80)
+INCIDENT_UPLOAD_MAX_BYTES = env.int('INCIDENT_UPLOAD_MAX_BYTES', default=100 * 1024 * 1024)
+INCIDENT_UPLOAD_MAX_CHUNK_BYTES = env.int('INCIDENT_UPLOAD_MAX_CHUNK_BYTES', default=5 * 1024 * 1024)
+INCIDENT_UPLOAD_SESSION_TTL_HOURS = env.int('INCIDENT_UPLOAD_SESSION_TTL_HOURS', default=24)
+INCIDENT_UPLOAD_TMP_DIR = env('INCIDENT_UPLOAD_TMP_DIR', default=str(MEDIA_ROOT / 'uploads' / 'tmp'))
+
+# Communities
+COMMUNITY_BOUNDARY_INDEX_TTL_SECONDS = env.int('COMMUNITY_BOUNDARY_INDEX_TTL_SECONDS', default=300)
+COMMUNITY_AUTO_RADIUS_METERS = env.int('COMMUNITY_AUTO_RADIUS_METERS', default=150)
+COMMUNITY_AUTO_JOIN_DISTANCE_METERS = env.int('COMMUNITY_AUTO_JOIN_DISTANCE_METERS', default=300)
+COMMUNITY_AUTO_MAX_SPAN_METERS = env.int('COMMUNITY_AUTO_MAX_SPAN_METERS', default=3000)
+COMMUNITY_MERGE_DISTANCE_METERS = env.int('COMMUNITY_MERGE_DISTANCE_METERS', default=200)
+# The member total on the member list is display only, so it may lag joins and removals by this long.
+COMMUNITY_MEMBER_COUNT_CACHE_SECONDS = env.int('COMMUNITY_MEMBER_COUNT_CACHE_SECONDS', default=300)
+
+# Notifications
+# The rate limiter buckets live in the default cache and are updated with a plain read-modify-write.
+# Set a shared CACHE_URL in production: with the per-process locmem default each worker keeps its own
+# buckets, so a user can receive up to capacity x workers pushes per window, and concurrent fan-outs
+# for the same user may both spend the same token.
+NOTIFICATION_RATE_LIMIT_CAPACITY = env.int('NOTIFICATION_RATE_LIMIT_CAPACITY', default=5)
+NOTIFICATION_RATE_LIMIT_REFILL_SECONDS = env.int('NOTIFICATION_RATE_LIMIT_REFILL_SECONDS', default=720)
+NOTIFICATION_DIGEST_MAX_ATTEMPTS = env.int('NOTIFICATION_DIGEST_MAX_ATTEMPTS', default=5)
+FCM_TOKEN_STALE_DAYS = env.int('FCM_TOKEN_STALE_DAYS', default=60)
+INCIDENT_NOTIFICATION_MAX_ATTEMPTS = env.int('INCIDENT_NOTIFICATION_MAX_ATTEMPTS', default=3)
+INCIDENT_NOTIFICATION_QUEUED_STALE_MINUTES = env.int('INCIDENT_NOTIFICATION_QUEUED_STALE_MINUTES', default=10)
+# Only used with a shared CACHE_URL; with the per-process default the unread count is read from the database.
+INCIDENT_NOTIFICATION_UNREAD_CACHE_SECONDS = env.int('INCIDENT_NOTIFICATION_UNREAD_CACHE_SECONDS', default=3600)
 
 # dev utils
 CORS_ALLOW_ALL_ORIGINS = True
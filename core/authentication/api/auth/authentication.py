@@ -0,0 +1,121 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from core.authentication.models import AuthToken
+from core.shared.cache import is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+
+class TokenAuthCache:
+    KEY_PREFIX = 'auth_token'
+
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def _shared_cache(cls):
+        alias = settings.TOKEN_AUTH_SHARED_CACHE
+        if not alias or not is_shared_cache(alias):
+            return None
+        return caches[alias]
+
+    @classmethod
+    def _shared_key(cls, key_hash):
+        return f'{cls.KEY_PREFIX}:{key_hash}'
+
+    @classmethod
+    def get(cls, key_hash):
+        shared = cls._shared_cache()
+        if shared is None:
+            return None
+
+        now = time.time()
+        with cls._lock:
+            entry = cls._entries.get(key_hash)
+            if entry is not None:
+                user, token_expires_at, cached_until = entry
+                if cached_until > now:
+                    cls._entries.move_to_end(key_hash)
+                    return copy.deepcopy(user), token_expires_at
+                del cls._entries[key_hash]
+
+        entry = shared.get(cls._shared_key(key_hash))
+        if entry is None:
+            return None
+        user, token_expires_at = entry
+        cls._store_local(key_hash, user, token_expires_at, now)
+        return user, token_expires_at
+
+    @classmethod
+    def set(cls, key_hash, user, token_expires_at):
+        shared = cls._shared_cache()
+        if shared is None:
+            return
+
+        now = time.time()
+        cls._store_local(key_hash, user, token_expires_at, now)
+        timeout = min(settings.TOKEN_AUTH_SHARED_CACHE_TTL_SECONDS, token_expires_at.timestamp() - now)
+        if timeout > 0:
+            shared.set(cls._shared_key(key_hash), (user, token_expires_at), int(timeout))
+
+    @classmethod
+    def _store_local(cls, key_hash, user, token_expires_at, now):
+        cached_until = min(now + settings.TOKEN_AUTH_CACHE_TTL_SECONDS, token_expires_at.timestamp())
+        with cls._lock:
+            cls._entries[key_hash] = (copy.deepcopy(user), token_expires_at, cached_until)
+            cls._entries.move_to_end(key_hash)
+            while len(cls._entries) > settings.TOKEN_AUTH_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, key_hashes):
+        key_hashes = list(key_hashes)
+        if not key_hashes:
+            return
+        with cls._lock:
+            for key_hash in key_hashes:
+                cls._entries.pop(key_hash, None)
+        shared = cls._shared_cache()
+        if shared is not None:
+            shared.delete_many([cls._shared_key(key_hash) for key_hash in key_hashes])
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    model = AuthToken
+
+    def authenticate_credentials(self, key):
+        key_hash = AuthToken.hash_key(key)
+
+        cached = TokenAuthCache.get(key_hash)
+        if cached is not None:
+            user, expires_at = cached
+            return user, AuthToken(key_hash=key_hash, user=user, expires_at=expires_at)
+
+        try:
+            token = AuthToken.objects.select_related('user').get(pk=key_hash)
+        except AuthToken.DoesNotExist:
+            raise exceptions.AuthenticationFailed('Token inválido.')
+
+        if token.expires_at <= timezone.now():
+            raise exceptions.AuthenticationFailed('Token expirado.')
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed('Usuario inactivo o eliminado.')
+
+        TokenAuthCache.set(key_hash, token.user, token.expires_at)
+        return token.user, token
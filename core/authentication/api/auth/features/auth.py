@@ -1,6 +1,8 @@
 from django.contrib.auth import authenticate
+from django.db import transaction
 from rest_framework import status
-from rest_framework.authtoken.models import Token
+
+from core.authentication.models import AuthToken
 
 
 class AuthenticationFeature:
@@ -9,7 +11,19 @@ class AuthenticationFeature:
     def login_user(username: str, password: str):
         user = authenticate(username=username, password=password)
         if user is None:
-            return None, {'message': 'Credenciales inválidas', 'code': status.HTTP_400_BAD_REQUEST}
+            return None, None, {'message': 'Credenciales inválidas', 'code': status.HTTP_400_BAD_REQUEST}
+
+        token, key = AuthToken.issue(user)
+        return token, user, {'message': 'Inicio de sesión exitoso', 'code': status.HTTP_200_OK, 'key': key}
 
-        token, created = Token.objects.get_or_create(user=user)
-        return token, user, {'message': 'Inicio de sesión exitoso', 'code': status.HTTP_200_OK}
+    @staticmethod
+    def refresh_token(token):
+        with transaction.atomic():
+            deleted, _ = AuthToken.objects.filter(pk=token.pk).delete()
+            if not deleted:
+                return None, None
+            return AuthToken.issue(token.user)
+
+    @staticmethod
+    def logout(token):
+        AuthToken.objects.filter(pk=token.pk).delete()
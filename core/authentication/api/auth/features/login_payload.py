@@ -0,0 +1,53 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.authentication.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class LoginPayloadFeature:
+    KEY_PREFIX = 'login_payload'
+    VERSION_PREFIX = 'user_version'
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+
+    def _version_key(self):
+        return f'{self.VERSION_PREFIX}:{self.user_id}'
+
+    def _payload_key(self, version):
+        return f'{self.KEY_PREFIX}:{self.user_id}:{version}'
+
+    def get_payload(self):
+        version = cache.get(self._version_key(), 1)
+        key = self._payload_key(version)
+        payload = cache.get(key)
+        if payload is None:
+            payload = self._build()
+            cache.set(key, payload, settings.LOGIN_PAYLOAD_CACHE_TIMEOUT_SECONDS)
+        return payload
+
+    def _build(self):
+        user = User.objects.select_related('profiles_by_user').get(pk=self.user_id)
+        profile = getattr(user, 'profiles_by_user', None)
+        return {
+            'id': user.id,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'username': user.username,
+            'dni': user.dni,
+            'email': user.email,
+            'is_active': user.is_active,
+            'full_name': user.get_full_name(),
+            'alias_name': profile.alias_name if profile else None,
+        }
+
+    def invalidate(self):
+        key = self._version_key()
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, None)
@@ -1,7 +1,9 @@
 from django.urls import path
 
-from core.authentication.api.auth.views.auth import CustomAuthTokenApiView
+from core.authentication.api.auth.views.auth import CustomAuthTokenApiView, RefreshAuthTokenApiView, LogoutApiView
 
 urlpatterns = [
     path('user', CustomAuthTokenApiView.as_view(), name='api_auth_user'),
+    path('token/refresh', RefreshAuthTokenApiView.as_view(), name='api_auth_token_refresh'),
+    path('logout', LogoutApiView.as_view(), name='api_auth_logout'),
 ]
@@ -1,13 +1,14 @@
 import logging
 
-from django.db import transaction
 from rest_framework import status
 from rest_framework.authtoken.views import ObtainAuthToken
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from core.authentication.api.auth.features.auth import AuthenticationFeature
-from core.authentication.api.auth.serializers.auth import AuthTokenSerializerInput, UserProfileDataSerializer
+from core.authentication.api.auth.features.login_payload import LoginPayloadFeature
+from core.authentication.api.auth.serializers.auth import AuthTokenSerializerInput
 
 logger = logging.getLogger(__name__)
 
@@ -18,24 +19,48 @@ class CustomAuthTokenApiView(ObtainAuthToken):
 
     def post(self, request, *args, **kwargs):
         try:
-            with transaction.atomic():
-                serializer = AuthTokenSerializerInput(data=request.data)
-                serializer.is_valid(raise_exception=True)
-                username = serializer.validated_data['username']
-                password = serializer.validated_data['password']
-                token, user, result = AuthenticationFeature.login_user(username, password)
-                logger.info(result)
-                if token is None:
-                    return Response({'detail': result['message']}, status=result['code'])
-                user_data = UserProfileDataSerializer(user).data
-                response_data = {
-                    'message': result['message'],
-                    'token': token.key,
-                    'user': user_data
-                }
-                logger.info(response_data)
-                return Response(response_data, status=result['code'])
+            serializer = AuthTokenSerializerInput(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            username = serializer.validated_data['username']
+            password = serializer.validated_data['password']
+            token, user, result = AuthenticationFeature.login_user(username, password)
+            if token is None:
+                logger.info(result['message'])
+                return Response({'detail': result['message']}, status=result['code'])
+            response_data = {
+                'message': result['message'],
+                'token': result['key'],
+                'expires_at': token.expires_at.isoformat(),
+                'user': LoginPayloadFeature(user.id).get_payload()
+            }
+            logger.info(f"Sesión iniciada para usuario {user.id}")
+            return Response(response_data, status=result['code'])
 
         except Exception as e:
             logger.error(str(e))
             return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class RefreshAuthTokenApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        token, key = AuthenticationFeature.refresh_token(request.auth)
+        if token is None:
+            return Response({'detail': 'Token inválido'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        logger.info(f"Token renovado para usuario {token.user_id}")
+        return Response({
+            'message': 'Token renovado exitosamente',
+            'token': key,
+            'expires_at': token.expires_at.isoformat()
+        }, status=status.HTTP_200_OK)
+
+
+class LogoutApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        AuthenticationFeature.logout(request.auth)
+        logger.info(f"Sesión cerrada para usuario {request.user.id}")
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,40 @@
+import logging
+
+from django.conf import settings
+from django.contrib.gis.db import models as gis_models
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import Distance
+from django.db.models import Q, Value
+from django.utils import timezone
+
+from core.authentication.models import UserProfile
+
+logger = logging.getLogger(__name__)
+
+
+class UserLocationFeature:
+
+    def __init__(self, user):
+        self.user = user
+
+    @staticmethod
+    def _point(latitude, longitude):
+        return Point(float(longitude), float(latitude), srid=4326)
+
+    def set_location(self, latitude, longitude):
+        point = self._point(latitude, longitude)
+        updated = UserProfile.objects.filter(user=self.user).update(location=point, updated_at=timezone.now())
+        if not updated:
+            UserProfile.objects.create(user=self.user, location=point)
+        logger.info(f"Ubicación actualizada para usuario {self.user.id}")
+        return point
+
+    def ping(self, latitude, longitude):
+        point = self._point(latitude, longitude)
+        origin = Value(point, output_field=gis_models.PointField(geography=True, srid=4326))
+        threshold = Distance(m=settings.USER_LOCATION_PING_MIN_DISTANCE_METERS)
+        moved = UserProfile.objects.filter(
+            Q(location__isnull=True) | ~Q(location_geography__dwithin=(origin, threshold)),
+            user=self.user
+        ).update(location=point, updated_at=timezone.now())
+        return bool(moved)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from core.authentication.api.profile.views.location import (
+    UserLocationApiView,
+    UserLocationHeartbeatApiView,
+    UserLocationPingApiView,
+)
+
+urlpatterns = [
+    path('location', UserLocationApiView.as_view(), name='api_profile_location'),
+    path('location/ping', UserLocationPingApiView.as_view(), name='api_profile_location_ping'),
+    path('location/heartbeat', UserLocationHeartbeatApiView.as_view(), name='api_profile_location_heartbeat'),
+]
@@ -0,0 +1,49 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.authentication.api.profile.feature.location import UserLocationFeature
+from core.authentication.api.profile.serializers.location import UserLocationSerializer
+from core.authentication.services.location_heartbeat import location_heartbeat_buffer
+
+logger = logging.getLogger(__name__)
+
+
+class UserLocationApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def put(self, request, *args, **kwargs):
+        serializer = UserLocationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        point = UserLocationFeature(request.user).set_location(**serializer.validated_data)
+        return Response({
+            'message': 'Ubicación actualizada exitosamente',
+            'latitude': point.y,
+            'longitude': point.x
+        }, status=status.HTTP_200_OK)
+
+
+class UserLocationPingApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = UserLocationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        updated = UserLocationFeature(request.user).ping(**serializer.validated_data)
+        return Response({'updated': updated}, status=status.HTTP_200_OK)
+
+
+class UserLocationHeartbeatApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = UserLocationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        location_heartbeat_buffer.record(request.user.id, **serializer.validated_data)
+        return Response({'accepted': True}, status=status.HTTP_202_ACCEPTED)
@@ -1,6 +1,9 @@
 import logging
 
+from django.utils import timezone
+
 from core.authentication.models import FCMToken
+from core.authentication.services.fcm_token_lifecycle import FCMTokenLifecycleManager
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +24,19 @@ class RegisterFCMTokenFeature:
             return None
 
         try:
+            now = timezone.now()
             token_obj, created = FCMToken.objects.update_or_create(
-                token=self.token,
+                token_hash=FCMToken.hash_token(self.token),
                 defaults={
+                    'token': self.token,
                     'user': self.user,
                     'device_id': self.device_id,
-                    'is_active': True
+                    'is_active': True,
+                    'last_seen_at': now,
+                    'last_used_at': now
                 }
             )
+            FCMTokenLifecycleManager().retire_device_tokens(self.device_id, self.token)
 
             if created:
                 logger.info(f'FCMToken created for user {self.user.email}')
@@ -41,14 +49,17 @@ class RegisterFCMTokenFeature:
             logger.error(f"Error al registrar token FCM para {self.user.email}: {str(e)}")
             raise
 
-    def deactivate_old_tokens(self, user, current_token):
+    def deactivate_old_tokens(self, user, current_token, device_id=None):
         try:
-            FCMToken.objects.filter(
-                user=user,
-                is_active=True
-            ).exclude(
-                token=current_token
-            ).update(is_active=False)
+            if device_id:
+                FCMTokenLifecycleManager().retire_device_tokens(device_id, current_token)
+            else:
+                FCMToken.objects.filter(
+                    user=user,
+                    is_active=True
+                ).exclude(
+                    token_hash=FCMToken.hash_token(current_token)
+                ).update(is_active=False)
 
             logger.info(f"Tokens antiguos desactivados para usuario {user.username}")
         except Exception as e:
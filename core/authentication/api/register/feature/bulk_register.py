@@ -0,0 +1,165 @@
+import logging
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.gis.geos import Point
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.authentication.api.register.serializers.bulk_register import BulkRegisterUserItemSerializer
+from core.authentication.models import FCMToken, User, UserProfile
+from core.authentication.services.fcm_token_lifecycle import FCMTokenLifecycleManager
+
+logger = logging.getLogger(__name__)
+
+UNIQUE_FIELDS = ('dni', 'email', 'username')
+
+
+class BulkRegisterUsersFeature:
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.errors = []
+
+    def register(self):
+        valid_rows = self._validate()
+        if not valid_rows:
+            return 0
+
+        with transaction.atomic():
+            users = self._create_users(valid_rows)
+            self._create_profiles(users, valid_rows)
+            self._register_fcm_tokens(users, valid_rows)
+
+        logger.info(f"Registro masivo: {len(users)} usuarios creados, {len(self.errors)} filas con errores")
+        return len(users)
+
+    def _add_error(self, index, errors):
+        self.errors.append({'index': index, 'errors': errors})
+
+    def _validate(self):
+        if len(self.rows) > settings.BULK_REGISTER_MAX_USERS:
+            self._add_error(None, {
+                'non_field_errors': [f'Máximo {settings.BULK_REGISTER_MAX_USERS} usuarios por solicitud']
+            })
+            return []
+
+        candidates = []
+        seen = {field: set() for field in UNIQUE_FIELDS}
+        seen_tokens = set()
+        for index, row in enumerate(self.rows):
+            serializer = BulkRegisterUserItemSerializer(data=row)
+            if not serializer.is_valid():
+                self._add_error(index, serializer.errors)
+                continue
+
+            data = serializer.validated_data
+            duplicated = {
+                field: ['Valor repetido en la solicitud']
+                for field in UNIQUE_FIELDS if data[field] in seen[field]
+            }
+            if data.get('fcmToken') and data['fcmToken'] in seen_tokens:
+                duplicated['fcmToken'] = ['Valor repetido en la solicitud']
+            if duplicated:
+                self._add_error(index, duplicated)
+                continue
+            for field in UNIQUE_FIELDS:
+                seen[field].add(data[field])
+            if data.get('fcmToken'):
+                seen_tokens.add(data['fcmToken'])
+            candidates.append((index, data))
+
+        if not candidates:
+            return []
+
+        existing = {field: set() for field in UNIQUE_FIELDS}
+        for dni, email, username in User.objects.filter(
+            Q(dni__in=seen['dni']) | Q(email__in=seen['email']) | Q(username__in=seen['username'])
+        ).values_list('dni', 'email', 'username'):
+            existing['dni'].add(dni)
+            existing['email'].add(email)
+            existing['username'].add(username)
+
+        valid_rows = []
+        for index, data in candidates:
+            taken = {
+                field: ['Ya existe un usuario con este valor']
+                for field in UNIQUE_FIELDS if data[field] in existing[field]
+            }
+            if taken:
+                self._add_error(index, taken)
+                continue
+            valid_rows.append(data)
+        return valid_rows
+
+    def _create_users(self, rows):
+        users = [
+            User(
+                username=data['username'],
+                password=make_password(data['password']),
+                dni=data['dni'],
+                first_name=data['firstName'],
+                last_name=data['lastName'],
+                email=data['email'],
+            )
+            for data in rows
+        ]
+        return User.objects.bulk_create(users)
+
+    def _create_profiles(self, users, rows):
+        profiles = []
+        for user, data in zip(users, rows):
+            latitude = data.get('latitude')
+            longitude = data.get('longitude')
+            has_location = latitude is not None and longitude is not None
+            profiles.append(UserProfile(
+                user=user,
+                alias_name=data.get('displayName') or '',
+                location=Point(longitude, latitude, srid=4326) if has_location else None,
+            ))
+        UserProfile.objects.bulk_create(profiles)
+
+    def _register_fcm_tokens(self, users, rows):
+        requested = {
+            data['fcmToken']: (user, data.get('deviceId'))
+            for user, data in zip(users, rows) if data.get('fcmToken')
+        }
+        if not requested:
+            return
+
+        devices = [(device_id, token) for token, (user, device_id) in requested.items() if device_id]
+
+        now = timezone.now()
+        existing = list(FCMToken.objects.filter(
+            token_hash__in=[FCMToken.hash_token(token) for token in requested]
+        ))
+        for token in existing:
+            token.user, token.device_id = requested[token.token]
+            token.is_active = True
+            token.last_seen_at = now
+            token.last_used_at = now
+            token.updated_at = now
+        for token in existing:
+            requested.pop(token.token, None)
+        if existing:
+            FCMToken.objects.bulk_update(existing, [
+                'user', 'device_id', 'is_active', 'last_seen_at', 'last_used_at', 'updated_at'
+            ])
+
+        FCMToken.objects.bulk_create([
+            FCMToken(
+                user=user,
+                token=token,
+                token_hash=FCMToken.hash_token(token),
+                device_id=device_id,
+                is_active=True,
+                last_seen_at=now,
+                last_used_at=now,
+            )
+            for token, (user, device_id) in requested.items()
+        ])
+
+        lifecycle = FCMTokenLifecycleManager()
+        for device_id, token in devices:
+            lifecycle.retire_device_tokens(device_id, token)
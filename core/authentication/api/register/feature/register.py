@@ -12,9 +12,7 @@ class RegisterUserProfileFeature:
         profile = UserProfile.objects.create(
             user=user,
             alias_name=profile_data.get('displayName', ''),
-            latitude=latitude,
-            longitude=longitude,
-            location=Point(longitude, latitude, srid=4326) if latitude and longitude else None,
+            location=Point(longitude, latitude, srid=4326) if latitude is not None and longitude is not None else None,
         )
 
         return profile
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+
+class BulkRegisterUserItemSerializer(serializers.Serializer):
+    username = serializers.CharField()
+    password = serializers.CharField(write_only=True)
+    dni = serializers.CharField()
+    firstName = serializers.CharField()
+    lastName = serializers.CharField()
+    email = serializers.EmailField()
+    displayName = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    latitude = serializers.FloatField(required=False, allow_null=True, min_value=-90, max_value=90)
+    longitude = serializers.FloatField(required=False, allow_null=True, min_value=-180, max_value=180)
+    fcmToken = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    deviceId = serializers.CharField(required=False, allow_blank=True, allow_null=True)
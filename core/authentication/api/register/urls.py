@@ -1,9 +1,11 @@
 from django.urls import path
 
+from core.authentication.api.register.views.bulk_register import BulkRegisterUserApiView
 from core.authentication.api.register.views.fcm_token import UpdateFCMTokenApiView
 from core.authentication.api.register.views.register import RegisterUserApiView
 
 urlpatterns = [
     path('user', RegisterUserApiView.as_view(), name='api_register_user'),
+    path('users/bulk', BulkRegisterUserApiView.as_view(), name='api_bulk_register_users'),
     path('update_fcm_token', UpdateFCMTokenApiView.as_view(), name='api_update_fcm_token')
 ]
@@ -0,0 +1,33 @@
+import logging
+
+from django.db import IntegrityError
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.authentication.api.register.feature.bulk_register import BulkRegisterUsersFeature
+
+logger = logging.getLogger(__name__)
+
+
+class BulkRegisterUserApiView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        rows = request.data.get('users') if isinstance(request.data, dict) else request.data
+        if not isinstance(rows, list) or not rows:
+            return Response({'errors': 'Se requiere una lista de usuarios'}, status=status.HTTP_400_BAD_REQUEST)
+
+        feature = BulkRegisterUsersFeature(rows)
+        try:
+            created = feature.register()
+        except IntegrityError as ie:
+            logger.error(f"Conflicto en registro masivo: {str(ie)}")
+            return Response({'errors': 'User with this information already exists'}, status=status.HTTP_409_CONFLICT)
+        except Exception as e:
+            logger.error(str(e))
+            return Response({'detail': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        response_status = status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
+        return Response({'created': created, 'errors': feature.errors}, status=response_status)
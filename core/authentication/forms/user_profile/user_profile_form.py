@@ -9,7 +9,7 @@ class UserProfileForm(forms.ModelForm):
 
     class Meta:
         model = UserProfile
-        fields = ['bio', 'alias_name', 'latitude', 'longitude']
+        fields = ['bio', 'alias_name']
         widgets = {
             'bio': forms.Textarea(attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Cuéntanos sobre ti...'}),
             'alias_name': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Alias'}),
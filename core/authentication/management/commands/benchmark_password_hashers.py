@@ -0,0 +1,40 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, get_hashers
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Mide la latencia de verificación de contraseñas (p50/p99) para cada hasher configurado'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=50)
+        parser.add_argument('--algorithm', action='append', dest='algorithms')
+
+    def handle(self, *args, **options):
+        rounds = options['rounds']
+        algorithms = options['algorithms'] or [hasher.algorithm for hasher in get_hashers()]
+        password = 'RimayAlert-benchmark-2025'
+
+        self.stdout.write(f"Hasher preferido: {settings.PASSWORD_HASHERS[0]}")
+        self.stdout.write(f"{'algoritmo':<24}{'p50 (ms)':>12}{'p99 (ms)':>12}{'logins/s':>12}")
+        for algorithm in algorithms:
+            hasher = get_hasher(algorithm)
+            try:
+                encoded = hasher.encode(password, hasher.salt())
+            except ValueError as e:
+                self.stdout.write(self.style.WARNING(f"{algorithm:<24}no disponible: {e}"))
+                continue
+
+            timings = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                hasher.verify(password, encoded)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            timings.sort()
+            p50 = statistics.median(timings)
+            p99 = timings[min(len(timings) - 1, int(round(len(timings) * 0.99)) - 1)]
+            self.stdout.write(f"{algorithm:<24}{p50:>12.1f}{p99:>12.1f}{1000 / p50:>12.1f}")
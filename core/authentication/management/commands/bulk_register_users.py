@@ -0,0 +1,43 @@
+import csv
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.authentication.api.register.feature.bulk_register import BulkRegisterUsersFeature
+
+
+class Command(BaseCommand):
+    help = 'Registra usuarios de forma masiva desde un archivo JSON o CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Archivo .json (lista de usuarios) o .csv con encabezados')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        try:
+            with open(path, encoding='utf-8') as source:
+                if path.lower().endswith('.csv'):
+                    rows = [
+                        {key: value for key, value in row.items() if value not in (None, '')}
+                        for row in csv.DictReader(source)
+                    ]
+                else:
+                    rows = json.load(source)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'No se pudo leer {path}: {e}')
+
+        if not isinstance(rows, list):
+            raise CommandError('El archivo debe contener una lista de usuarios')
+
+        batch_size = settings.BULK_REGISTER_MAX_USERS
+        created = 0
+        failed = 0
+        for offset in range(0, len(rows), batch_size):
+            feature = BulkRegisterUsersFeature(rows[offset:offset + batch_size])
+            created += feature.register()
+            failed += len(feature.errors)
+            for error in feature.errors:
+                self.stderr.write(f"Fila {offset + error['index']}: {error['errors']}")
+
+        self.stdout.write(self.style.SUCCESS(f'Usuarios creados: {created}, filas con errores: {failed}'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from core.authentication.services.fcm_token_lifecycle import FCMTokenLifecycleManager
+
+
+class Command(BaseCommand):
+    help = 'Elimina los tokens FCM sin registros ni entregas exitosas en los últimos días'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = FCMTokenLifecycleManager(stale_days=options['days']).prune(batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Tokens FCM sin uso eliminados: {total}'))
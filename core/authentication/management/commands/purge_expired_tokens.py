@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.authentication.models import AuthToken
+
+
+class Command(BaseCommand):
+    help = 'Elimina los tokens de acceso expirados'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = timezone.now()
+        total = 0
+        while True:
+            key_hashes = list(
+                AuthToken.objects.filter(expires_at__lte=now)
+                .order_by('expires_at')
+                .values_list('key_hash', flat=True)[:batch_size]
+            )
+            if not key_hashes:
+                break
+            deleted, _ = AuthToken.objects.filter(key_hash__in=key_hashes).delete()
+            total += deleted
+
+        self.stdout.write(self.style.SUCCESS(f'Tokens expirados eliminados: {total}'))
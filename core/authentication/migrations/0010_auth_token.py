@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0009_alter_fcmtoken_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthToken',
+            fields=[
+                ('key_hash', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='Hash del token')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creado en')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='Expira en')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='auth_tokens_by_user', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Token de acceso',
+                'verbose_name_plural': 'Tokens de acceso',
+                'db_table': 'authentication_auth_token',
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+
+
+def migrate_drf_tokens(apps, schema_editor):
+    Token = apps.get_model('authtoken', 'Token')
+    AuthToken = apps.get_model('authentication', 'AuthToken')
+
+    expires_at = timezone.now() + timedelta(days=settings.AUTH_TOKEN_TTL_DAYS)
+    batch = []
+    for token in Token.objects.all().iterator(chunk_size=1000):
+        batch.append(AuthToken(
+            key_hash=hashlib.sha256(token.key.encode('utf-8')).hexdigest(),
+            user_id=token.user_id,
+            expires_at=expires_at
+        ))
+        if len(batch) >= 1000:
+            AuthToken.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        AuthToken.objects.bulk_create(batch, ignore_conflicts=True)
+    Token.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0010_auth_token'),
+        ('authtoken', '0004_alter_tokenproxy_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrate_drf_tokens, migrations.RunPython.noop),
+    ]
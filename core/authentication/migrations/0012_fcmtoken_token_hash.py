@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0011_migrate_drf_tokens'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fcmtoken',
+            name='token_hash',
+            field=models.CharField(editable=False, max_length=64, null=True, verbose_name='Hash del token'),
+        ),
+    ]
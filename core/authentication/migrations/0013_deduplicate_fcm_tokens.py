@@ -0,0 +1,39 @@
+import hashlib
+
+from django.db import migrations
+
+
+def deduplicate_fcm_tokens(apps, schema_editor):
+    FCMToken = apps.get_model('authentication', 'FCMToken')
+
+    seen = set()
+    duplicated_ids = []
+    pending = []
+    tokens = FCMToken.objects.order_by('-is_active', '-updated_at', '-id').only('id', 'token')
+    for fcm_token in tokens.iterator(chunk_size=2000):
+        token_hash = hashlib.sha256(fcm_token.token.encode('utf-8')).hexdigest()
+        if token_hash in seen:
+            duplicated_ids.append(fcm_token.id)
+            continue
+        seen.add(token_hash)
+        fcm_token.token_hash = token_hash
+        pending.append(fcm_token)
+        if len(pending) >= 1000:
+            FCMToken.objects.bulk_update(pending, ['token_hash'])
+            pending = []
+    if pending:
+        FCMToken.objects.bulk_update(pending, ['token_hash'])
+
+    for start in range(0, len(duplicated_ids), 1000):
+        FCMToken.objects.filter(id__in=duplicated_ids[start:start + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0012_fcmtoken_token_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_fcm_tokens, migrations.RunPython.noop),
+    ]
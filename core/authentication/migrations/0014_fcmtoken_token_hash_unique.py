@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0013_deduplicate_fcm_tokens'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='fcmtoken',
+            name='token_hash',
+            field=models.CharField(editable=False, max_length=64, unique=True, verbose_name='Hash del token'),
+        ),
+        migrations.AddIndex(
+            model_name='fcmtoken',
+            index=models.Index(fields=['user', 'is_active'], name='fcm_token_user_active_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0014_fcmtoken_token_hash_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fcmtoken',
+            name='last_delivery_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Última entrega exitosa'),
+        ),
+        migrations.AddField(
+            model_name='fcmtoken',
+            name='last_seen_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Último registro desde la app'),
+        ),
+        migrations.AddIndex(
+            model_name='fcmtoken',
+            index=models.Index(fields=['device_id'], name='fcm_token_device_idx'),
+        ),
+    ]
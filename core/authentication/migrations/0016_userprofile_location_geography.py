@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:29
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0015_fcmtoken_lifecycle'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='location_geography',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast('location', django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326)), output_field=django.contrib.gis.db.models.fields.PointField(geography=True, spatial_index=False, srid=4326), verbose_name='Ubicación (geography)'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['location_geography'], name='user_profile_geog_gist_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0016_userprofile_location_geography'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                UPDATE authentication_userprofile
+                SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)
+                WHERE location IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='latitude',
+        ),
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='longitude',
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='latitude',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('location', function='ST_Y', output_field=models.FloatField()), output_field=models.FloatField(blank=True, null=True), verbose_name='Latitud'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='longitude',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('location', function='ST_X', output_field=models.FloatField()), output_field=models.FloatField(blank=True, null=True), verbose_name='Longitud'),
+        ),
+    ]
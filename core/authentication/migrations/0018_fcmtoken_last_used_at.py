@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-19 20:02
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models.functions import Coalesce, Greatest
+
+
+def backfill_last_used_at(apps, schema_editor):
+    FCMToken = apps.get_model('authentication', 'FCMToken')
+    FCMToken.objects.update(last_used_at=Greatest(
+        Coalesce('last_seen_at', 'updated_at'),
+        Coalesce('last_delivery_at', 'updated_at'),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0017_userprofile_generated_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fcmtoken',
+            name='last_used_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Último uso'),
+        ),
+        migrations.RunPython(backfill_last_used_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='fcmtoken',
+            index=models.Index(fields=['last_used_at'], name='fcm_token_last_used_idx'),
+        ),
+    ]
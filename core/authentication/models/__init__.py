@@ -1,2 +1,3 @@
 from .fcm import *
 from .user import *
+from .auth_token import *
@@ -0,0 +1 @@
+from .auth_token import *
@@ -0,0 +1,49 @@
+import hashlib
+import secrets
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class AuthToken(models.Model):
+    key_hash = models.CharField(max_length=64, primary_key=True, verbose_name='Hash del token')
+    user = models.ForeignKey(
+        "authentication.User",
+        on_delete=models.CASCADE,
+        related_name='auth_tokens_by_user',
+        verbose_name='Usuario'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Creado en')
+    expires_at = models.DateTimeField(db_index=True, verbose_name='Expira en')
+
+    class Meta:
+        db_table = 'authentication_auth_token'
+        verbose_name = 'Token de acceso'
+        verbose_name_plural = 'Tokens de acceso'
+
+    def __str__(self):
+        return f"{self.user_id} - {self.key_hash[:8]}..."
+
+    @staticmethod
+    def generate_key():
+        return secrets.token_hex(20)
+
+    @staticmethod
+    def hash_key(key):
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def default_expiration():
+        return timezone.now() + timedelta(days=settings.AUTH_TOKEN_TTL_DAYS)
+
+    @classmethod
+    def issue(cls, user):
+        key = cls.generate_key()
+        token = cls.objects.create(key_hash=cls.hash_key(key), user=user, expires_at=cls.default_expiration())
+        return token, key
+
+    @property
+    def is_expired(self):
+        return self.expires_at <= timezone.now()
@@ -1,4 +1,7 @@
+import hashlib
+
 from django.db import models
+from django.utils import timezone
 
 
 class FCMToken(models.Model):
@@ -9,8 +12,12 @@ class FCMToken(models.Model):
         verbose_name='Usuario'
     )
     token = models.TextField(verbose_name="FCM Token",)
+    token_hash = models.CharField(max_length=64, unique=True, editable=False, verbose_name='Hash del token')
     device_id = models.CharField(max_length=255, blank=True, null=True, verbose_name='ID del dispositivo')
     is_active = models.BooleanField(default=True, verbose_name='Activo')
+    last_seen_at = models.DateTimeField(blank=True, null=True, verbose_name='Último registro desde la app')
+    last_delivery_at = models.DateTimeField(blank=True, null=True, verbose_name='Última entrega exitosa')
+    last_used_at = models.DateTimeField(default=timezone.now, verbose_name='Último uso')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='Creado en')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Actualizado en')
 
@@ -18,6 +25,22 @@ class FCMToken(models.Model):
         verbose_name = 'Token FCM'
         verbose_name_plural = 'Tokens FCM'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_active'], name='fcm_token_user_active_idx'),
+            models.Index(fields=['device_id'], name='fcm_token_device_idx'),
+            models.Index(fields=['last_used_at'], name='fcm_token_last_used_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.token[:20]}..."
+
+    @staticmethod
+    def hash_token(token):
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.token_hash = self.hash_token(self.token)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'token' in update_fields and 'token_hash' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'token_hash']
+        super().save(*args, **kwargs)
@@ -1,5 +1,8 @@
-from django.db import models
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GistIndex
+from django.db import models
+from django.db.models import Func
+from django.db.models.functions import Cast
 
 
 class UserProfile(models.Model):
@@ -9,8 +12,24 @@ class UserProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de actualización')
     location = gis_models.PointField(srid=4326, blank=True, null=True, verbose_name="Área límite")
-    latitude = models.FloatField(null=True, blank=True, verbose_name='Latitud')
-    longitude = models.FloatField(null=True, blank=True, verbose_name='Longitud')
+    location_geography = models.GeneratedField(
+        expression=Cast('location', gis_models.PointField(geography=True, srid=4326)),
+        output_field=gis_models.PointField(geography=True, srid=4326, spatial_index=False),
+        db_persist=True,
+        verbose_name='Ubicación (geography)'
+    )
+    latitude = models.GeneratedField(
+        expression=Func('location', function='ST_Y', output_field=models.FloatField()),
+        output_field=models.FloatField(null=True, blank=True),
+        db_persist=True,
+        verbose_name='Latitud'
+    )
+    longitude = models.GeneratedField(
+        expression=Func('location', function='ST_X', output_field=models.FloatField()),
+        output_field=models.FloatField(null=True, blank=True),
+        db_persist=True,
+        verbose_name='Longitud'
+    )
 
     def __str__(self):
         return f'Profile of {self.user.get_full_name()}'
@@ -18,3 +37,6 @@ class UserProfile(models.Model):
     class Meta:
         verbose_name = 'User Profile'
         verbose_name_plural = 'User Profiles'
+        indexes = [
+            GistIndex(fields=['location_geography'], name='user_profile_geog_gist_idx'),
+        ]
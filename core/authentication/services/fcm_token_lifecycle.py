@@ -0,0 +1,67 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.authentication.models import FCMToken
+
+logger = logging.getLogger(__name__)
+
+
+class FCMTokenLifecycleManager:
+
+    def __init__(self, stale_days=None):
+        self.stale_days = stale_days or settings.FCM_TOKEN_STALE_DAYS
+
+    @staticmethod
+    def _hashes(tokens):
+        return [FCMToken.hash_token(token) for token in tokens]
+
+    def record_deliveries(self, tokens):
+        if not tokens:
+            return 0
+        now = timezone.now()
+        return FCMToken.objects.filter(token_hash__in=self._hashes(tokens)).update(
+            last_delivery_at=now,
+            last_used_at=now
+        )
+
+    def deactivate(self, tokens):
+        if not tokens:
+            return 0
+        deactivated = FCMToken.objects.filter(
+            token_hash__in=self._hashes(tokens),
+            is_active=True
+        ).update(is_active=False)
+        logger.info(f"Desactivados {deactivated} tokens FCM inválidos")
+        return deactivated
+
+    def retire_device_tokens(self, device_id, current_token):
+        if not device_id:
+            return 0
+        retired = FCMToken.objects.filter(
+            device_id=device_id,
+            is_active=True
+        ).exclude(
+            token_hash=FCMToken.hash_token(current_token)
+        ).update(is_active=False)
+        if retired:
+            logger.info(f"Desactivados {retired} tokens anteriores del dispositivo {device_id}")
+        return retired
+
+    def stale_tokens(self):
+        cutoff = timezone.now() - timedelta(days=self.stale_days)
+        return FCMToken.objects.filter(last_used_at__lt=cutoff)
+
+    def prune(self, batch_size=1000):
+        total = 0
+        while True:
+            ids = list(self.stale_tokens().order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted, _ = FCMToken.objects.filter(id__in=ids).delete()
+            total += deleted
+
+        logger.info(f"Tokens FCM sin uso eliminados: {total}")
+        return total
@@ -0,0 +1,66 @@
+import logging
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+
+from core.shared.cache import is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+
+class GroupPermissionCache:
+    KEY_PREFIX = 'group_perms'
+    VERSION_KEY = 'group_perms_version'
+    MISSING = '__missing__'
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout or settings.PERMISSION_CACHE_TIMEOUT_SECONDS
+        self.enabled = is_shared_cache()
+
+    def _version(self):
+        version = cache.get(self.VERSION_KEY)
+        if version is None:
+            version = 1
+            cache.add(self.VERSION_KEY, version, None)
+        return version
+
+    def _key(self, group_id):
+        return f'{self.KEY_PREFIX}:{self._version()}:{group_id}'
+
+    def get_codenames(self, group_id):
+        if not self.enabled:
+            codenames = self._load(group_id)
+            return None if codenames == self.MISSING else frozenset(codenames)
+
+        key = self._key(group_id)
+        codenames = cache.get(key)
+        if codenames is None:
+            codenames = self._load(group_id)
+            cache.set(key, codenames, self.timeout)
+        if codenames == self.MISSING:
+            return None
+        return frozenset(codenames)
+
+    def _load(self, group_id):
+        group = Group.objects.filter(pk=group_id).first()
+        if group is None:
+            return self.MISSING
+        return list(group.permissions.values_list('codename', flat=True))
+
+    def invalidate(self, group_ids):
+        if not self.enabled:
+            return
+        keys = [self._key(group_id) for group_id in group_ids]
+        if keys:
+            cache.delete_many(keys)
+            logger.info(f"Permisos en caché invalidados para grupos {list(group_ids)}")
+
+    def invalidate_all(self):
+        if not self.enabled:
+            return
+        try:
+            cache.incr(self.VERSION_KEY)
+        except ValueError:
+            cache.set(self.VERSION_KEY, 2, None)
+        logger.info("Permisos de grupos en caché invalidados")
@@ -0,0 +1,98 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from core.authentication.models import UserProfile
+
+logger = logging.getLogger(__name__)
+
+
+class LocationHeartbeatBuffer:
+    BATCH_SIZE = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_flush = time.monotonic()
+        self._timer = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def record(self, user_id, latitude, longitude):
+        with self._lock:
+            self._pending[user_id] = (float(latitude), float(longitude))
+            due = (
+                len(self._pending) >= settings.USER_LOCATION_HEARTBEAT_MAX_BUFFERED
+                or time.monotonic() - self._last_flush >= settings.USER_LOCATION_HEARTBEAT_FLUSH_SECONDS
+            )
+            if not due and self._timer is None:
+                self._timer = threading.Timer(settings.USER_LOCATION_HEARTBEAT_FLUSH_SECONDS, self._timed_flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if due:
+            self.flush()
+
+    def _timed_flush(self):
+        try:
+            self.flush()
+        finally:
+            connection.close()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return 0
+
+        rows = [(user_id, latitude, longitude) for user_id, (latitude, longitude) in pending.items()]
+        updated = 0
+        try:
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                updated += self._update(rows[start:start + self.BATCH_SIZE])
+        except Exception as e:
+            logger.error(f"Error al guardar {len(rows)} ubicaciones en lote: {str(e)}")
+            return 0
+
+        logger.info(f"Ubicaciones en lote: {len(rows)} recibidas, {updated} actualizadas")
+        return updated
+
+    @staticmethod
+    def _update(rows):
+        table = UserProfile._meta.db_table
+        values = ', '.join(['(%s, %s, %s)'] * len(rows))
+        sql = f"""
+            UPDATE {table} AS profile
+            SET location = ST_SetSRID(ST_MakePoint(ping.longitude, ping.latitude), 4326),
+                updated_at = %s
+            FROM (VALUES {values}) AS ping (user_id, latitude, longitude)
+            WHERE profile.user_id = ping.user_id
+              AND (
+                profile.location IS NULL
+                OR NOT ST_DWithin(
+                    profile.location_geography,
+                    ST_SetSRID(ST_MakePoint(ping.longitude, ping.latitude), 4326)::geography,
+                    %s
+                )
+              )
+        """
+        params = [timezone.now()]
+        for row in rows:
+            params.extend(row)
+        params.append(settings.USER_LOCATION_PING_MIN_DISTANCE_METERS)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+
+location_heartbeat_buffer = LocationHeartbeatBuffer()
+atexit.register(location_heartbeat_buffer.flush)
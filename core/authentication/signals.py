@@ -0,0 +1,58 @@
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from core.authentication.api.auth.authentication import TokenAuthCache
+from core.authentication.api.auth.features.login_payload import LoginPayloadFeature
+from core.authentication.models import AuthToken, User, UserProfile
+from core.authentication.services.group_permissions import GroupPermissionCache
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_group_permissions(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        GroupPermissionCache().invalidate([instance.pk])
+    elif pk_set:
+        GroupPermissionCache().invalidate(pk_set)
+    else:
+        GroupPermissionCache().invalidate_all()
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def invalidate_deleted_group(sender, instance, **kwargs):
+    GroupPermissionCache().invalidate([instance.pk])
+
+
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+def invalidate_changed_permission(sender, instance, **kwargs):
+    GroupPermissionCache().invalidate_all()
+
+
+@receiver(post_save, sender=AuthToken)
+@receiver(post_delete, sender=AuthToken)
+def invalidate_cached_token(sender, instance, **kwargs):
+    TokenAuthCache.invalidate([instance.key_hash])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user_tokens(sender, instance, **kwargs):
+    if kwargs.get('created'):
+        return
+    TokenAuthCache.invalidate(AuthToken.objects.filter(user_id=instance.pk).values_list('key_hash', flat=True))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_login_payload(sender, instance, **kwargs):
+    LoginPayloadFeature(instance.pk).invalidate()
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_profile_login_payload(sender, instance, **kwargs):
+    LoginPayloadFeature(instance.user_id).invalidate()
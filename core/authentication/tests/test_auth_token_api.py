@@ -0,0 +1,76 @@
+import secrets
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.authentication.api.auth.authentication import TokenAuthCache
+from core.authentication.models import AuthToken, User
+
+
+@override_settings(AUTH_TOKEN_TTL_DAYS=30, TOKEN_AUTH_SHARED_CACHE=None)
+class AuthTokenApiTest(TestCase):
+
+    def setUp(self):
+        TokenAuthCache.clear()
+        self.client = APIClient()
+        self.password = secrets.token_urlsafe(32)
+        self.user = User.objects.create_user(
+            username='mobile',
+            email='mobile@example.com',
+            password=self.password,
+            dni='4444444444'
+        )
+
+    def _login(self):
+        return self.client.post(
+            '/api/auth/user',
+            {'username': 'mobile', 'password': self.password},
+            format='json'
+        )
+
+    def test_login_returns_expiring_token(self):
+        response = self._login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('expires_at', response.data)
+        self.assertTrue(AuthToken.objects.filter(pk=AuthToken.hash_key(response.data['token'])).exists())
+
+    def test_invalid_credentials(self):
+        response = self.client.post('/api/auth/user', {'username': 'mobile', 'password': 'mala'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['detail'], 'Credenciales inválidas')
+
+    def test_refresh_rotates_token(self):
+        old_key = self._login().data['token']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {old_key}')
+
+        response = self.client.post('/api/auth/token/refresh')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.data['token'], old_key)
+        self.assertFalse(AuthToken.objects.filter(pk=AuthToken.hash_key(old_key)).exists())
+        self.assertEqual(self.client.post('/api/auth/token/refresh').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_revokes_token(self):
+        key = self._login().data['token']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {key}')
+
+        response = self.client.post('/api/auth/logout')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.post('/api/auth/logout').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_purge_expired_tokens(self):
+        expired, _ = AuthToken.issue(self.user)
+        active, _ = AuthToken.issue(self.user)
+        AuthToken.objects.filter(pk=expired.pk).update(expires_at=timezone.now() - timedelta(days=1))
+
+        call_command('purge_expired_tokens', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(list(AuthToken.objects.values_list('pk', flat=True)), [active.pk])
@@ -0,0 +1,143 @@
+import json
+import secrets
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.authentication.models import FCMToken, User, UserProfile
+
+
+@override_settings(
+    BULK_REGISTER_MAX_USERS=10,
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
+class BulkRegisterUsersApiTest(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = '/api/register/users/bulk'
+        self.admin = User.objects.create_user(
+            username='admin',
+            email='admin@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='0000000001',
+            is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+
+    def _row(self, index, **overrides):
+        row = {
+            'dni': f'17000000{index:02d}',
+            'firstName': 'Vecino',
+            'lastName': f'Número {index}',
+            'email': f'vecino{index}@example.com',
+            'username': f'vecino{index}',
+            'password': secrets.token_urlsafe(16),
+            'displayName': f'Vecino {index}',
+            'latitude': -0.18,
+            'longitude': -78.46,
+        }
+        row.update(overrides)
+        return row
+
+    def test_creates_users_profiles_and_tokens(self):
+        rows = [self._row(1, fcmToken='fcm-1', deviceId='device-1'), self._row(2)]
+
+        response = self.client.post(self.url, {'users': rows}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['errors'], [])
+        user = User.objects.get(username='vecino1')
+        self.assertTrue(user.check_password(rows[0]['password']))
+        self.assertEqual(UserProfile.objects.get(user=user).location.y, -0.18)
+        self.assertTrue(FCMToken.objects.filter(user=user, token='fcm-1', is_active=True).exists())
+
+    def test_uniqueness_is_checked_with_a_single_query(self):
+        rows = [self._row(index) for index in range(5)]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, rows, format='json')
+
+        user_selects = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "authentication_user"' in query['sql']
+        ]
+        inserts = [query for query in queries.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(response.data['created'], 5)
+        self.assertEqual(len(user_selects), 1)
+        self.assertEqual(len(inserts), 2)
+
+    def test_reports_rows_that_already_exist(self):
+        rows = [self._row(1, email='admin@example.com'), self._row(2)]
+
+        response = self.client.post(self.url, {'users': rows}, format='json')
+
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['errors'][0]['index'], 0)
+        self.assertIn('email', response.data['errors'][0]['errors'])
+
+    def test_reports_duplicates_inside_the_request(self):
+        rows = [self._row(1), self._row(2, dni='1700000001')]
+
+        response = self.client.post(self.url, {'users': rows}, format='json')
+
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['errors'][0]['index'], 1)
+        self.assertIn('dni', response.data['errors'][0]['errors'])
+
+    def test_reports_repeated_fcm_tokens_inside_the_request(self):
+        rows = [self._row(1, fcmToken='fcm-1'), self._row(2, fcmToken='fcm-1')]
+
+        response = self.client.post(self.url, {'users': rows}, format='json')
+
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['errors'][0]['index'], 1)
+        self.assertIn('fcmToken', response.data['errors'][0]['errors'])
+        self.assertEqual(FCMToken.objects.get(token='fcm-1').user.username, 'vecino1')
+
+    def test_retires_previous_tokens_of_the_same_device(self):
+        previous = FCMToken.objects.create(user=self.admin, token='old-fcm', device_id='device-1')
+
+        self.client.post(self.url, {'users': [self._row(1, fcmToken='fcm-1', deviceId='device-1')]}, format='json')
+
+        previous.refresh_from_db()
+        self.assertFalse(previous.is_active)
+        self.assertTrue(FCMToken.objects.get(token='fcm-1').is_active)
+
+    def test_invalid_rows_only_returns_400(self):
+        response = self.client.post(self.url, {'users': [{'username': 'incompleto'}]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['created'], 0)
+
+    def test_rejects_batches_over_the_limit(self):
+        rows = [self._row(index) for index in range(11)]
+
+        response = self.client.post(self.url, {'users': rows}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username__startswith='vecino').exists())
+
+    def test_requires_staff(self):
+        self.admin.is_staff = False
+        self.admin.save()
+
+        response = self.client.post(self.url, {'users': [self._row(1)]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_command_imports_file_in_batches(self):
+        rows = [self._row(index) for index in range(12)]
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as source:
+            json.dump(rows, source)
+
+        call_command('bulk_register_users', source.name, stdout=StringIO(), stderr=StringIO())
+
+        self.assertEqual(User.objects.filter(username__startswith='vecino').count(), 12)
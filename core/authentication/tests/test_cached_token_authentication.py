@@ -0,0 +1,115 @@
+import secrets
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+
+from core.authentication.api.auth.authentication import CachedTokenAuthentication, TokenAuthCache
+from core.authentication.models import AuthToken, User
+
+
+@override_settings(
+    AUTH_TOKEN_TTL_DAYS=30,
+    TOKEN_AUTH_CACHE_TTL_SECONDS=30,
+    TOKEN_AUTH_CACHE_MAX_ENTRIES=2,
+    TOKEN_AUTH_SHARED_CACHE='default',
+)
+@patch('core.authentication.api.auth.authentication.is_shared_cache', return_value=True)
+class CachedTokenAuthenticationTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        TokenAuthCache.clear()
+        self.user = User.objects.create_user(
+            username='tokenuser',
+            email='token@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='2222222222'
+        )
+        self.token, self.key = AuthToken.issue(self.user)
+        self.authentication = CachedTokenAuthentication()
+
+    def test_second_request_does_not_query_database(self, _shared):
+        self.authentication.authenticate_credentials(self.key)
+
+        with self.assertNumQueries(0):
+            user, token = self.authentication.authenticate_credentials(self.key)
+
+        self.assertEqual(user.id, self.user.id)
+        self.assertEqual(token.pk, self.token.pk)
+
+    def test_only_hash_is_stored(self, _shared):
+        self.assertEqual(self.token.pk, AuthToken.hash_key(self.key))
+        self.assertFalse(AuthToken.objects.filter(pk=self.key).exists())
+
+    def test_deleted_token_is_rejected(self, _shared):
+        self.authentication.authenticate_credentials(self.key)
+
+        self.token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials(self.key)
+
+    def test_expired_token_is_rejected(self, _shared):
+        AuthToken.objects.filter(pk=self.token.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials(self.key)
+
+    def test_inactive_user_is_rejected(self, _shared):
+        self.authentication.authenticate_credentials(self.key)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials(self.key)
+
+    def test_cache_is_bounded(self, _shared):
+        for index in range(3):
+            user = User.objects.create_user(
+                username=f'extra{index}',
+                email=f'extra{index}@example.com',
+                password=secrets.token_urlsafe(32),
+                dni=f'333333333{index}'
+            )
+            _, key = AuthToken.issue(user)
+            self.authentication.authenticate_credentials(key)
+
+        self.assertEqual(len(TokenAuthCache._entries), 2)
+
+    def test_cached_user_is_not_shared_between_requests(self, _shared):
+        self.authentication.authenticate_credentials(self.key)
+        user, _ = self.authentication.authenticate_credentials(self.key)
+        user.first_name = 'Cambiado'
+
+        cached_user, _ = self.authentication.authenticate_credentials(self.key)
+
+        self.assertNotEqual(cached_user.first_name, 'Cambiado')
+
+
+@override_settings(AUTH_TOKEN_TTL_DAYS=30, TOKEN_AUTH_SHARED_CACHE='default')
+class ProcessLocalTokenAuthenticationTest(TestCase):
+
+    def setUp(self):
+        TokenAuthCache.clear()
+        self.user = User.objects.create_user(
+            username='localtoken',
+            email='localtoken@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='2222222223'
+        )
+        _, self.key = AuthToken.issue(self.user)
+        self.authentication = CachedTokenAuthentication()
+
+    def test_deactivation_applies_immediately_without_shared_cache(self):
+        """Sin caché compartida la invalidación no llega a otros workers, así que el token se consulta siempre"""
+        self.authentication.authenticate_credentials(self.key)
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials(self.key)
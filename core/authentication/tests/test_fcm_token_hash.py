@@ -0,0 +1,63 @@
+import secrets
+
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from core.authentication.api.register.feature.FCM_token import RegisterFCMTokenFeature
+from core.authentication.models import FCMToken, User
+
+
+class FCMTokenHashTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='fcm-owner',
+            email='fcm-owner@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='7777777777'
+        )
+        self.other_user = User.objects.create_user(
+            username='fcm-other',
+            email='fcm-other@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='8888888888'
+        )
+
+    def test_save_sets_token_hash(self):
+        token = FCMToken.objects.create(user=self.user, token='TOKEN-A')
+
+        self.assertEqual(token.token_hash, FCMToken.hash_token('TOKEN-A'))
+
+    def test_update_fields_with_token_refreshes_hash(self):
+        token = FCMToken.objects.create(user=self.user, token='TOKEN-A')
+        token.token = 'TOKEN-B'
+        token.save(update_fields=['token'])
+
+        token.refresh_from_db()
+        self.assertEqual(token.token_hash, FCMToken.hash_token('TOKEN-B'))
+
+    def test_duplicated_token_is_rejected(self):
+        FCMToken.objects.create(user=self.user, token='TOKEN-A')
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            FCMToken.objects.create(user=self.other_user, token='TOKEN-A')
+
+    def test_register_moves_existing_token_to_new_user(self):
+        feature = RegisterFCMTokenFeature()
+        feature.register_or_update_token(self.user, {'token': 'TOKEN-A', 'deviceId': 'device-1'})
+        feature.register_or_update_token(self.other_user, {'token': 'TOKEN-A', 'deviceId': 'device-2'})
+
+        token = FCMToken.objects.get()
+        self.assertEqual(token.user, self.other_user)
+        self.assertEqual(token.device_id, 'device-2')
+
+    def test_deactivate_old_tokens_keeps_current_token(self):
+        FCMToken.objects.create(user=self.user, token='OLD')
+        FCMToken.objects.create(user=self.user, token='CURRENT')
+
+        RegisterFCMTokenFeature().deactivate_old_tokens(self.user, 'CURRENT')
+
+        self.assertEqual(
+            list(FCMToken.objects.filter(user=self.user, is_active=True).values_list('token', flat=True)),
+            ['CURRENT']
+        )
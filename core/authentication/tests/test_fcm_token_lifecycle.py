@@ -0,0 +1,75 @@
+import secrets
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.authentication.api.register.feature.FCM_token import RegisterFCMTokenFeature
+from core.authentication.models import FCMToken, User
+from core.authentication.services.fcm_token_lifecycle import FCMTokenLifecycleManager
+
+
+class FCMTokenLifecycleManagerTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='lifecycle',
+            email='lifecycle@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='9999999999'
+        )
+        self.manager = FCMTokenLifecycleManager(stale_days=30)
+
+    def _age(self, token, days):
+        moment = timezone.now() - timedelta(days=days)
+        FCMToken.objects.filter(pk=token.pk).update(updated_at=moment, last_used_at=moment)
+
+    def test_register_sets_check_in_and_retires_previous_device_token(self):
+        feature = RegisterFCMTokenFeature()
+        feature.register_or_update_token(self.user, {'token': 'OLD', 'deviceId': 'pixel'})
+        other_device = feature.register_or_update_token(self.user, {'token': 'TABLET', 'deviceId': 'tablet'})
+        current = feature.register_or_update_token(self.user, {'token': 'NEW', 'deviceId': 'pixel'})
+
+        self.assertIsNotNone(current.last_seen_at)
+        self.assertFalse(FCMToken.objects.get(token_hash=FCMToken.hash_token('OLD')).is_active)
+        other_device.refresh_from_db()
+        self.assertTrue(other_device.is_active)
+
+    def test_record_deliveries_and_deactivate(self):
+        delivered = FCMToken.objects.create(user=self.user, token='OK')
+        invalid = FCMToken.objects.create(user=self.user, token='BAD')
+
+        self.manager.record_deliveries(['OK'])
+        self.manager.deactivate(['BAD'])
+
+        delivered.refresh_from_db()
+        invalid.refresh_from_db()
+        self.assertIsNotNone(delivered.last_delivery_at)
+        self.assertEqual(delivered.last_used_at, delivered.last_delivery_at)
+        self.assertFalse(invalid.is_active)
+
+    def test_prune_removes_only_stale_tokens(self):
+        stale = FCMToken.objects.create(user=self.user, token='STALE')
+        recently_seen = FCMToken.objects.create(user=self.user, token='SEEN')
+        recently_delivered = FCMToken.objects.create(user=self.user, token='DELIVERED')
+        for token in (stale, recently_seen, recently_delivered):
+            self._age(token, 45)
+        RegisterFCMTokenFeature().register_or_update_token(self.user, {'token': 'SEEN'})
+        self.manager.record_deliveries(['DELIVERED'])
+
+        deleted = self.manager.prune(batch_size=1)
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(
+            set(FCMToken.objects.values_list('token', flat=True)),
+            {'SEEN', 'DELIVERED'}
+        )
+
+    def test_prune_command(self):
+        stale = FCMToken.objects.create(user=self.user, token='STALE')
+        self._age(stale, 90)
+
+        call_command('prune_fcm_tokens', days=60)
+
+        self.assertFalse(FCMToken.objects.exists())
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.authentication.services.group_permissions import GroupPermissionCache
+
+
+@patch('core.authentication.services.group_permissions.is_shared_cache', return_value=True)
+class GroupPermissionCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.group = Group.objects.create(name='Gestores')
+        content_type = ContentType.objects.get_for_model(Group)
+        self.view_permission = Permission.objects.get(codename='view_group', content_type=content_type)
+        self.add_permission = Permission.objects.get(codename='add_group', content_type=content_type)
+        self.group.permissions.add(self.view_permission)
+
+    def test_codenames_are_served_from_cache(self, _shared):
+        permission_cache = GroupPermissionCache()
+        permission_cache.get_codenames(self.group.id)
+
+        with self.assertNumQueries(0):
+            codenames = permission_cache.get_codenames(self.group.id)
+
+        self.assertEqual(codenames, frozenset({'view_group'}))
+
+    def test_adding_permission_invalidates_group(self, _shared):
+        GroupPermissionCache().get_codenames(self.group.id)
+
+        self.group.permissions.add(self.add_permission)
+
+        self.assertEqual(GroupPermissionCache().get_codenames(self.group.id), frozenset({'view_group', 'add_group'}))
+
+    def test_removing_permission_from_reverse_side_invalidates_group(self, _shared):
+        GroupPermissionCache().get_codenames(self.group.id)
+
+        self.view_permission.group_set.remove(self.group)
+
+        self.assertEqual(GroupPermissionCache().get_codenames(self.group.id), frozenset())
+
+    def test_clearing_from_reverse_side_invalidates_all_groups(self, _shared):
+        GroupPermissionCache().get_codenames(self.group.id)
+
+        self.view_permission.group_set.clear()
+
+        self.assertEqual(GroupPermissionCache().get_codenames(self.group.id), frozenset())
+
+    def test_deleted_group_returns_none(self, _shared):
+        group_id = self.group.id
+        GroupPermissionCache().get_codenames(group_id)
+
+        self.group.delete()
+
+        self.assertIsNone(GroupPermissionCache().get_codenames(group_id))
+
+
+class GroupPermissionProcessCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.group = Group.objects.create(name='Gestores')
+        self.permission = Permission.objects.get(
+            codename='view_group', content_type=ContentType.objects.get_for_model(Group)
+        )
+        self.group.permissions.add(self.permission)
+
+    def test_revocation_applies_immediately_without_shared_cache(self):
+        """Con caché por proceso la invalidación no llega a otros workers, así que se consulta siempre"""
+        GroupPermissionCache().get_codenames(self.group.id)
+
+        Group.permissions.through.objects.filter(group_id=self.group.id).delete()
+
+        self.assertEqual(GroupPermissionCache().get_codenames(self.group.id), frozenset())
@@ -0,0 +1,80 @@
+import secrets
+
+from django.contrib.gis.geos import Point
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.authentication.models import User, UserProfile
+from core.authentication.services.location_heartbeat import LocationHeartbeatBuffer, location_heartbeat_buffer
+
+
+@override_settings(
+    USER_LOCATION_PING_MIN_DISTANCE_METERS=50,
+    USER_LOCATION_HEARTBEAT_FLUSH_SECONDS=3600,
+    USER_LOCATION_HEARTBEAT_MAX_BUFFERED=100
+)
+class LocationHeartbeatBufferTest(TestCase):
+
+    def setUp(self):
+        self.buffer = LocationHeartbeatBuffer()
+        self.users = [
+            User.objects.create_user(
+                username=f'runner{index}',
+                email=f'runner{index}@example.com',
+                password=secrets.token_urlsafe(32),
+                dni=f'55555555{index:02d}'
+            )
+            for index in range(3)
+        ]
+        self.profiles = [
+            UserProfile.objects.create(user=user, location=Point(-78.47, -0.18, srid=4326))
+            for user in self.users
+        ]
+
+    def tearDown(self):
+        self.buffer.flush()
+
+    def test_pings_from_same_user_are_coalesced(self):
+        self.buffer.record(self.users[0].id, -0.19, -78.47)
+        self.buffer.record(self.users[0].id, -0.20, -78.47)
+
+        self.assertEqual(len(self.buffer), 1)
+
+    def test_flush_updates_moved_users_in_one_query(self):
+        self.buffer.record(self.users[0].id, -0.20, -78.47)
+        self.buffer.record(self.users[1].id, -0.21, -78.47)
+        self.buffer.record(self.users[2].id, -0.1801, -78.47)
+
+        with self.assertNumQueries(1):
+            updated = self.buffer.flush()
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(len(self.buffer), 0)
+        latitudes = dict(UserProfile.objects.values_list('user_id', 'latitude'))
+        self.assertAlmostEqual(latitudes[self.users[0].id], -0.20)
+        self.assertAlmostEqual(latitudes[self.users[1].id], -0.21)
+        self.assertAlmostEqual(latitudes[self.users[2].id], -0.18)
+
+    @override_settings(USER_LOCATION_HEARTBEAT_MAX_BUFFERED=2)
+    def test_buffer_flushes_when_full(self):
+        self.buffer.record(self.users[0].id, -0.20, -78.47)
+        self.buffer.record(self.users[1].id, -0.21, -78.47)
+
+        self.assertEqual(len(self.buffer), 0)
+        self.assertAlmostEqual(UserProfile.objects.get(user=self.users[1]).latitude, -0.21)
+
+    def test_heartbeat_endpoint_buffers_ping(self):
+        client = APIClient()
+        client.force_authenticate(self.users[0])
+
+        response = client.post(
+            reverse('authentication:api_profile_location_heartbeat'),
+            {'latitude': -0.20, 'longitude': -78.47},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(location_heartbeat_buffer.flush(), 1)
+        self.assertAlmostEqual(UserProfile.objects.get(user=self.users[0]).latitude, -0.20)
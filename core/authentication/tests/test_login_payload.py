@@ -0,0 +1,57 @@
+import secrets
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.authentication.api.auth.features.login_payload import LoginPayloadFeature
+from core.authentication.models import User, UserProfile
+
+
+class LoginPayloadFeatureTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='payload',
+            email='payload@example.com',
+            password=secrets.token_urlsafe(32),
+            first_name='Ana',
+            last_name='Pérez',
+            dni='6666666666'
+        )
+        self.profile = UserProfile.objects.create(user=self.user, alias_name='anita')
+
+    def test_payload_matches_user_json(self):
+        payload = LoginPayloadFeature(self.user.id).get_payload()
+
+        self.assertEqual(payload, self.user.to_json_api())
+
+    def test_payload_is_built_with_one_query_and_then_cached(self):
+        with self.assertNumQueries(1):
+            LoginPayloadFeature(self.user.id).get_payload()
+
+        with self.assertNumQueries(0):
+            payload = LoginPayloadFeature(self.user.id).get_payload()
+
+        self.assertEqual(payload['alias_name'], 'anita')
+
+    def test_profile_change_refreshes_payload(self):
+        LoginPayloadFeature(self.user.id).get_payload()
+
+        self.profile.alias_name = 'ana'
+        self.profile.save()
+
+        self.assertEqual(LoginPayloadFeature(self.user.id).get_payload()['alias_name'], 'ana')
+
+    def test_user_change_refreshes_payload(self):
+        LoginPayloadFeature(self.user.id).get_payload()
+
+        self.user.first_name = 'Ana María'
+        self.user.save()
+
+        self.assertEqual(LoginPayloadFeature(self.user.id).get_payload()['first_name'], 'Ana María')
+
+    def test_user_without_profile(self):
+        self.profile.delete()
+
+        self.assertIsNone(LoginPayloadFeature(self.user.id).get_payload()['alias_name'])
@@ -0,0 +1,44 @@
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase, override_settings
+
+from core.authentication.models import User
+
+
+@override_settings(ARGON2_TIME_COST=1, ARGON2_MEMORY_COST_KIB=1024, ARGON2_PARALLELISM=1)
+class TunedArgon2PasswordHasherTest(TestCase):
+
+    def setUp(self):
+        self.password = 'Contraseña-segura-123'
+        self.user = User.objects.create_user(
+            username='hasher',
+            email='hasher@example.com',
+            dni='1212121212'
+        )
+
+    def test_new_passwords_use_argon2(self):
+        self.user.set_password(self.password)
+
+        self.assertTrue(self.user.password.startswith('argon2$argon2id$'))
+        self.assertIn('m=1024,t=1,p=1', self.user.password)
+
+    def test_pbkdf2_password_is_upgraded_on_login(self):
+        """Un hash PBKDF2 existente se reemplaza por Argon2 al iniciar sesión"""
+        self.user.password = make_password(self.password, hasher='pbkdf2_sha256')
+        self.user.save()
+
+        user = authenticate(username='hasher', password=self.password)
+
+        self.assertIsNotNone(user)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('argon2$'))
+
+    def test_changed_parameters_trigger_rehash(self):
+        self.user.set_password(self.password)
+        self.user.save()
+
+        with self.settings(ARGON2_TIME_COST=2):
+            authenticate(username='hasher', password=self.password)
+
+        self.user.refresh_from_db()
+        self.assertIn('t=2', self.user.password)
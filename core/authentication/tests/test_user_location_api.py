@@ -0,0 +1,56 @@
+import secrets
+
+from django.contrib.gis.geos import Point
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.authentication.models import User, UserProfile
+
+
+@override_settings(USER_LOCATION_PING_MIN_DISTANCE_METERS=50)
+class UserLocationApiTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='walker',
+            email='walker@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='1212121212'
+        )
+        self.client.force_authenticate(self.user)
+        self.location_url = reverse('authentication:api_profile_location')
+        self.ping_url = reverse('authentication:api_profile_location_ping')
+
+    def test_put_creates_profile_and_derives_coordinates(self):
+        response = self.client.put(self.location_url, {'latitude': -0.18, 'longitude': -78.47}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile = UserProfile.objects.get(user=self.user)
+        self.assertAlmostEqual(profile.latitude, -0.18)
+        self.assertAlmostEqual(profile.longitude, -78.47)
+
+    def test_put_rejects_out_of_range_coordinates(self):
+        response = self.client.put(self.location_url, {'latitude': 120, 'longitude': -78.47}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ping_only_writes_when_user_moved_past_threshold(self):
+        UserProfile.objects.create(user=self.user, location=Point(-78.47, -0.18, srid=4326))
+
+        nearby = self.client.post(self.ping_url, {'latitude': -0.1801, 'longitude': -78.47}, format='json')
+        self.assertEqual(nearby.data, {'updated': False})
+        self.assertAlmostEqual(UserProfile.objects.get(user=self.user).latitude, -0.18)
+
+        moved = self.client.post(self.ping_url, {'latitude': -0.19, 'longitude': -78.47}, format='json')
+        self.assertEqual(moved.data, {'updated': True})
+        self.assertAlmostEqual(UserProfile.objects.get(user=self.user).latitude, -0.19)
+
+    def test_ping_sets_first_location(self):
+        UserProfile.objects.create(user=self.user)
+
+        response = self.client.post(self.ping_url, {'latitude': -0.18, 'longitude': -78.47}, format='json')
+
+        self.assertEqual(response.data, {'updated': True})
+        self.assertEqual(UserProfile.objects.get(user=self.user).location.y, -0.18)
@@ -1,7 +1,8 @@
 from django.contrib import admin
 
-from core.community.models import Community, CommunityMembership
+from core.community.models import Community, CommunityMembership, CommunityMembershipAudit
 
 # Register your models here.
 admin.site.register(Community)
 admin.site.register(CommunityMembership)
+admin.site.register(CommunityMembershipAudit)
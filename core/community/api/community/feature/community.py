@@ -1,7 +1,12 @@
-from django.contrib.gis.geos import Point
+from django.conf import settings
+from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.geos import MultiPolygon, Point
 from rest_framework import status
 
+from core.authentication.api.profile.feature.location import UserLocationFeature
 from core.community.models import CommunityMembership, Community
+from core.community.services.boundary_index import community_boundary_index
+from core.community.services.micro_communities import meters_to_degrees, span_meters
 
 
 class ValidateOrCreateCommunityFeature:
@@ -29,20 +34,40 @@ class ValidateOrCreateCommunityFeature:
         return None
 
     def find_community(self):
-        community = Community.objects.filter(
-            is_active=True,
-            boundary_area__contains=self.point
-        ).first()
-        return community
+        return community_boundary_index.find(self.point)
 
     def create_community(self):
-        buffer_polygon = self.point.buffer(0.0001)
+        buffer_polygon = self.point.buffer(meters_to_degrees(settings.COMMUNITY_AUTO_RADIUS_METERS))
+        community = self.expand_nearby_community(buffer_polygon)
+        if community is not None:
+            return community
+
         community = Community.objects.create(
             boundary_area=buffer_polygon,
-            is_active=True
+            is_active=True,
+            is_auto_created=True
         )
         return community
 
+    def expand_nearby_community(self, buffer_polygon):
+        community = Community.objects.filter(
+            is_active=True,
+            is_auto_created=True,
+            boundary_area__dwithin=(self.point, meters_to_degrees(settings.COMMUNITY_AUTO_JOIN_DISTANCE_METERS))
+        ).annotate(
+            distance=Distance('boundary_area', self.point)
+        ).order_by('distance').first()
+        if community is None:
+            return None
+
+        boundary = MultiPolygon(community.boundary_area, buffer_polygon, srid=4326).convex_hull
+        if span_meters(boundary) > settings.COMMUNITY_AUTO_MAX_SPAN_METERS:
+            return None
+
+        community.boundary_area = boundary
+        community.save(update_fields=['boundary_area', 'updated_at'])
+        return community
+
     def assign_user(self, community):
         membership, created = CommunityMembership.objects.get_or_create(
             user=self.user,
@@ -53,12 +78,7 @@ class ValidateOrCreateCommunityFeature:
         return membership, created
 
     def update_data_location_user(self):
-        from core.authentication.models import UserProfile
-        profile, created = UserProfile.objects.get_or_create(user=self.user)
-        profile.latitude = self.latitude
-        profile.longitude = self.longitude
-        profile.location = self.point
-        profile.save()
+        UserLocationFeature(self.user).set_location(self.latitude, self.longitude)
 
     def execute(self):
         validated = self.validate_user_membership()
@@ -1,5 +1,7 @@
 from django import forms
-from core.community.models import CommunityMembership
+from django.contrib.postgres.forms import SimpleArrayField
+
+from core.community.models import CommunityMembership, CommunityMembershipAudit
 
 
 class SearchCommunityForm(forms.Form):
@@ -52,3 +54,23 @@ class SearchMemberForm(forms.Form):
         super().__init__(*args, **kwargs)
 
 
+class BulkMemberActionForm(forms.Form):
+    action = forms.ChoiceField(choices=CommunityMembershipAudit.ACTION_CHOICES, label='Acción')
+    new_role = forms.ChoiceField(
+        required=False,
+        label='Nuevo rol',
+        choices=[('', '---------')] + list(CommunityMembership.ROLE_CHOICES),
+    )
+    membership_ids = SimpleArrayField(forms.IntegerField(min_value=1), required=False, label='Membresías')
+    role = forms.ChoiceField(
+        required=False,
+        label='Rol',
+        choices=[('', 'Todos los roles')] + list(CommunityMembership.ROLE_CHOICES),
+    )
+    is_verified = forms.NullBooleanField(required=False, label='Estado de verificación')
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get('action') == 'set_role' and not cleaned_data.get('new_role'):
+            self.add_error('new_role', 'Debes indicar el nuevo rol.')
+        return cleaned_data
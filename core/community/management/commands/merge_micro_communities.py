@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from core.community.services.micro_communities import MicroCommunityMerger
+
+
+class Command(BaseCommand):
+    help = 'Fusiona las comunidades creadas automáticamente que están próximas entre sí'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--distance-meters', type=int, default=None)
+        parser.add_argument('--max-span-meters', type=int, default=None)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        merger = MicroCommunityMerger(
+            distance_meters=options['distance_meters'],
+            max_span_meters=options['max_span_meters']
+        )
+        totals = merger.merge_all(dry_run=options['dry_run'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Grupos: {totals['clusters']}, comunidades fusionadas: {totals['merged']}, "
+            f"membresías movidas: {totals['memberships']}"
+        ))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:34
+
+from django.db import migrations, models
+
+
+def retire_moderator_role(apps, schema_editor):
+    CommunityMembership = apps.get_model('community', 'CommunityMembership')
+    CommunityMembership.objects.filter(role='moderator').update(role='member')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='communitymembership',
+            options={'permissions': (('can_manage_community', 'Puede gestionar la comunidad'),), 'verbose_name': 'Membresía de comunidad', 'verbose_name_plural': 'Membresías de comunidades'},
+        ),
+        migrations.AlterField(
+            model_name='communitymembership',
+            name='role',
+            field=models.CharField(choices=[('member', 'Miembro'), ('admin', 'Administrador')], default='member', max_length=50, verbose_name='Rol'),
+        ),
+        migrations.RunPython(retire_moderator_role, migrations.RunPython.noop),
+    ]
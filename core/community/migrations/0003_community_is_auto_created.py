@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+def mark_auto_created_communities(apps, schema_editor):
+    Community = apps.get_model('community', 'Community')
+    Community.objects.filter(name='').update(is_auto_created=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0002_communitymembership_role_permissions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='community',
+            name='is_auto_created',
+            field=models.BooleanField(default=False, verbose_name='Creada automáticamente'),
+        ),
+        migrations.RunPython(mark_auto_created_communities, migrations.RunPython.noop),
+    ]
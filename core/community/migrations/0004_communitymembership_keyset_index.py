@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0003_community_is_auto_created'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='communitymembership',
+            index=models.Index(fields=['community', '-joined_at', '-id'], name='c_membership_joined_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0004_communitymembership_keyset_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommunityMembershipAudit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('verify', 'Verificación'), ('unverify', 'Retiro de verificación'), ('set_role', 'Cambio de rol')], max_length=20, verbose_name='Acción')),
+                ('previous_value', models.CharField(blank=True, max_length=50, verbose_name='Valor anterior')),
+                ('new_value', models.CharField(blank=True, max_length=50, verbose_name='Valor nuevo')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha')),
+                ('actor', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='community_membership_audits', to=settings.AUTH_USER_MODEL, verbose_name='Realizado por')),
+                ('community', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='membership_audits', to='community.community', verbose_name='Comunidad')),
+                ('membership', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audits', to='community.communitymembership', verbose_name='Membresía')),
+            ],
+            options={
+                'verbose_name': 'Auditoría de membresía',
+                'verbose_name_plural': 'Auditorías de membresías',
+                'db_table': 'community_membership_audit',
+                'indexes': [models.Index(fields=['community', '-created_at'], name='c_membership_audit_idx')],
+            },
+        ),
+    ]
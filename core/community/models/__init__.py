@@ -1,2 +1,3 @@
 from .community import *
 from .community_membership import *
+from .community_membership_audit import *
@@ -8,6 +8,7 @@ class Community(models.Model):
     boundary_area = gis_models.PolygonField(srid=4326, blank=True, null=True, verbose_name="Área límite")
     postal_code = models.CharField(max_length=10, blank=True, verbose_name="Código postal")
     is_active = models.BooleanField(default=True, verbose_name="Está activa")
+    is_auto_created = models.BooleanField(default=False, verbose_name="Creada automáticamente")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creado en")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Actualizado en")
 
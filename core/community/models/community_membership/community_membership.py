@@ -36,6 +36,12 @@ class CommunityMembership(models.Model):
                 name="unique_user_community_membership",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["community", "-joined_at", "-id"],
+                name="c_membership_joined_idx",
+            ),
+        ]
         permissions = (
             ("can_manage_community", "Puede gestionar la comunidad"),
         )
@@ -0,0 +1 @@
+from .community_membership_audit import *
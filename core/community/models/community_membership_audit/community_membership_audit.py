@@ -0,0 +1,49 @@
+from django.db import models
+
+from core.authentication.models import User
+from core.community.models.community.community import Community
+from core.community.models.community_membership.community_membership import CommunityMembership
+
+
+class CommunityMembershipAudit(models.Model):
+    ACTION_CHOICES = [
+        ("verify", "Verificación"),
+        ("unverify", "Retiro de verificación"),
+        ("set_role", "Cambio de rol"),
+    ]
+
+    membership = models.ForeignKey(
+        CommunityMembership,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="audits",
+        verbose_name="Membresía",
+    )
+    community = models.ForeignKey(
+        Community,
+        on_delete=models.CASCADE,
+        related_name="membership_audits",
+        verbose_name="Comunidad",
+    )
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="community_membership_audits",
+        verbose_name="Realizado por",
+    )
+    action = models.CharField(max_length=20, choices=ACTION_CHOICES, verbose_name="Acción")
+    previous_value = models.CharField(max_length=50, blank=True, verbose_name="Valor anterior")
+    new_value = models.CharField(max_length=50, blank=True, verbose_name="Valor nuevo")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha")
+
+    class Meta:
+        db_table = "community_membership_audit"
+        verbose_name = "Auditoría de membresía"
+        verbose_name_plural = "Auditorías de membresías"
+        indexes = [
+            models.Index(fields=["community", "-created_at"], name="c_membership_audit_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.membership_id} {self.action}: {self.previous_value} -> {self.new_value}"
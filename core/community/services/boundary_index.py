@@ -0,0 +1,72 @@
+import logging
+import threading
+import time
+
+import shapely
+from django.conf import settings
+from django.core.cache import cache
+
+from core.community.models import Community
+
+logger = logging.getLogger(__name__)
+
+
+class CommunityBoundaryIndex:
+    VERSION_KEY = 'community_boundary_index_version'
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl or settings.COMMUNITY_BOUNDARY_INDEX_TTL_SECONDS
+        self._lock = threading.Lock()
+        self._state = (None, 0.0, None, ())
+
+    def _current_version(self):
+        version = cache.get(self.VERSION_KEY)
+        if version is None:
+            version = 1
+            cache.add(self.VERSION_KEY, version, None)
+        return version
+
+    def _is_fresh(self, state, version):
+        built_version, built_at, _, _ = state
+        return built_version == version and time.monotonic() - built_at < self.ttl
+
+    def _ensure_fresh(self):
+        version = self._current_version()
+        state = self._state
+        if self._is_fresh(state, version):
+            return state
+        with self._lock:
+            state = self._state
+            if self._is_fresh(state, version):
+                return state
+            state = self._build(version)
+            self._state = state
+            return state
+
+    def _build(self, version):
+        communities = tuple(
+            Community.objects.filter(is_active=True, boundary_area__isnull=False).order_by('id')
+        )
+        boundaries = shapely.from_wkb([bytes(community.boundary_area.wkb) for community in communities])
+        shapely.prepare(boundaries)
+        tree = shapely.STRtree(boundaries)
+        logger.info(f"Índice de límites de comunidades construido con {len(communities)} comunidades")
+        return version, time.monotonic(), tree, communities
+
+    def find(self, point):
+        _, _, tree, communities = self._ensure_fresh()
+        if not communities:
+            return None
+        matches = tree.query(shapely.Point(point.x, point.y), predicate='within')
+        if not len(matches):
+            return None
+        return communities[int(matches.min())]
+
+    def invalidate(self):
+        try:
+            cache.incr(self.VERSION_KEY)
+        except ValueError:
+            cache.set(self.VERSION_KEY, 2, None)
+
+
+community_boundary_index = CommunityBoundaryIndex()
@@ -0,0 +1,90 @@
+import logging
+
+from django.db import transaction
+
+from core.community.models import CommunityMembership, CommunityMembershipAudit
+
+logger = logging.getLogger(__name__)
+
+ROLE_MANAGER = 'admin'
+AUDIT_BATCH_SIZE = 500
+
+
+class MemberBulkActionError(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+class MemberBulkActionService:
+
+    def __init__(self, community, actor):
+        self.community = community
+        self.actor = actor
+
+    def target_queryset(self, membership_ids=None, role=None, is_verified=None):
+        queryset = CommunityMembership.objects.filter(community_id=self.community.id)
+        if membership_ids:
+            queryset = queryset.filter(id__in=membership_ids)
+        if role:
+            queryset = queryset.filter(role=role)
+        if is_verified is not None:
+            queryset = queryset.filter(is_verified=is_verified)
+        return queryset
+
+    def _changes(self, action, new_role):
+        if action == 'verify':
+            return 'is_verified', True
+        if action == 'unverify':
+            return 'is_verified', False
+        return 'role', new_role
+
+    def apply(self, action, new_role=None, membership_ids=None, role=None, is_verified=None):
+        field, value = self._changes(action, new_role)
+        queryset = self.target_queryset(membership_ids, role, is_verified)
+
+        if field == 'role':
+            queryset = queryset.exclude(user_id=self.actor.id)
+            if value != ROLE_MANAGER and not membership_ids:
+                queryset = queryset.exclude(role=ROLE_MANAGER)
+
+        with transaction.atomic():
+            matched = queryset.count()
+            pending = list(
+                queryset.exclude(**{field: value}).select_for_update().values_list('id', field)
+            )
+            if not pending:
+                return {'matched': matched, 'updated': 0}
+
+            if field == 'role' and value != ROLE_MANAGER:
+                self._ensure_admin_remains([membership_id for membership_id, _ in pending])
+
+            updated = CommunityMembership.objects.filter(
+                id__in=[membership_id for membership_id, _ in pending]
+            ).update(**{field: value})
+
+            CommunityMembershipAudit.objects.bulk_create([
+                CommunityMembershipAudit(
+                    membership_id=membership_id,
+                    community_id=self.community.id,
+                    actor_id=self.actor.id,
+                    action=action,
+                    previous_value=str(previous),
+                    new_value=str(value),
+                )
+                for membership_id, previous in pending
+            ], batch_size=AUDIT_BATCH_SIZE)
+
+        logger.info(
+            f"Acción masiva '{action}' en comunidad {self.community.id} por usuario {self.actor.id}: "
+            f"{updated} de {matched} membresías actualizadas"
+        )
+        return {'matched': matched, 'updated': updated}
+
+    def _ensure_admin_remains(self, demoted_ids):
+        remaining = CommunityMembership.objects.select_for_update().filter(
+            community_id=self.community.id,
+            role=ROLE_MANAGER
+        ).exclude(id__in=demoted_ids)
+        if not remaining.exists():
+            raise MemberBulkActionError('La comunidad debe conservar al menos un administrador.')
@@ -0,0 +1,21 @@
+from core.community.models import CommunityMembership
+
+REQUEST_ATTRIBUTE = '_community_membership'
+
+
+def get_request_membership(request):
+    if not hasattr(request, REQUEST_ATTRIBUTE):
+        membership = None
+        if request.user.is_authenticated:
+            membership = CommunityMembership.objects.filter(
+                user_id=request.user.id
+            ).select_related('community').order_by('id').first()
+        setattr(request, REQUEST_ATTRIBUTE, membership)
+    return getattr(request, REQUEST_ATTRIBUTE)
+
+
+class CommunityMembershipMixin(object):
+
+    @property
+    def membership(self):
+        return get_request_membership(self.request)
@@ -0,0 +1,119 @@
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.gis.geos import MultiPolygon
+from django.db import connection, transaction
+
+from core.community.models import Community, CommunityMembership
+from core.incident.models import Incident
+
+logger = logging.getLogger(__name__)
+
+METERS_PER_DEGREE = 111320
+
+
+def meters_to_degrees(meters):
+    return meters / METERS_PER_DEGREE
+
+
+def span_meters(geometry):
+    xmin, ymin, xmax, ymax = geometry.extent
+    return max(xmax - xmin, ymax - ymin) * METERS_PER_DEGREE
+
+
+class MicroCommunityMerger:
+
+    def __init__(self, distance_meters=None, max_span_meters=None):
+        self.distance_meters = distance_meters or settings.COMMUNITY_MERGE_DISTANCE_METERS
+        self.max_span_meters = max_span_meters or settings.COMMUNITY_AUTO_MAX_SPAN_METERS
+
+    def find_clusters(self):
+        sql = f"""
+            SELECT cluster_id, array_agg(id ORDER BY id)
+            FROM (
+                SELECT id, ST_ClusterDBSCAN(boundary_area, eps := %s, minpoints := 1) OVER () AS cluster_id
+                FROM {Community._meta.db_table}
+                WHERE is_active AND is_auto_created AND boundary_area IS NOT NULL
+            ) AS clustered
+            GROUP BY cluster_id
+            HAVING count(*) > 1
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [meters_to_degrees(self.distance_meters)])
+            return [ids for _, ids in cursor.fetchall()]
+
+    def merge_all(self, dry_run=False):
+        totals = {'clusters': 0, 'merged': 0, 'memberships': 0}
+        for community_ids in self.find_clusters():
+            if dry_run:
+                totals['clusters'] += 1
+                totals['merged'] += len(community_ids) - 1
+                continue
+            result = self.merge(community_ids)
+            if result is None:
+                continue
+            totals['clusters'] += 1
+            totals['merged'] += result['merged']
+            totals['memberships'] += result['memberships']
+
+        logger.info(f"Fusión de micro-comunidades: {totals}")
+        return totals
+
+    @transaction.atomic
+    def merge(self, community_ids):
+        communities = list(Community.objects.select_for_update().filter(id__in=community_ids).order_by('id'))
+        if len(communities) < 2:
+            return None
+
+        boundary = MultiPolygon(*[community.boundary_area for community in communities], srid=4326).convex_hull
+        if span_meters(boundary) > self.max_span_meters:
+            logger.info(f"Grupo de comunidades {community_ids} omitido: supera el tamaño máximo")
+            return None
+
+        member_counts = defaultdict(int)
+        memberships = list(CommunityMembership.objects.filter(community__in=communities))
+        for membership in memberships:
+            member_counts[membership.community_id] += 1
+        survivor = max(communities, key=lambda community: (member_counts[community.id], -community.id))
+        absorbed_ids = [community.id for community in communities if community.id != survivor.id]
+
+        moved = self._move_memberships(memberships, survivor.id)
+        Incident.objects.filter(community_id__in=absorbed_ids).update(community_id=survivor.id)
+        Community.objects.filter(id__in=absorbed_ids).delete()
+
+        survivor.boundary_area = boundary
+        survivor.save(update_fields=['boundary_area', 'updated_at'])
+        logger.info(f"Comunidades {absorbed_ids} fusionadas en {survivor.id}")
+        return {'survivor': survivor.id, 'merged': len(absorbed_ids), 'memberships': moved}
+
+    @staticmethod
+    def _move_memberships(memberships, survivor_id):
+        by_user = defaultdict(list)
+        for membership in memberships:
+            by_user[membership.user_id].append(membership)
+
+        to_keep = []
+        to_delete = []
+        for user_memberships in by_user.values():
+            user_memberships.sort(key=lambda membership: (
+                membership.community_id != survivor_id,
+                not membership.is_verified,
+                membership.role != 'admin',
+                membership.joined_at,
+            ))
+            kept, *duplicates = user_memberships
+            if kept.community_id == survivor_id and not duplicates:
+                continue
+            kept.community_id = survivor_id
+            kept.is_verified = any(membership.is_verified for membership in user_memberships)
+            if any(membership.role == 'admin' for membership in user_memberships):
+                kept.role = 'admin'
+            to_keep.append(kept)
+            to_delete.extend(membership.id for membership in duplicates)
+
+        if to_delete:
+            CommunityMembership.objects.filter(id__in=to_delete).delete()
+        if to_keep:
+            CommunityMembership.objects.bulk_update(to_keep, ['community', 'is_verified', 'role'])
+        return len(to_keep)
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.community.models import Community
+from core.community.services.boundary_index import community_boundary_index
+
+
+@receiver(post_save, sender=Community)
+@receiver(post_delete, sender=Community)
+def invalidate_community_boundary_index(sender, instance, **kwargs):
+    community_boundary_index.invalidate()
@@ -0,0 +1,64 @@
+from django.contrib.gis.geos import Point, Polygon
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.community.models import Community
+from core.community.services.boundary_index import CommunityBoundaryIndex
+
+
+def square(x, y, size=1.0):
+    return Polygon((
+        (x, y),
+        (x, y + size),
+        (x + size, y + size),
+        (x + size, y),
+        (x, y),
+    ), srid=4326)
+
+
+class CommunityBoundaryIndexTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.index = CommunityBoundaryIndex(ttl=3600)
+        self.north = Community.objects.create(name='Norte', boundary_area=square(0, 0))
+        self.south = Community.objects.create(name='Sur', boundary_area=square(0, -2))
+        Community.objects.create(name='Inactiva', boundary_area=square(5, 5), is_active=False)
+
+    def test_find_returns_containing_community(self):
+        self.assertEqual(self.index.find(Point(0.5, 0.5, srid=4326)), self.north)
+        self.assertEqual(self.index.find(Point(0.5, -1.5, srid=4326)), self.south)
+
+    def test_find_ignores_points_outside_and_inactive_communities(self):
+        self.assertIsNone(self.index.find(Point(3, 3, srid=4326)))
+        self.assertIsNone(self.index.find(Point(5.5, 5.5, srid=4326)))
+
+    def test_lookups_after_build_do_not_query_database(self):
+        self.index.find(Point(0.5, 0.5, srid=4326))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.index.find(Point(0.5, -1.5, srid=4326)), self.south)
+
+    def test_community_change_rebuilds_index(self):
+        self.assertIsNone(self.index.find(Point(3.5, 3.5, srid=4326)))
+
+        east = Community.objects.create(name='Este', boundary_area=square(3, 3))
+
+        self.assertEqual(self.index.find(Point(3.5, 3.5, srid=4326)), east)
+
+        self.north.is_active = False
+        self.north.save()
+
+        self.assertIsNone(self.index.find(Point(0.5, 0.5, srid=4326)))
+
+    def test_rebuild_publishes_a_new_snapshot_without_touching_the_old_one(self):
+        self.index.find(Point(0.5, 0.5, srid=4326))
+        _, _, old_tree, old_communities = self.index._state
+
+        Community.objects.create(name='Oeste', boundary_area=square(-2, 0))
+        self.index.find(Point(-1.5, 0.5, srid=4326))
+
+        self.assertEqual(len(old_tree), len(old_communities))
+        _, _, new_tree, new_communities = self.index._state
+        self.assertEqual(len(new_tree), len(new_communities))
+        self.assertEqual(len(new_communities), len(old_communities) + 1)
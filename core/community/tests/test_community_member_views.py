@@ -0,0 +1,127 @@
+import secrets
+
+from django.contrib.gis.geos import Polygon
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.authentication.models import User
+from core.community.models import Community, CommunityMembership
+from core.shared.pagination import KeysetPaginator
+
+
+class CommunityMemberViewsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.community = Community.objects.create(
+            name="Comunidad Miembros",
+            description="Desc",
+            boundary_area=Polygon(((0, 0), (0, 1), (1, 1), (1, 0), (0, 0)), srid=4326),
+            postal_code="0000",
+            is_active=True,
+        )
+        self.admin = self._create_user("admin", is_superuser=True)
+        self.admin_membership = CommunityMembership.objects.create(
+            user=self.admin, community=self.community, role="admin"
+        )
+        self.client.force_login(self.admin)
+
+    def _create_user(self, username, **extra):
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password=secrets.token_urlsafe(32),
+            dni=secrets.token_hex(8),
+            **extra,
+        )
+
+    def _add_members(self, count, offset=0):
+        for index in range(offset, offset + count):
+            CommunityMembership.objects.create(
+                user=self._create_user(f"member{index}"), community=self.community
+            )
+
+    def _count_list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('community:community_members'))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_member_list_query_count_does_not_grow_with_members(self):
+        self._add_members(3)
+        baseline = self._count_list_queries()
+
+        self._add_members(30, offset=3)
+        self.assertEqual(self._count_list_queries(), baseline)
+
+    def test_member_list_keyset_pages_cover_all_members(self):
+        self._add_members(25)
+        url = reverse('community:community_members')
+
+        first = self.client.get(url)
+        first_page = first.context['page_obj']
+        self.assertEqual(len(first.context['items']), 20)
+        self.assertTrue(first_page.has_next)
+        self.assertEqual(first.context['member_count'], 26)
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(url, {'cursor': first_page.next_cursor})
+        self.assertEqual(len(second.context['items']), 6)
+        self.assertFalse(second.context['page_obj'].has_next)
+        self.assertFalse(any('COUNT(' in query['sql'] for query in ctx.captured_queries))
+
+        seen = {item.id for item in first.context['items']} | {item.id for item in second.context['items']}
+        self.assertEqual(seen, set(CommunityMembership.objects.values_list('id', flat=True)))
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        self._add_members(2)
+        queryset = CommunityMembership.objects.filter(community=self.community)
+        page = KeysetPaginator(queryset, ('-joined_at', '-id'), 20).page('not-a-cursor')
+        self.assertEqual(len(page.items), 3)
+        self.assertIsNone(page.next_cursor)
+
+    def test_verify_member_toggles_flag(self):
+        member = self._create_user("pending")
+        membership = CommunityMembership.objects.create(user=member, community=self.community)
+
+        response = self.client.post(reverse('community:verify_member', args=[membership.pk]))
+
+        self.assertRedirects(response, reverse('community:community_members'), fetch_redirect_response=False)
+        membership.refresh_from_db()
+        self.assertTrue(membership.is_verified)
+
+    def test_verify_member_rejects_plain_members(self):
+        self.admin_membership.role = "member"
+        self.admin_membership.save()
+        member = self._create_user("pending")
+        membership = CommunityMembership.objects.create(user=member, community=self.community)
+
+        self.client.post(reverse('community:verify_member', args=[membership.pk]))
+
+        membership.refresh_from_db()
+        self.assertFalse(membership.is_verified)
+
+    def test_legacy_moderator_cannot_verify(self):
+        CommunityMembership.objects.filter(pk=self.admin_membership.pk).update(role="moderator")
+        membership = CommunityMembership.objects.create(user=self._create_user("pending"), community=self.community)
+
+        self.client.post(reverse('community:verify_member', args=[membership.pk]))
+
+        membership.refresh_from_db()
+        self.assertFalse(membership.is_verified)
+
+    def test_verify_member_outside_community_is_denied(self):
+        other = Community.objects.create(
+            name="Otra",
+            boundary_area=Polygon(((2, 2), (2, 3), (3, 3), (3, 2), (2, 2)), srid=4326),
+            postal_code="0001",
+        )
+        membership = CommunityMembership.objects.create(user=self._create_user("outsider"), community=other)
+
+        response = self.client.post(reverse('community:verify_member', args=[membership.pk]))
+
+        self.assertRedirects(response, reverse('dashboard:dashboard'), fetch_redirect_response=False)
+        membership.refresh_from_db()
+        self.assertFalse(membership.is_verified)
@@ -0,0 +1,142 @@
+import secrets
+
+from django.contrib.gis.geos import Polygon
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.authentication.models import User
+from core.community.models import Community, CommunityMembership, CommunityMembershipAudit
+from core.community.services.member_bulk_actions import MemberBulkActionService, MemberBulkActionError
+
+
+class MemberBulkActionTests(TestCase):
+    def setUp(self):
+        self.community = Community.objects.create(
+            name="Comunidad Masiva",
+            boundary_area=Polygon(((0, 0), (0, 1), (1, 1), (1, 0), (0, 0)), srid=4326),
+            postal_code="0000",
+        )
+        self.admin = self._create_user("admin", is_superuser=True)
+        self.admin_membership = CommunityMembership.objects.create(
+            user=self.admin, community=self.community, role="admin", is_verified=True
+        )
+        self.members = [
+            CommunityMembership.objects.create(user=self._create_user(f"member{index}"), community=self.community)
+            for index in range(5)
+        ]
+        self.client.force_login(self.admin)
+        self.url = reverse('community:bulk_member_action')
+
+    def _create_user(self, username, **extra):
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password=secrets.token_urlsafe(32),
+            dni=secrets.token_hex(8),
+            **extra,
+        )
+
+    def test_verify_pending_members_with_single_update(self):
+        service = MemberBulkActionService(self.community, self.admin)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = service.apply('verify', is_verified=False)
+
+        self.assertEqual(result, {'matched': 5, 'updated': 5})
+        updates = [query for query in ctx.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertFalse(CommunityMembership.objects.filter(is_verified=False).exists())
+        self.assertEqual(CommunityMembershipAudit.objects.filter(action='verify').count(), 5)
+
+    def test_already_applied_changes_are_not_audited(self):
+        self.members[0].is_verified = True
+        self.members[0].save()
+
+        result = MemberBulkActionService(self.community, self.admin).apply(
+            'verify', membership_ids=[self.members[0].id, self.members[1].id]
+        )
+
+        self.assertEqual(result, {'matched': 2, 'updated': 1})
+        audit = CommunityMembershipAudit.objects.get()
+        self.assertEqual(audit.membership_id, self.members[1].id)
+        self.assertEqual(audit.previous_value, 'False')
+        self.assertEqual(audit.new_value, 'True')
+
+    def test_role_change_skips_the_acting_admin(self):
+        result = MemberBulkActionService(self.community, self.admin).apply('set_role', new_role='member')
+
+        self.assertEqual(result['updated'], 0)
+        self.admin_membership.refresh_from_db()
+        self.assertEqual(self.admin_membership.role, 'admin')
+
+    def test_filtered_demotion_never_touches_other_admins(self):
+        other_admin = CommunityMembership.objects.create(
+            user=self._create_user("coadmin"), community=self.community, role="admin"
+        )
+
+        MemberBulkActionService(self.community, self.admin).apply('set_role', new_role='member', role='admin')
+
+        other_admin.refresh_from_db()
+        self.assertEqual(other_admin.role, 'admin')
+
+    def test_demoting_the_last_admin_is_refused(self):
+        outsider = self._create_user("soporte", is_superuser=True)
+
+        with self.assertRaises(MemberBulkActionError):
+            MemberBulkActionService(self.community, outsider).apply(
+                'set_role', new_role='member', membership_ids=[self.admin_membership.id]
+            )
+
+        self.admin_membership.refresh_from_db()
+        self.assertEqual(self.admin_membership.role, 'admin')
+        self.assertFalse(CommunityMembershipAudit.objects.exists())
+
+    def test_legacy_moderator_cannot_change_roles(self):
+        CommunityMembership.objects.filter(pk=self.admin_membership.pk).update(role='moderator')
+
+        response = self.client.post(
+            self.url, {'action': 'set_role', 'new_role': 'admin', 'membership_ids': str(self.members[0].id)}
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.members[0].refresh_from_db()
+        self.assertEqual(self.members[0].role, 'member')
+
+    def test_endpoint_returns_counts(self):
+        ids = ','.join(str(membership.id) for membership in self.members[:2])
+
+        response = self.client.post(self.url, {'action': 'set_role', 'new_role': 'admin', 'membership_ids': ids})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'matched': 2, 'updated': 2})
+        self.assertEqual(CommunityMembership.objects.filter(role='admin').count(), 3)
+
+    def test_endpoint_requires_new_role_for_role_changes(self):
+        response = self.client.post(self.url, {'action': 'set_role'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('new_role', response.json()['errors'])
+
+    def test_endpoint_rejects_plain_members(self):
+        self.admin_membership.role = 'member'
+        self.admin_membership.save()
+
+        response = self.client.post(self.url, {'action': 'verify'})
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(CommunityMembershipAudit.objects.exists())
+
+    def test_members_of_other_communities_are_untouched(self):
+        other = Community.objects.create(
+            name="Otra",
+            boundary_area=Polygon(((2, 2), (2, 3), (3, 3), (3, 2), (2, 2)), srid=4326),
+            postal_code="0001",
+        )
+        outsider = CommunityMembership.objects.create(user=self._create_user("outsider"), community=other)
+
+        self.client.post(self.url, {'action': 'verify', 'membership_ids': str(outsider.id)})
+
+        outsider.refresh_from_db()
+        self.assertFalse(outsider.is_verified)
@@ -0,0 +1,105 @@
+import secrets
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.community.api.community.feature.community import ValidateOrCreateCommunityFeature
+from core.community.models import Community, CommunityMembership
+from core.community.services.micro_communities import MicroCommunityMerger, meters_to_degrees
+from core.incident.models import Incident, IncidentStatus, IncidentType
+
+User = get_user_model()
+
+
+@override_settings(
+    COMMUNITY_AUTO_RADIUS_METERS=150,
+    COMMUNITY_AUTO_JOIN_DISTANCE_METERS=300,
+    COMMUNITY_AUTO_MAX_SPAN_METERS=3000,
+    COMMUNITY_MERGE_DISTANCE_METERS=200
+)
+class MicroCommunityTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.users = [
+            User.objects.create_user(
+                username=f'vecino{index}',
+                email=f'vecino{index}@example.com',
+                password=secrets.token_urlsafe(32),
+                dni=f'30303030{index:02d}'
+            )
+            for index in range(4)
+        ]
+
+    @staticmethod
+    def _auto_community(longitude, latitude, radius_meters=20):
+        return Community.objects.create(
+            boundary_area=Point(longitude, latitude, srid=4326).buffer(meters_to_degrees(radius_meters)),
+            is_auto_created=True
+        )
+
+    def test_user_outside_communities_gets_auto_created_area(self):
+        result = ValidateOrCreateCommunityFeature(self.users[0], -12.0464, -77.0428).execute()
+
+        community = Community.objects.get(id=result['community']['id'])
+        self.assertTrue(community.is_auto_created)
+        self.assertTrue(community.boundary_area.contains(Point(-77.0428 + meters_to_degrees(100), -12.0464, srid=4326)))
+
+    def test_nearby_user_expands_existing_auto_community(self):
+        first = ValidateOrCreateCommunityFeature(self.users[0], -12.0464, -77.0428).execute()
+        second = ValidateOrCreateCommunityFeature(
+            self.users[1], -12.0464, -77.0428 + meters_to_degrees(350)
+        ).execute()
+
+        self.assertEqual(first['community']['id'], second['community']['id'])
+        self.assertEqual(Community.objects.count(), 1)
+
+    def test_far_user_gets_separate_community(self):
+        ValidateOrCreateCommunityFeature(self.users[0], -12.0464, -77.0428).execute()
+        ValidateOrCreateCommunityFeature(self.users[1], -12.0464, -77.0428 + meters_to_degrees(2000)).execute()
+
+        self.assertEqual(Community.objects.count(), 2)
+
+    def test_merge_unions_close_communities_and_moves_memberships(self):
+        crowded = self._auto_community(-77.0428, -12.0464)
+        close = self._auto_community(-77.0428 + meters_to_degrees(100), -12.0464)
+        far = self._auto_community(-77.0428 + meters_to_degrees(5000), -12.0464)
+        CommunityMembership.objects.create(user=self.users[0], community=crowded)
+        CommunityMembership.objects.create(user=self.users[1], community=crowded)
+        CommunityMembership.objects.create(user=self.users[2], community=close, is_verified=True, role='admin')
+        CommunityMembership.objects.create(user=self.users[0], community=close, is_verified=True)
+        incident = Incident.objects.create(
+            reported_by_user=self.users[3],
+            incident_type=IncidentType.objects.create(name='Robo', code='robo'),
+            incident_status=IncidentStatus.objects.create(name='Reported', code='reported'),
+            title='Robo',
+            description='',
+            community=close,
+        )
+
+        out = StringIO()
+        call_command('merge_micro_communities', stdout=out)
+
+        self.assertEqual(set(Community.objects.values_list('id', flat=True)), {crowded.id, far.id})
+        crowded.refresh_from_db()
+        self.assertTrue(crowded.boundary_area.contains(close.boundary_area.centroid))
+        memberships = {
+            membership.user_id: membership
+            for membership in CommunityMembership.objects.filter(community=crowded)
+        }
+        self.assertEqual(set(memberships), {self.users[0].id, self.users[1].id, self.users[2].id})
+        self.assertTrue(memberships[self.users[0].id].is_verified)
+        self.assertEqual(memberships[self.users[2].id].role, 'admin')
+        incident.refresh_from_db()
+        self.assertEqual(incident.community, crowded)
+        self.assertIn('Grupos: 1, comunidades fusionadas: 1', out.getvalue())
+
+    def test_manual_communities_are_not_merged(self):
+        Community.objects.create(name='Centro', boundary_area=Point(-77.0428, -12.0464, srid=4326).buffer(0.001))
+        self._auto_community(-77.0428 + meters_to_degrees(50), -12.0464)
+
+        self.assertEqual(MicroCommunityMerger().find_clusters(), [])
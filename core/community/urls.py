@@ -3,7 +3,8 @@ from django.urls import path, include
 from core.community.views.community.community import (
     CommunityDetailView,
     CommunityMemberListView,
-    VerifyMemberView
+    VerifyMemberView,
+    BulkMemberActionView
 )
 
 app_name = 'community'
@@ -12,6 +13,7 @@ urlpatterns = [
     path('', CommunityDetailView.as_view(), name='community_detail'),
     path('members/', CommunityMemberListView.as_view(), name='community_members'),
     path('members/<int:pk>/verify/', VerifyMemberView.as_view(), name='verify_member'),
+    path('members/bulk/', BulkMemberActionView.as_view(), name='bulk_member_action'),
 
     #     API
     path('api/', include('core.community.api.urls')),
@@ -1,28 +1,32 @@
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import OuterRef, Subquery
 from django.views.generic import ListView, DetailView
 from django.views import View
-from django.shortcuts import redirect, get_object_or_404
+from django.shortcuts import redirect
 from django.contrib import messages
+from django.http import Http404, JsonResponse
 
-from core.community.forms.community import SearchMemberForm
+from core.community.forms.community import SearchMemberForm, BulkMemberActionForm
 from core.community.models import Community
 from core.community.models import CommunityMembership
+from core.community.services.member_bulk_actions import (
+    MemberBulkActionService, MemberBulkActionError, ROLE_MANAGER
+)
+from core.community.services.membership_context import CommunityMembershipMixin
+from core.shared.pagination import KeysetPaginator
 from config.mixins.permissions.permissions import PermissionMixin
 
 
-class CommunityDetailView(PermissionMixin, DetailView):
+class CommunityDetailView(PermissionMixin, CommunityMembershipMixin, DetailView):
     permission_required = 'can_manage_community'
     model = Community
     template_name = "community/detail/community_detail.html"
     context_object_name = 'community'
 
     def get_object(self, queryset=None):
-        membership = CommunityMembership.objects.filter(
-            user=self.request.user
-        ).select_related('community').first()
-
-        if membership:
-            return membership.community
+        if self.membership:
+            return self.membership.community
         return None
 
     def get_context_data(self, **kwargs):
@@ -31,25 +35,26 @@ class CommunityDetailView(PermissionMixin, DetailView):
         return context
 
 
-class CommunityMemberListView(PermissionMixin, ListView):
+class CommunityMemberListView(PermissionMixin, CommunityMembershipMixin, ListView):
     permission_required = 'can_manage_community'
     model = CommunityMembership
     template_name = "community/member_list/community_member_list.html"
     context_object_name = 'items'
     paginate_by = 20
+    ordering = ('-joined_at', '-id')
+    member_fields = (
+        'id', 'role', 'is_verified', 'joined_at', 'community_id',
+        'user__id', 'user__username', 'user__first_name', 'user__last_name', 'user__email',
+    )
 
     def get_queryset(self):
-        membership = CommunityMembership.objects.filter(
-            user=self.request.user
-        ).select_related('community').first()
-
-        if not membership:
+        if not self.membership:
             return CommunityMembership.objects.none()
 
-        self.community = membership.community
+        self.community = self.membership.community
         queryset = CommunityMembership.objects.filter(
-            community=self.community
-        ).select_related('user', 'community').order_by('-joined_at')
+            community_id=self.community.id
+        ).select_related('user').only(*self.member_fields)
 
         form = SearchMemberForm(self.request.GET)
         if form.is_valid():
@@ -63,10 +68,28 @@ class CommunityMemberListView(PermissionMixin, ListView):
 
         return queryset
 
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, self.ordering, page_size)
+        page = paginator.page(self.request.GET.get('cursor'))
+        return paginator, page, page.items, page.has_next
+
+    def member_count(self, community):
+        if community is None:
+            return 0
+        return cache.get_or_set(
+            f'community_member_count:{community.id}',
+            lambda: CommunityMembership.objects.filter(community_id=community.id).count(),
+            settings.COMMUNITY_MEMBER_COUNT_CACHE_SECONDS
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        query = self.request.GET.copy()
+        query.pop('cursor', None)
         context['community'] = getattr(self, 'community', None)
+        context['member_count'] = self.member_count(context['community'])
         context['search_form'] = SearchMemberForm(self.request.GET or None)
+        context['filter_query'] = query.urlencode()
         return context
 
 
@@ -74,23 +97,28 @@ class VerifyMemberView(PermissionMixin, View):
     permission_required = 'can_manage_community'
 
     def post(self, request, pk):
-        membership = get_object_or_404(CommunityMembership, pk=pk)
+        requester_role = CommunityMembership.objects.filter(
+            user_id=request.user.id,
+            community_id=OuterRef('community_id'),
+        ).values('role')[:1]
+
+        membership = CommunityMembership.objects.filter(pk=pk).select_related('user').only(
+            'id', 'is_verified', 'community_id', 'user__id', 'user__username',
+        ).annotate(requester_role=Subquery(requester_role)).first()
 
-        user_membership = CommunityMembership.objects.filter(
-            user=request.user,
-            community=membership.community
-        ).first()
+        if membership is None:
+            raise Http404
 
-        if not user_membership:
+        if membership.requester_role is None:
             messages.error(request, "No tienes acceso a esta comunidad.")
             return redirect('dashboard:dashboard')
 
-        if user_membership.role not in ['admin', 'moderator']:
+        if membership.requester_role != ROLE_MANAGER:
             messages.error(request, "No tienes permisos para verificar miembros.")
             return redirect('community:community_members')
 
         membership.is_verified = not membership.is_verified
-        membership.save()
+        membership.save(update_fields=['is_verified'])
 
         if membership.is_verified:
             messages.success(
@@ -104,3 +132,31 @@ class VerifyMemberView(PermissionMixin, View):
             )
 
         return redirect('community:community_members')
+
+
+class BulkMemberActionView(PermissionMixin, CommunityMembershipMixin, View):
+    permission_required = 'can_manage_community'
+
+    def post(self, request):
+        if not self.membership:
+            return JsonResponse({'message': 'No tienes acceso a esta comunidad.'}, status=403)
+
+        if self.membership.role != ROLE_MANAGER:
+            return JsonResponse({'message': 'No tienes permisos para gestionar miembros.'}, status=403)
+
+        form = BulkMemberActionForm(request.POST)
+        if not form.is_valid():
+            return JsonResponse({'message': 'Datos inválidos.', 'errors': form.errors}, status=400)
+
+        data = form.cleaned_data
+        try:
+            result = MemberBulkActionService(self.membership.community, request.user).apply(
+                data['action'],
+                new_role=data.get('new_role') or None,
+                membership_ids=data.get('membership_ids'),
+                role=data.get('role') or None,
+                is_verified=data.get('is_verified'),
+            )
+        except MemberBulkActionError as e:
+            return JsonResponse({'message': e.message}, status=409)
+        return JsonResponse(result)
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+
+from core.incident.models import IncidentIdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+
+class IncidentIdempotencyFeature:
+    HEADER = 'Idempotency-Key'
+    MAX_KEY_LENGTH = 255
+
+    def __init__(self, user, key, data, image_file=None):
+        self.user = user
+        self.key = key
+        self.fingerprint = self.build_fingerprint(data, image_file)
+        self.record = None
+
+    @staticmethod
+    def build_fingerprint(data, image_file=None):
+        payload = json.dumps(data, sort_keys=True, default=str)
+        if image_file:
+            payload += f"|{getattr(image_file, 'name', '')}|{getattr(image_file, 'size', '')}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def is_valid_key(cls, key):
+        return bool(key) and len(key) <= cls.MAX_KEY_LENGTH
+
+    def _expiration(self, now):
+        return now + timedelta(hours=settings.INCIDENT_IDEMPOTENCY_TTL_HOURS)
+
+    @staticmethod
+    def build_response(incident):
+        response_data = {
+            'message': 'Incidente registrado exitosamente',
+            'incident_id': incident.id,
+        }
+        if incident.duplicate_of_id:
+            response_data['duplicate_of'] = incident.duplicate_of_id
+        return response_data
+
+    def claim(self):
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                self.record, created = IncidentIdempotencyKey.objects.get_or_create(
+                    user=self.user,
+                    key=self.key,
+                    defaults={
+                        'request_fingerprint': self.fingerprint,
+                        'claimed_at': now,
+                        'expires_at': self._expiration(now),
+                    }
+                )
+        except IntegrityError:
+            self.record = IncidentIdempotencyKey.objects.get(user=self.user, key=self.key)
+            created = False
+
+        if created:
+            return None
+
+        if self.record.expires_at <= now:
+            reclaimed = IncidentIdempotencyKey.objects.filter(
+                pk=self.record.pk,
+                expires_at__lte=now
+            ).update(
+                request_fingerprint=self.fingerprint,
+                status='processing',
+                incident=None,
+                response_status=None,
+                response_body=None,
+                claimed_at=now,
+                expires_at=self._expiration(now)
+            )
+            if reclaimed:
+                logger.info(f"Clave de idempotencia expirada reutilizada: {self.key}")
+                return None
+            self.record.refresh_from_db()
+
+        return self._existing_result(now)
+
+    def _lease_expired(self, now):
+        lease = timedelta(seconds=settings.INCIDENT_IDEMPOTENCY_PROCESSING_LEASE_SECONDS)
+        return self.record.status == 'processing' and self.record.claimed_at <= now - lease
+
+    def _linked_result(self, now):
+        response_body = self.build_response(self.record.incident)
+        if self._lease_expired(now):
+            self.complete(self.record.incident, response_body, status.HTTP_201_CREATED)
+            logger.info(f"Clave de idempotencia {self.key} recuperada con el incidente {self.record.incident_id}")
+        return {
+            'body': response_body,
+            'status': status.HTTP_201_CREATED,
+            'replayed': True,
+        }
+
+    def _reclaim_abandoned(self, now):
+        reclaimed = IncidentIdempotencyKey.objects.filter(
+            pk=self.record.pk,
+            status='processing',
+            incident__isnull=True,
+            claimed_at=self.record.claimed_at
+        ).update(claimed_at=now)
+        if reclaimed:
+            logger.info(f"Clave de idempotencia abandonada reutilizada: {self.key}")
+        return bool(reclaimed)
+
+    def _existing_result(self, now, recover=True):
+        if self.record.request_fingerprint != self.fingerprint:
+            logger.warning(f"Clave de idempotencia reutilizada con otra petición: {self.key}")
+            return {
+                'body': {'error': 'La clave de idempotencia ya fue usada con una petición diferente'},
+                'status': status.HTTP_422_UNPROCESSABLE_ENTITY,
+                'replayed': False,
+            }
+
+        if self.record.status != 'completed' and self.record.incident_id:
+            return self._linked_result(now)
+
+        if recover and self._lease_expired(now):
+            if self._reclaim_abandoned(now):
+                return None
+            self.record.refresh_from_db()
+            return self._existing_result(now, recover=False)
+
+        if self.record.status != 'completed':
+            logger.info(f"Petición con clave {self.key} aún en proceso")
+            return {
+                'body': {'error': 'Una petición con la misma clave de idempotencia está en proceso'},
+                'status': status.HTTP_409_CONFLICT,
+                'replayed': False,
+            }
+
+        logger.info(f"Respuesta reenviada para clave de idempotencia {self.key}")
+        return {
+            'body': self.record.response_body,
+            'status': self.record.response_status,
+            'replayed': True,
+        }
+
+    def attach(self, incident):
+        if self.record is None:
+            return
+        self.record.incident = incident
+        IncidentIdempotencyKey.objects.filter(pk=self.record.pk).update(incident=incident)
+
+    def complete(self, incident, response_body, response_status):
+        if self.record is None:
+            return
+        self.record.status = 'completed'
+        self.record.incident = incident
+        self.record.response_body = response_body
+        self.record.response_status = response_status
+        self.record.save(update_fields=['status', 'incident', 'response_body', 'response_status'])
+
+    def release(self):
+        if self.record is None:
+            return
+        if self.record.incident_id:
+            self.complete(self.record.incident, self.build_response(self.record.incident), status.HTTP_201_CREATED)
+        else:
+            IncidentIdempotencyKey.objects.filter(pk=self.record.pk, status='processing').delete()
+        self.record = None
@@ -2,7 +2,10 @@ import logging
 from django.utils import timezone
 from django.contrib.gis.geos import Point
 
+from core.community.services.boundary_index import community_boundary_index
 from core.incident.models import IncidentMedia, Incident, IncidentType, IncidentStatus
+from core.incident.services.deduplicate import IncidentDeduplicator
+from core.incident.services.media_processing import IncidentMediaProcessor
 from core.stats.models import UserStats
 
 logger = logging.getLogger(__name__)
@@ -42,6 +45,9 @@ class CreateIncidentFeature:
                 except (TypeError, ValueError):
                     logger.warning("Coordenadas inválidas, se ignorará location")
 
+            deduplicator = IncidentDeduplicator()
+            primary_incident = deduplicator.find_primary(incident_type, point)
+
             incident = Incident.objects.create(
                 reported_by_user=self.user,
                 incident_type=incident_type,
@@ -50,9 +56,13 @@ class CreateIncidentFeature:
                 description=self.data.get('description', ''),
                 address=self.data.get('location', ''),
                 location=point,
+                community=community_boundary_index.find(point) if point else None,
                 is_anonymous=True,
-                occurred_at=timezone.now()
+                occurred_at=timezone.now(),
+                duplicate_of=primary_incident
             )
+            if primary_incident:
+                deduplicator.add_corroboration(primary_incident)
             stats, _ = UserStats.objects.get_or_create(user=incident.reported_by_user)
             stats.total_alerts += 1
             stats.total_alerts_pending += 1
@@ -66,6 +76,7 @@ class CreateIncidentFeature:
                     file=self.image_file
                 )
                 logger.info(f"Imagen guardada: {media.file.name}")
+                IncidentMediaProcessor().schedule(media.id)
             return incident
 
         except Exception as e:
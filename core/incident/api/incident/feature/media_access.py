@@ -0,0 +1,65 @@
+import logging
+
+from core.community.models import CommunityMembership
+from core.incident.models import IncidentNotification
+
+logger = logging.getLogger(__name__)
+
+
+class IncidentMediaAccessFeature:
+    VARIANTS = {
+        'original': 'file',
+        'display': 'display_file',
+        'thumbnail': 'thumbnail',
+    }
+    MANAGE_PERMISSION = 'can_manage_community'
+
+    def __init__(self, user):
+        self.user = user
+
+    @classmethod
+    def resolve_file(cls, media, variant):
+        field_file = getattr(media, cls.VARIANTS[variant])
+        if field_file:
+            return field_file, variant
+        if media.file:
+            return media.file, 'original'
+        return None, variant
+
+    def is_manager(self, incident):
+        if self.user.is_superuser or self.user.is_staff:
+            return True
+        if incident.community_id is None:
+            return False
+        if not self.user.groups.filter(permissions__codename=self.MANAGE_PERMISSION).exists():
+            return False
+        return CommunityMembership.objects.filter(
+            user_id=self.user.id,
+            community_id=incident.community_id,
+            role='admin'
+        ).exists()
+
+    def can_view(self, media, variant):
+        incident = media.incident
+        if incident.reported_by_user_id == self.user.id or self.is_manager(incident):
+            return True
+
+        if variant == 'original' and incident.is_anonymous:
+            return False
+
+        if IncidentNotification.objects.filter(
+            incident_id=incident.id,
+            notified_user_id=self.user.id,
+            delivery_status='sent'
+        ).exists():
+            return True
+
+        if incident.community_id is None:
+            return False
+
+        return CommunityMembership.objects.filter(
+            user_id=self.user.id,
+            community_id=incident.community_id,
+            is_verified=True,
+            community__is_active=True
+        ).exists()
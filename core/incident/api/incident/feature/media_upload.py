@@ -0,0 +1,164 @@
+import fcntl
+import logging
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from core.incident.models import Incident, IncidentMedia, MediaUploadSession
+from core.incident.services.media_processing import IncidentMediaProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class MediaUploadError(Exception):
+    def __init__(self, message, status_code, offset=None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.offset = offset
+
+
+class MediaUploadFeature:
+    OFFSET_HEADER = 'Upload-Offset'
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, user):
+        self.user = user
+
+    @staticmethod
+    def max_chunk_size():
+        return settings.INCIDENT_UPLOAD_MAX_CHUNK_BYTES
+
+    @staticmethod
+    def temp_path(session):
+        return os.path.join(settings.INCIDENT_UPLOAD_TMP_DIR, f"{session.id}.part")
+
+    def create_session(self, incident_id, media_type, filename, total_size, description=None):
+        incident = Incident.objects.filter(pk=incident_id, reported_by_user=self.user).first()
+        if incident is None:
+            raise MediaUploadError('Incidente no encontrado', 404)
+
+        if media_type not in dict(IncidentMedia.MEDIA_TYPE_CHOICES):
+            raise MediaUploadError('Tipo de medio inválido', 400)
+
+        try:
+            total_size = int(total_size)
+        except (TypeError, ValueError):
+            raise MediaUploadError('Tamaño total inválido', 400)
+        if total_size <= 0 or total_size > settings.INCIDENT_UPLOAD_MAX_BYTES:
+            raise MediaUploadError(
+                f'El archivo debe pesar entre 1 y {settings.INCIDENT_UPLOAD_MAX_BYTES} bytes', 413
+            )
+
+        filename = get_valid_filename(os.path.basename(filename or '')) or 'archivo'
+        session = MediaUploadSession.objects.create(
+            user=self.user,
+            incident=incident,
+            media_type=media_type,
+            filename=filename[:255],
+            description=description,
+            total_size=total_size,
+            expires_at=timezone.now() + timedelta(hours=settings.INCIDENT_UPLOAD_SESSION_TTL_HOURS)
+        )
+
+        os.makedirs(settings.INCIDENT_UPLOAD_TMP_DIR, exist_ok=True)
+        open(self.temp_path(session), 'wb').close()
+        logger.info(f"Sesión de subida {session.id} creada para incidente {incident.id} ({total_size} bytes)")
+        return session
+
+    def get_session(self, upload_id):
+        session = MediaUploadSession.objects.filter(pk=upload_id, user=self.user).first()
+        if session is None:
+            raise MediaUploadError('Sesión de subida no encontrada', 404)
+        if session.status == 'uploading' and session.expires_at <= timezone.now():
+            raise MediaUploadError('La sesión de subida expiró', 410)
+        return session
+
+    def append_chunk(self, session, offset, stream, length):
+        if session.status != 'uploading':
+            raise MediaUploadError('La sesión de subida ya fue completada', 409, session.received_bytes)
+
+        try:
+            offset = int(offset)
+            length = int(length)
+        except (TypeError, ValueError):
+            raise MediaUploadError(f'Cabeceras {self.OFFSET_HEADER} y Content-Length requeridas', 400)
+
+        if length <= 0 or length > settings.INCIDENT_UPLOAD_MAX_CHUNK_BYTES:
+            raise MediaUploadError(
+                f'Cada fragmento debe pesar entre 1 y {settings.INCIDENT_UPLOAD_MAX_CHUNK_BYTES} bytes', 413
+            )
+        if offset + length > session.total_size:
+            raise MediaUploadError('El fragmento excede el tamaño declarado', 413, session.received_bytes)
+
+        with open(self.temp_path(session), 'r+b') as part:
+            fcntl.flock(part, fcntl.LOCK_EX)
+            try:
+                session.refresh_from_db(fields=['received_bytes', 'status'])
+                if offset != session.received_bytes:
+                    raise MediaUploadError('Desplazamiento incorrecto', 409, session.received_bytes)
+
+                part.seek(offset)
+                written = 0
+                while written < length:
+                    data = stream.read(min(self.READ_SIZE, length - written))
+                    if not data:
+                        break
+                    part.write(data)
+                    written += len(data)
+                part.truncate()
+                part.flush()
+                os.fsync(part.fileno())
+
+                MediaUploadSession.objects.filter(pk=session.pk, received_bytes=offset).update(
+                    received_bytes=offset + written,
+                    updated_at=timezone.now()
+                )
+                session.received_bytes = offset + written
+            finally:
+                fcntl.flock(part, fcntl.LOCK_UN)
+
+        if written < length:
+            logger.warning(f"Fragmento incompleto en sesión {session.id}: {written}/{length} bytes")
+        return session
+
+    def complete(self, session):
+        if session.status == 'completed':
+            return session.media
+
+        if session.received_bytes != session.total_size:
+            raise MediaUploadError('La subida está incompleta', 409, session.received_bytes)
+
+        path = self.temp_path(session)
+        with transaction.atomic():
+            locked = MediaUploadSession.objects.select_for_update().get(pk=session.pk)
+            if locked.status == 'completed':
+                return locked.media
+
+            with open(path, 'rb') as part:
+                media = IncidentMedia.objects.create(
+                    incident_id=locked.incident_id,
+                    media_type=locked.media_type,
+                    description=locked.description,
+                    file=File(part, name=locked.filename)
+                )
+            locked.media = media
+            locked.status = 'completed'
+            locked.save(update_fields=['media', 'status', 'updated_at'])
+            IncidentMediaProcessor().schedule(media.id)
+
+        os.remove(path)
+        logger.info(f"Sesión de subida {session.id} completada: {media.file.name}")
+        return media
+
+    def discard(self, session):
+        MediaUploadSession.objects.filter(pk=session.pk).delete()
+        try:
+            os.remove(self.temp_path(session))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,29 @@
+import logging
+
+from django.utils import timezone
+
+from core.incident.services.notification_unread import UnreadNotificationCounter
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationReadFeature:
+
+    def __init__(self, user):
+        self.user = user
+        self.counter = UnreadNotificationCounter()
+
+    def mark_read(self, incident_ids=None, up_to=None):
+        notifications = UnreadNotificationCounter.unread(self.user.id)
+        if incident_ids:
+            notifications = notifications.filter(incident_id__in=incident_ids)
+        if up_to:
+            notifications = notifications.filter(notification_sent_at__lte=up_to)
+
+        updated = notifications.update(was_read=True, read_at=timezone.now())
+        self.counter.decrement(self.user.id, updated)
+        logger.info(f"Usuario {self.user.id} marcó {updated} notificaciones como leídas")
+        return updated
+
+    def unread_count(self):
+        return self.counter.get(self.user.id)
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+
+class NotificationReadSerializer(serializers.Serializer):
+    incident_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=500
+    )
+    up_to = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if not attrs.get('incident_ids') and not attrs.get('up_to'):
+            raise serializers.ValidationError('Debes enviar incident_ids o up_to.')
+        return attrs
@@ -3,9 +3,24 @@ from django.urls import path
 from core.incident.api.incident.views.incident import RegisterIncidentApiView
 from core.incident.api.incident.views.incident_list import ListIncidentApiView
 from core.incident.api.incident.views.map_incident import MapIncidentsApiView
+from core.incident.api.incident.views.media_file import IncidentMediaFileApiView
+from core.incident.api.incident.views.media_upload import (
+    MediaUploadSessionApiView, MediaUploadApiView, MediaUploadCompleteApiView
+)
+from core.incident.api.incident.views.notification import NotificationReadApiView, NotificationUnreadCountApiView
 
 urlpatterns = [
     path('create', RegisterIncidentApiView.as_view(), name='api_register_incident'),
     path('list', ListIncidentApiView.as_view(), name='api_list_incident'),
-    path("detail", MapIncidentsApiView.as_view(), name="api_map_incidents")
+    path("detail", MapIncidentsApiView.as_view(), name="api_map_incidents"),
+    path('media/<int:media_id>', IncidentMediaFileApiView.as_view(), name='api_incident_media_file'),
+    path('media/uploads', MediaUploadSessionApiView.as_view(), name='api_media_upload_session'),
+    path('media/uploads/<uuid:upload_id>', MediaUploadApiView.as_view(), name='api_media_upload'),
+    path(
+        'media/uploads/<uuid:upload_id>/complete',
+        MediaUploadCompleteApiView.as_view(),
+        name='api_media_upload_complete'
+    ),
+    path('notifications/read', NotificationReadApiView.as_view(), name='api_notifications_read'),
+    path('notifications/unread-count', NotificationUnreadCountApiView.as_view(), name='api_notifications_unread_count'),
 ]
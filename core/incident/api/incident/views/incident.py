@@ -6,6 +6,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.incident.api.incident.feature.idempotency import IncidentIdempotencyFeature
 from core.incident.api.incident.feature.incident import CreateIncidentFeature
 from core.incident.services.notify_users import NearbyUsersNotifier
 
@@ -16,6 +17,7 @@ class RegisterIncidentApiView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, *args, **kwargs):
+        idempotency = None
         try:
             json_data = request.data.get('data')
             if not json_data:
@@ -34,26 +36,55 @@ class RegisterIncidentApiView(APIView):
             else:
                 logger.info("No se recibió imagen")
 
+            idempotency_key = request.headers.get(IncidentIdempotencyFeature.HEADER)
+            if idempotency_key is not None:
+                if not IncidentIdempotencyFeature.is_valid_key(idempotency_key):
+                    return Response(
+                        {'error': 'Clave de idempotencia inválida'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                idempotency = IncidentIdempotencyFeature(
+                    user=request.user,
+                    key=idempotency_key,
+                    data=data_dict,
+                    image_file=image_file
+                )
+                existing = idempotency.claim()
+                if existing is not None:
+                    idempotency = None
+                    headers = {'Idempotent-Replayed': 'true'} if existing['replayed'] else None
+                    return Response(existing['body'], status=existing['status'], headers=headers)
+
             incident_creator = CreateIncidentFeature(
                 data=data_dict,
                 user=request.user,
                 image_file=image_file
             )
             incident = incident_creator.save_incident()
+            if idempotency:
+                idempotency.attach(incident)
 
             incident_lat = data_dict.get('latitude')
             incident_lng = data_dict.get('longitude')
 
-            if incident_lat and incident_lng:
+            if incident.duplicate_of_id:
+                logger.info(
+                    f"Incidente {incident.id} registrado como corroboración de {incident.duplicate_of_id}, "
+                    f"no se notificará nuevamente"
+                )
+            elif incident_lat and incident_lng:
                 notify = NearbyUsersNotifier()
                 notify.send_notifications(incident, incident_lat, incident_lng)
-            return Response({
-                'message': 'Incidente registrado exitosamente',
-                'incident_id': incident.id,
-            }, status=status.HTTP_201_CREATED)
+
+            response_data = IncidentIdempotencyFeature.build_response(incident)
+            if idempotency:
+                idempotency.complete(incident, response_data, status.HTTP_201_CREATED)
+            return Response(response_data, status=status.HTTP_201_CREATED)
 
         except Exception as e:
             logger.error(f"Error al registrar incidente: {str(e)}")
+            if idempotency:
+                idempotency.release()
             return Response(
                 {'error': f'Error al registrar incidente: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1,6 +1,5 @@
 # views.py
 
-from django.contrib.gis.geos import Point
 from django.contrib.gis.measure import D
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -18,16 +17,13 @@ class MapIncidentsApiView(APIView):
         user = request.user
 
         try:
-            user_profile = user.profiles_by_user
-            if not user_profile.latitude or not user_profile.longitude:
+            user_location = user.profiles_by_user.location
+            if user_location is None:
                 return Response(
                     {'error': 'Usuario sin ubicación configurada'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            user_lat = user_profile.latitude
-            user_lng = user_profile.longitude
-
         except Exception as e:
             return Response(
                 {'error': 'No se pudo obtener la ubicación del usuario'},
@@ -36,8 +32,6 @@ class MapIncidentsApiView(APIView):
 
         radius_km = 5.0
 
-        user_location = Point(user_lng, user_lat, srid=4326)
-
         incidents = Incident.objects.filter(
             is_active=True,
             location__isnull=False,
@@ -46,10 +40,10 @@ class MapIncidentsApiView(APIView):
             'incident_type',
             'incident_status',
             'reported_by_user'
-        ).order_by('-reported_at')
+        ).prefetch_related('media').order_by('-reported_at')
 
         my_incidents = incidents.filter(reported_by_user=user)
-        other_incidents = incidents.exclude(reported_by_user=user)
+        other_incidents = incidents.exclude(reported_by_user=user).filter(duplicate_of__isnull=True)
 
         context = {'request': request}
         my_incidents_data = MapIncidentSerializer(my_incidents, many=True, context=context).data
@@ -61,8 +55,8 @@ class MapIncidentsApiView(APIView):
             'total_count': len(my_incidents_data) + len(other_incidents_data),
             'radius_km': radius_km,
             'user_location': {
-                'latitude': user_lat,
-                'longitude': user_lng
+                'latitude': user_location.y,
+                'longitude': user_location.x
             }
         }
 
@@ -0,0 +1,53 @@
+import logging
+import mimetypes
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.authentication.api.auth.authentication import CachedTokenAuthentication
+from core.incident.api.incident.feature.media_access import IncidentMediaAccessFeature
+from core.incident.models import IncidentMedia
+from core.shared.storage import ContentAddressedStorage
+
+logger = logging.getLogger(__name__)
+
+
+class IncidentMediaFileApiView(APIView):
+    IMMUTABLE_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+    authentication_classes = [CachedTokenAuthentication, SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, media_id, *args, **kwargs):
+        media = get_object_or_404(IncidentMedia.objects.select_related('incident'), pk=media_id)
+        variant = request.query_params.get('variant', 'display')
+
+        if variant not in IncidentMediaAccessFeature.VARIANTS:
+            return Response({'error': 'Variante inválida'}, status=status.HTTP_400_BAD_REQUEST)
+
+        field_file, variant = IncidentMediaAccessFeature.resolve_file(media, variant)
+
+        if not IncidentMediaAccessFeature(request.user).can_view(media, variant):
+            logger.warning(f"Acceso denegado al archivo {media.id} para usuario {request.user.id}")
+            return Response({'error': 'No tiene acceso a este archivo'}, status=status.HTTP_403_FORBIDDEN)
+
+        if field_file is None:
+            return Response({'error': 'Archivo no encontrado'}, status=status.HTTP_404_NOT_FOUND)
+
+        content_type = mimetypes.guess_type(field_file.name)[0] or 'application/octet-stream'
+        if settings.MEDIA_ACCEL_REDIRECT:
+            response = HttpResponse(content_type=content_type)
+            response['X-Accel-Redirect'] = f"{settings.MEDIA_ACCEL_PREFIX}{quote(field_file.name)}"
+        else:
+            response = FileResponse(field_file.open('rb'), content_type=content_type)
+        if ContentAddressedStorage.digest_from_name(field_file.name):
+            response['Cache-Control'] = self.IMMUTABLE_CACHE_CONTROL
+        else:
+            response['Cache-Control'] = f"private, max-age={settings.MEDIA_PRIVATE_CACHE_SECONDS}"
+        return response
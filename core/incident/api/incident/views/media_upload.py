@@ -0,0 +1,122 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.incident.api.incident.feature.media_upload import MediaUploadFeature, MediaUploadError
+
+logger = logging.getLogger(__name__)
+
+
+def upload_session_json(session):
+    item = dict()
+    item['upload_id'] = str(session.id)
+    item['incident_id'] = session.incident_id
+    item['media_type'] = session.media_type
+    item['filename'] = session.filename
+    item['total_size'] = session.total_size
+    item['received_bytes'] = session.received_bytes
+    item['status'] = session.status
+    item['expires_at'] = session.expires_at.isoformat()
+    return item
+
+
+def upload_error_response(error):
+    headers = None
+    if error.offset is not None:
+        headers = {MediaUploadFeature.OFFSET_HEADER: str(error.offset)}
+    return Response({'error': error.message}, status=error.status_code, headers=headers)
+
+
+class MediaUploadSessionApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            session = MediaUploadFeature(request.user).create_session(
+                incident_id=request.data.get('incident_id'),
+                media_type=request.data.get('media_type'),
+                filename=request.data.get('filename'),
+                total_size=request.data.get('total_size'),
+                description=request.data.get('description')
+            )
+        except MediaUploadError as e:
+            return upload_error_response(e)
+
+        data = upload_session_json(session)
+        data['max_chunk_size'] = MediaUploadFeature.max_chunk_size()
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class MediaUploadApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, upload_id, *args, **kwargs):
+        try:
+            session = MediaUploadFeature(request.user).get_session(upload_id)
+        except MediaUploadError as e:
+            return upload_error_response(e)
+
+        return Response(
+            upload_session_json(session),
+            status=status.HTTP_200_OK,
+            headers={MediaUploadFeature.OFFSET_HEADER: str(session.received_bytes)}
+        )
+
+    def put(self, request, upload_id, *args, **kwargs):
+        feature = MediaUploadFeature(request.user)
+        try:
+            session = feature.get_session(upload_id)
+            session = feature.append_chunk(
+                session,
+                offset=request.headers.get(MediaUploadFeature.OFFSET_HEADER),
+                stream=request.stream,
+                length=request.META.get('CONTENT_LENGTH')
+            )
+        except MediaUploadError as e:
+            return upload_error_response(e)
+
+        return Response(
+            upload_session_json(session),
+            status=status.HTTP_200_OK,
+            headers={MediaUploadFeature.OFFSET_HEADER: str(session.received_bytes)}
+        )
+
+    def delete(self, request, upload_id, *args, **kwargs):
+        feature = MediaUploadFeature(request.user)
+        try:
+            session = feature.get_session(upload_id)
+        except MediaUploadError as e:
+            return upload_error_response(e)
+
+        feature.discard(session)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class MediaUploadCompleteApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, upload_id, *args, **kwargs):
+        feature = MediaUploadFeature(request.user)
+        try:
+            session = feature.get_session(upload_id)
+            media = feature.complete(session)
+        except MediaUploadError as e:
+            return upload_error_response(e)
+        except Exception as e:
+            logger.error(f"Error al completar subida {upload_id}: {str(e)}")
+            return Response(
+                {'error': f'Error al completar la subida: {str(e)}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        return Response(
+            {
+                'message': 'Archivo adjuntado exitosamente',
+                'incident_id': media.incident_id,
+                'media': media.to_json_api()
+            },
+            status=status.HTTP_201_CREATED
+        )
@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.incident.api.incident.feature.notification_read import NotificationReadFeature
+from core.incident.api.incident.serializer.notification_read import NotificationReadSerializer
+
+
+class NotificationReadApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = NotificationReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        feature = NotificationReadFeature(request.user)
+        updated = feature.mark_read(**serializer.validated_data)
+        return Response({'updated': updated, 'unread': feature.unread_count()}, status=status.HTTP_200_OK)
+
+
+class NotificationUnreadCountApiView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        return Response({'unread': NotificationReadFeature(request.user).unread_count()}, status=status.HTTP_200_OK)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class IncidentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core.incident'
+
+    def ready(self):
+        from core.incident import signals
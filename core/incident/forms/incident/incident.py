@@ -1,4 +1,5 @@
 from django import forms
+from core.community.models import Community
 from core.incident.models import IncidentType, IncidentStatus
 
 
@@ -19,5 +20,13 @@ class SearchIncidentForm(forms.Form):
         widget=forms.Select(attrs={'class': 'form-select'})
     )
 
+    community = forms.ModelChoiceField(
+        queryset=Community.objects.filter(is_active=True).order_by('name'),
+        required=False,
+        label='Comunidad',
+        empty_label='Todas las comunidades',
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
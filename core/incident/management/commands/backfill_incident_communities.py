@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+
+from core.community.models import Community
+from core.incident.models import Incident
+
+
+class Command(BaseCommand):
+    help = 'Asigna la comunidad que contiene la ubicación de cada incidente sin comunidad'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        containing_community = Community.objects.filter(
+            is_active=True,
+            boundary_area__contains=OuterRef('location')
+        ).order_by('id').values('id')[:1]
+
+        last_id = 0
+        scanned = 0
+        tagged = 0
+        while True:
+            ids = list(
+                Incident.objects.filter(id__gt=last_id, community__isnull=True, location__isnull=False)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            Incident.objects.filter(id__in=ids).update(community_id=Subquery(containing_community))
+            tagged += Incident.objects.filter(id__in=ids, community__isnull=False).count()
+            scanned += len(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f'Incidentes revisados: {scanned}, con comunidad asignada: {tagged}'))
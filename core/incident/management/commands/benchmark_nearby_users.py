@@ -0,0 +1,99 @@
+import random
+import statistics
+import time
+
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import Distance
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from core.authentication.models import User, UserProfile
+from core.incident.utils.location import LocationUtils
+
+
+class BenchmarkRollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Mide la búsqueda de usuarios cercanos (p50/p99) con perfiles sintéticos; los datos se revierten al terminar'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50000)
+        parser.add_argument('--spread-km', type=float, default=15.0)
+        parser.add_argument('--radius-km', type=float, default=2.0)
+        parser.add_argument('--rounds', type=int, default=50)
+        parser.add_argument('--latitude', type=float, default=-12.0464)
+        parser.add_argument('--longitude', type=float, default=-77.0428)
+        parser.add_argument('--seed', type=int, default=2025)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        try:
+            with transaction.atomic():
+                self._seed_profiles(rng, options)
+                self._report(rng, options)
+                raise BenchmarkRollback()
+        except BenchmarkRollback:
+            self.stdout.write('Datos sintéticos revertidos')
+
+    def _seed_profiles(self, rng, options):
+        total = options['users']
+        spread_deg = options['spread_km'] / 111.32
+        batch_size = 2000
+        for start in range(0, total, batch_size):
+            size = min(batch_size, total - start)
+            users = User.objects.bulk_create([
+                User(
+                    username=f'bench-{start + index}',
+                    email=f'bench-{start + index}@benchmark.local',
+                    dni=f'B{start + index:09d}',
+                    password='!'
+                )
+                for index in range(size)
+            ])
+            UserProfile.objects.bulk_create([
+                UserProfile(user=user, location=self._random_point(rng, options, spread_deg))
+                for user in users
+            ])
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {UserProfile._meta.db_table}')
+        self.stdout.write(f"Perfiles sintéticos: {total} en un radio de {options['spread_km']}km")
+
+    @staticmethod
+    def _random_point(rng, options, spread_deg):
+        latitude = options['latitude'] + rng.gauss(0, spread_deg / 2)
+        longitude = options['longitude'] + rng.gauss(0, spread_deg / 2)
+        return Point(longitude, latitude, srid=4326)
+
+    def _report(self, rng, options):
+        spread_deg = options['spread_km'] / 111.32
+        origins = [self._random_point(rng, options, spread_deg / 2) for _ in range(options['rounds'])]
+        radius_km = options['radius_km']
+
+        def geography_query(origin):
+            return LocationUtils(origin.y, origin.x, radius_km).get_nearby_profiles()
+
+        def geometry_query(origin):
+            return UserProfile.objects.filter(
+                location__distance_lte=(origin, Distance(km=radius_km))
+            ).select_related('user')
+
+        self.stdout.write('EXPLAIN geography (ST_DWithin + KNN):')
+        self.stdout.write(geography_query(origins[0]).explain(analyze=True))
+        self.stdout.write('EXPLAIN geometry (distance_lte):')
+        self.stdout.write(geometry_query(origins[0]).explain(analyze=True))
+
+        self.stdout.write(f"{'consulta':<24}{'p50 (ms)':>12}{'p99 (ms)':>12}{'usuarios':>12}")
+        for name, build_query in (('geography', geography_query), ('geometry', geometry_query)):
+            timings = []
+            found = []
+            for origin in origins:
+                start = time.perf_counter()
+                found.append(len(list(build_query(origin))))
+                timings.append((time.perf_counter() - start) * 1000)
+
+            timings.sort()
+            p50 = statistics.median(timings)
+            p99 = timings[min(len(timings) - 1, int(round(len(timings) * 0.99)) - 1)]
+            self.stdout.write(f"{name:<24}{p50:>12.1f}{p99:>12.1f}{statistics.mean(found):>12.0f}")
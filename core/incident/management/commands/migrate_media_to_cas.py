@@ -0,0 +1,53 @@
+import os
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from core.incident.models import IncidentMedia
+from core.shared.storage import ContentAddressedStorage
+
+FILE_FIELDS = ('file', 'display_file', 'thumbnail')
+
+
+class Command(BaseCommand):
+    help = 'Mueve los archivos multimedia existentes al almacenamiento por contenido eliminando duplicados'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200)
+
+    def handle(self, *args, **options):
+        prefix = f"{ContentAddressedStorage.PREFIX}/"
+        pending = Q()
+        for field in FILE_FIELDS:
+            pending |= Q(**{f'{field}__gt': ''}) & ~Q(**{f'{field}__startswith': prefix})
+
+        migrated = 0
+        missing = 0
+        last_id = 0
+        while True:
+            batch = list(
+                IncidentMedia.objects.filter(pending, id__gt=last_id).order_by('id')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            for media in batch:
+                last_id = media.id
+                for field in FILE_FIELDS:
+                    field_file = getattr(media, field)
+                    if not field_file or field_file.name.startswith(prefix):
+                        continue
+                    legacy_name = field_file.name
+                    if not default_storage.exists(legacy_name):
+                        missing += 1
+                        continue
+                    with transaction.atomic():
+                        with default_storage.open(legacy_name, 'rb') as legacy:
+                            field_file.save(os.path.basename(legacy_name), File(legacy), save=False)
+                        IncidentMedia.objects.filter(pk=media.pk).update(**{field: field_file.name})
+                    default_storage.delete(legacy_name)
+                    migrated += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Archivos migrados: {migrated}, no encontrados: {missing}"))
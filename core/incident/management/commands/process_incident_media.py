@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from core.incident.models import IncidentMedia
+from core.incident.services.media_processing import IncidentMediaProcessor
+
+
+class Command(BaseCommand):
+    help = 'Genera las versiones optimizadas y miniaturas de las imágenes de incidentes pendientes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retry-failed', action='store_true')
+        parser.add_argument('--limit', type=int, default=500)
+
+    def handle(self, *args, **options):
+        statuses = ['pending', 'failed'] if options['retry_failed'] else ['pending']
+        queryset = IncidentMedia.objects.filter(processing_status__in=statuses).order_by('id')[:options['limit']]
+
+        processor = IncidentMediaProcessor()
+        processed = 0
+        failed = 0
+        for media in queryset:
+            media = processor.process(media)
+            if media.processing_status == 'failed':
+                failed += 1
+            else:
+                processed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Archivos procesados: {processed}, fallidos: {failed}"))
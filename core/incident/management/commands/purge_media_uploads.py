@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.incident.api.incident.feature.media_upload import MediaUploadFeature
+from core.incident.models import MediaUploadSession
+
+
+class Command(BaseCommand):
+    help = 'Elimina las sesiones de subida de archivos expiradas y sus fragmentos temporales'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = timezone.now()
+        total = 0
+        while True:
+            sessions = list(
+                MediaUploadSession.objects.filter(expires_at__lte=now).only('id', 'user_id')[:batch_size]
+            )
+            if not sessions:
+                break
+            for session in sessions:
+                MediaUploadFeature(session.user_id).discard(session)
+            total += len(sessions)
+
+        self.stdout.write(self.style.SUCCESS(f'Sesiones de subida eliminadas: {total}'))
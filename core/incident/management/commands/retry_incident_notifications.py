@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.incident.services.notify_users import NearbyUsersNotifier
+
+
+class Command(BaseCommand):
+    help = 'Reintenta solo las notificaciones de incidentes cuyo envío falló'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-attempts', type=int, default=settings.INCIDENT_NOTIFICATION_MAX_ATTEMPTS)
+
+    def handle(self, *args, **options):
+        result = NearbyUsersNotifier().retry_failed(max_attempts=options['max_attempts'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Reintentadas {result['retried']} notificaciones de {result['incidents']} incidentes "
+            f"({result['sent']} entregadas)"
+        ))
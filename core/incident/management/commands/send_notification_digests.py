@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from core.incident.services.notification_digest import NotificationDigestSender
+
+
+class Command(BaseCommand):
+    help = 'Envía un resumen con las notificaciones retenidas por el límite de envío'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        result = NotificationDigestSender().send_pending(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Resúmenes enviados a {result['users']} usuarios ({result['incidents']} incidentes)"
+        ))
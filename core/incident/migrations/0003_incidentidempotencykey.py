@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0002_incidentnotification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IncidentIdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, verbose_name='Clave de idempotencia')),
+                ('request_fingerprint', models.CharField(max_length=64, verbose_name='Huella de la petición')),
+                ('status', models.CharField(choices=[('processing', 'En proceso'), ('completed', 'Completado')], default='processing', max_length=20, verbose_name='Estado')),
+                ('response_status', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Código de respuesta')),
+                ('response_body', models.JSONField(blank=True, null=True, verbose_name='Respuesta')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creado en')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='Expira en')),
+                ('incident', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='idempotency_keys', to='incident.incident', verbose_name='Incidente')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='incident_idempotency_keys', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Clave de idempotencia',
+                'verbose_name_plural': 'Claves de idempotencia',
+                'db_table': 'incident_idempotency_key',
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='unique_incident_idempotency_key_per_user')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0003_incidentidempotencykey'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='corroboration_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Corroboraciones'),
+        ),
+        migrations.AddField(
+            model_name='incident',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='corroborations', to='incident.incident', verbose_name='Duplicado de'),
+        ),
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['incident_type', 'is_active', '-reported_at'], name='incident_in_inciden_8eb0df_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0004_incident_corroboration_count_incident_duplicate_of_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingNotificationDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creado en')),
+                ('incident', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_digests', to='incident.incident', verbose_name='Incidente')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_notification_digests', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Notificación pendiente de resumen',
+                'verbose_name_plural': 'Notificaciones pendientes de resumen',
+                'db_table': 'incident_notification_digest',
+                'constraints': [models.UniqueConstraint(fields=('user', 'incident'), name='unique_pending_digest_per_user')],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0005_pendingnotificationdigest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentmedia',
+            name='display_file',
+            field=models.FileField(blank=True, null=True, upload_to='incidents/display/%Y/%m/%d/', verbose_name='Archivo optimizado'),
+        ),
+        migrations.AddField(
+            model_name='incidentmedia',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Alto'),
+        ),
+        migrations.AddField(
+            model_name='incidentmedia',
+            name='processed_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Fecha de procesamiento'),
+        ),
+        migrations.AddField(
+            model_name='incidentmedia',
+            name='processing_status',
+            field=models.CharField(choices=[('pending', 'Pendiente'), ('processed', 'Procesado'), ('failed', 'Fallido'), ('skipped', 'Omitido')], default='pending', max_length=20, verbose_name='Estado de procesamiento'),
+        ),
+        migrations.AddField(
+            model_name='incidentmedia',
+            name='thumbnail',
+            field=models.FileField(blank=True, null=True, upload_to='incidents/thumbnails/%Y/%m/%d/', verbose_name='Miniatura'),
+        ),
+        migrations.AddField(
+            model_name='incidentmedia',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Ancho'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:13
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0006_incidentmedia_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaUploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('media_type', models.CharField(choices=[('image', 'Imagen'), ('video', 'Video'), ('audio', 'Audio')], max_length=20, verbose_name='Tipo de medio')),
+                ('filename', models.CharField(max_length=255, verbose_name='Nombre de archivo')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Descripción')),
+                ('total_size', models.PositiveBigIntegerField(verbose_name='Tamaño total')),
+                ('received_bytes', models.PositiveBigIntegerField(default=0, verbose_name='Bytes recibidos')),
+                ('status', models.CharField(choices=[('uploading', 'Subiendo'), ('completed', 'Completado')], default='uploading', max_length=20, verbose_name='Estado')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creado en')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Actualizado en')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='Expira en')),
+                ('incident', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='media_upload_sessions', to='incident.incident', verbose_name='Incidente')),
+                ('media', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload_sessions', to='incident.incidentmedia', verbose_name='Archivo multimedia')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='media_upload_sessions', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Sesión de subida',
+                'verbose_name_plural': 'Sesiones de subida',
+                'db_table': 'incident_media_upload_session',
+            },
+        ),
+    ]
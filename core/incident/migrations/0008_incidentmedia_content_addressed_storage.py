@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:15
+
+import core.shared.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0007_media_upload_session'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='incidentmedia',
+            name='display_file',
+            field=models.FileField(blank=True, null=True, storage=core.shared.storage.ContentAddressedStorage(), upload_to='incidents/display/%Y/%m/%d/', verbose_name='Archivo optimizado'),
+        ),
+        migrations.AlterField(
+            model_name='incidentmedia',
+            name='file',
+            field=models.FileField(blank=True, null=True, storage=core.shared.storage.ContentAddressedStorage(), upload_to='incidents/%Y/%m/%d/', verbose_name='Archivo'),
+        ),
+        migrations.AlterField(
+            model_name='incidentmedia',
+            name='thumbnail',
+            field=models.FileField(blank=True, null=True, storage=core.shared.storage.ContentAddressedStorage(), upload_to='incidents/thumbnails/%Y/%m/%d/', verbose_name='Miniatura'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0002_communitymembership_role_permissions'),
+        ('incident', '0008_incidentmedia_content_addressed_storage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='community',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='incidents', to='community.community', verbose_name='Comunidad'),
+        ),
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['community', '-reported_at'], name='incident_community_rep_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:42
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_notifications_sent(apps, schema_editor):
+    IncidentNotification = apps.get_model('incident', 'IncidentNotification')
+    IncidentNotification.objects.filter(delivery_status='queued').update(
+        delivery_status='sent',
+        attempt_count=1,
+        last_attempt_at=F('notification_sent_at'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0009_incident_community'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentnotification',
+            name='attempt_count',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Intentos de envío'),
+        ),
+        migrations.AddField(
+            model_name='incidentnotification',
+            name='delivery_latency_ms',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Latencia de entrega (ms)'),
+        ),
+        migrations.AddField(
+            model_name='incidentnotification',
+            name='delivery_status',
+            field=models.CharField(choices=[('queued', 'En cola'), ('sent', 'Enviada'), ('failed', 'Fallida'), ('invalid_token', 'Token inválido'), ('no_token', 'Sin token')], default='queued', max_length=20, verbose_name='Estado de entrega'),
+        ),
+        migrations.AddField(
+            model_name='incidentnotification',
+            name='last_attempt_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Último intento'),
+        ),
+        migrations.RunPython(mark_existing_notifications_sent, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='incidentnotification',
+            index=models.Index(condition=models.Q(('delivery_status', 'failed')), fields=['incident', 'attempt_count'], name='incident_notif_failed_idx'),
+        ),
+    ]
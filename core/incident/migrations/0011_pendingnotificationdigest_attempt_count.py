@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0010_incidentnotification_delivery_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pendingnotificationdigest',
+            name='attempt_count',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Intentos de envío'),
+        ),
+    ]
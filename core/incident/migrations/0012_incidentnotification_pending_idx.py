@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0011_pendingnotificationdigest_attempt_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='incidentnotification',
+            name='incident_notif_failed_idx',
+        ),
+        migrations.AddIndex(
+            model_name='incidentnotification',
+            index=models.Index(condition=models.Q(('delivery_status__in', ['failed', 'queued'])), fields=['incident', 'attempt_count'], name='incident_notif_pending_idx'),
+        ),
+    ]
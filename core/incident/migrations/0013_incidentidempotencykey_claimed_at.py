@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:52
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident', '0012_incidentnotification_pending_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentidempotencykey',
+            name='claimed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Reclamado en'),
+        ),
+    ]
@@ -3,3 +3,6 @@ from .incident_status import *
 from .incident import *
 from .incident_media import *
 from .incident_comment import *
+from .incident_idempotency_key import *
+from .notification_digest import *
+from .media_upload_session import *
@@ -15,12 +15,17 @@ class Incident(BaseModel):
     title = models.CharField(max_length=200, verbose_name="Título")
     description = models.TextField(verbose_name="Descripción")
     location = gis_models.PointField(srid=4326, blank=True, null=True, verbose_name="Ubicación")
+    community = models.ForeignKey("community.Community", on_delete=models.SET_NULL, blank=True, null=True,
+                                  related_name="incidents", verbose_name="Comunidad")
     address = models.CharField(max_length=255, blank=True, null=True, verbose_name="Dirección")
     is_anonymous = models.BooleanField(default=False, verbose_name="Anónimo")
     severity_level = models.IntegerField(blank=True, null=True, verbose_name="Nivel de severidad")
     is_active = models.BooleanField(default=True, verbose_name="Activo")
     occurred_at = models.DateTimeField(blank=True, null=True, verbose_name="Fecha del suceso")
     reported_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha del reporte")
+    duplicate_of = models.ForeignKey("self", on_delete=models.SET_NULL, blank=True, null=True,
+                                     related_name="corroborations", verbose_name="Duplicado de")
+    corroboration_count = models.PositiveIntegerField(default=0, verbose_name="Corroboraciones")
 
     def __str__(self):
         return self.title
@@ -48,9 +53,15 @@ class Incident(BaseModel):
         item['occurred_at'] = self.occurred_at and self.occurred_at.isoformat() or None
         item['reported_at'] = self.reported_at.isoformat()
         item['address'] = self.address
+        item['duplicate_of'] = self.duplicate_of_id
+        item['corroboration_count'] = self.corroboration_count
+        item['media'] = [media.to_json_api() for media in self.media.all()]
 
         if current_user_id:
-            notification = self.notifications.filter(notified_user_id=current_user_id).first()
+            notification = self.notifications.filter(
+                notified_user_id=current_user_id,
+                delivery_status='sent'
+            ).first()
             item['was_notified'] = notification is not None
             item['notified_at'] = notification.notification_sent_at.isoformat() if notification else None
             item['was_read'] = notification.was_read if notification else False
@@ -64,10 +75,22 @@ class Incident(BaseModel):
     class Meta:
         verbose_name = "Incidente"
         verbose_name_plural = "Incidentes"
+        indexes = [
+            models.Index(fields=['incident_type', 'is_active', '-reported_at']),
+            models.Index(fields=['community', '-reported_at'], name='incident_community_rep_idx'),
+        ]
 
 
 
 class IncidentNotification(models.Model):
+    DELIVERY_STATUS_CHOICES = [
+        ('queued', 'En cola'),
+        ('sent', 'Enviada'),
+        ('failed', 'Fallida'),
+        ('invalid_token', 'Token inválido'),
+        ('no_token', 'Sin token'),
+    ]
+
     incident = models.ForeignKey(
         Incident,
         on_delete=models.CASCADE,
@@ -93,6 +116,26 @@ class IncidentNotification(models.Model):
         blank=True,
         verbose_name="Fecha de lectura"
     )
+    delivery_status = models.CharField(
+        max_length=20,
+        choices=DELIVERY_STATUS_CHOICES,
+        default='queued',
+        verbose_name="Estado de entrega"
+    )
+    attempt_count = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Intentos de envío"
+    )
+    last_attempt_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Último intento"
+    )
+    delivery_latency_ms = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="Latencia de entrega (ms)"
+    )
 
     class Meta:
         db_table = "incident_notification"
@@ -102,6 +145,11 @@ class IncidentNotification(models.Model):
         indexes = [
             models.Index(fields=['notified_user', '-notification_sent_at']),
             models.Index(fields=['incident', 'notified_user']),
+            models.Index(
+                fields=['incident', 'attempt_count'],
+                condition=models.Q(delivery_status__in=['failed', 'queued']),
+                name='incident_notif_pending_idx'
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -0,0 +1 @@
+from .incident_idempotency_key import *
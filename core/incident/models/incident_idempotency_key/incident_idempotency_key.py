@@ -0,0 +1,49 @@
+from django.db import models
+from django.utils import timezone
+
+from core.authentication.models import User
+from core.incident.models.incident.incident import Incident
+
+
+class IncidentIdempotencyKey(models.Model):
+    STATUS_CHOICES = [
+        ("processing", "En proceso"),
+        ("completed", "Completado"),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="incident_idempotency_keys",
+        verbose_name="Usuario"
+    )
+    key = models.CharField(max_length=255, verbose_name="Clave de idempotencia")
+    request_fingerprint = models.CharField(max_length=64, verbose_name="Huella de la petición")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="processing", verbose_name="Estado")
+    incident = models.ForeignKey(
+        Incident,
+        on_delete=models.SET_NULL,
+        related_name="idempotency_keys",
+        blank=True,
+        null=True,
+        verbose_name="Incidente"
+    )
+    response_status = models.PositiveSmallIntegerField(blank=True, null=True, verbose_name="Código de respuesta")
+    response_body = models.JSONField(blank=True, null=True, verbose_name="Respuesta")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creado en")
+    claimed_at = models.DateTimeField(default=timezone.now, verbose_name="Reclamado en")
+    expires_at = models.DateTimeField(db_index=True, verbose_name="Expira en")
+
+    class Meta:
+        db_table = "incident_idempotency_key"
+        verbose_name = "Clave de idempotencia"
+        verbose_name_plural = "Claves de idempotencia"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"],
+                name="unique_incident_idempotency_key_per_user"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.key}"
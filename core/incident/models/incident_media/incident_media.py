@@ -1,6 +1,8 @@
 from django.db import models
+from django.urls import reverse
 
 from core.incident.models.incident.incident import Incident
+from core.shared.storage import content_addressed_storage
 
 
 class IncidentMedia(models.Model):
@@ -10,12 +12,50 @@ class IncidentMedia(models.Model):
         ("audio", "Audio"),
     ]
 
+    PROCESSING_STATUS_CHOICES = [
+        ("pending", "Pendiente"),
+        ("processed", "Procesado"),
+        ("failed", "Fallido"),
+        ("skipped", "Omitido"),
+    ]
+
     incident = models.ForeignKey(Incident, on_delete=models.CASCADE, related_name="media", verbose_name="Incidente")
     media_type = models.CharField(max_length=20, choices=MEDIA_TYPE_CHOICES, verbose_name="Tipo de medio")
-    file = models.FileField(upload_to='incidents/%Y/%m/%d/', verbose_name="Archivo" , null=True, blank=True)
+    file = models.FileField(upload_to='incidents/%Y/%m/%d/', storage=content_addressed_storage,
+                            verbose_name="Archivo" , null=True, blank=True)
+    display_file = models.FileField(upload_to='incidents/display/%Y/%m/%d/', storage=content_addressed_storage,
+                                    null=True, blank=True, verbose_name="Archivo optimizado")
+    thumbnail = models.FileField(upload_to='incidents/thumbnails/%Y/%m/%d/', storage=content_addressed_storage,
+                                 null=True, blank=True, verbose_name="Miniatura")
+    width = models.PositiveIntegerField(blank=True, null=True, verbose_name="Ancho")
+    height = models.PositiveIntegerField(blank=True, null=True, verbose_name="Alto")
+    processing_status = models.CharField(max_length=20, choices=PROCESSING_STATUS_CHOICES, default="pending",
+                                         verbose_name="Estado de procesamiento")
+    processed_at = models.DateTimeField(blank=True, null=True, verbose_name="Fecha de procesamiento")
     description = models.TextField(blank=True, null=True, verbose_name="Descripción")
     uploaded_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de subida")
 
+    def get_file_url(self, variant='display'):
+        return f"{reverse('incident:api_incident_media_file', args=[self.id])}?variant={variant}"
+
+    @property
+    def display_url(self):
+        return self.get_file_url('display') if self.file else None
+
+    @property
+    def thumbnail_url(self):
+        return self.get_file_url('thumbnail') if self.thumbnail else None
+
+    def to_json_api(self):
+        item = dict()
+        item['id'] = self.id
+        item['media_type'] = self.media_type
+        item['url'] = self.display_url
+        item['thumbnail_url'] = self.thumbnail_url
+        item['width'] = self.width
+        item['height'] = self.height
+        return item
+
     class Meta:
         verbose_name = "Archivo multimedia"
         verbose_name_plural = "Archivos multimedia"
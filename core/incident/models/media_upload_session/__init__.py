@@ -0,0 +1 @@
+from .media_upload_session import *
@@ -0,0 +1,53 @@
+import uuid
+
+from django.db import models
+
+from core.authentication.models import User
+from core.incident.models.incident.incident import Incident
+from core.incident.models.incident_media.incident_media import IncidentMedia
+
+
+class MediaUploadSession(models.Model):
+    STATUS_CHOICES = [
+        ("uploading", "Subiendo"),
+        ("completed", "Completado"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="media_upload_sessions",
+        verbose_name="Usuario"
+    )
+    incident = models.ForeignKey(
+        Incident,
+        on_delete=models.CASCADE,
+        related_name="media_upload_sessions",
+        verbose_name="Incidente"
+    )
+    media = models.ForeignKey(
+        IncidentMedia,
+        on_delete=models.SET_NULL,
+        related_name="upload_sessions",
+        blank=True,
+        null=True,
+        verbose_name="Archivo multimedia"
+    )
+    media_type = models.CharField(max_length=20, choices=IncidentMedia.MEDIA_TYPE_CHOICES, verbose_name="Tipo de medio")
+    filename = models.CharField(max_length=255, verbose_name="Nombre de archivo")
+    description = models.TextField(blank=True, null=True, verbose_name="Descripción")
+    total_size = models.PositiveBigIntegerField(verbose_name="Tamaño total")
+    received_bytes = models.PositiveBigIntegerField(default=0, verbose_name="Bytes recibidos")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="uploading", verbose_name="Estado")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creado en")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Actualizado en")
+    expires_at = models.DateTimeField(db_index=True, verbose_name="Expira en")
+
+    class Meta:
+        db_table = "incident_media_upload_session"
+        verbose_name = "Sesión de subida"
+        verbose_name_plural = "Sesiones de subida"
+
+    def __str__(self):
+        return f"{self.id} - {self.filename}"
@@ -0,0 +1,35 @@
+from django.db import models
+
+from core.authentication.models import User
+from core.incident.models.incident.incident import Incident
+
+
+class PendingNotificationDigest(models.Model):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='pending_notification_digests',
+        verbose_name="Usuario"
+    )
+    incident = models.ForeignKey(
+        Incident,
+        on_delete=models.CASCADE,
+        related_name='pending_digests',
+        verbose_name="Incidente"
+    )
+    attempt_count = models.PositiveSmallIntegerField(default=0, verbose_name="Intentos de envío")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creado en")
+
+    class Meta:
+        db_table = "incident_notification_digest"
+        verbose_name = "Notificación pendiente de resumen"
+        verbose_name_plural = "Notificaciones pendientes de resumen"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'incident'],
+                name='unique_pending_digest_per_user'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.incident_id}"
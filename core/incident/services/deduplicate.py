@@ -0,0 +1,53 @@
+import logging
+import math
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.gis.db.models.functions import Distance as DistanceFunc
+from django.contrib.gis.measure import D
+from django.db.models import F
+from django.utils import timezone
+
+from core.incident.models import Incident
+
+logger = logging.getLogger(__name__)
+
+METERS_PER_DEGREE = 111320
+
+
+class IncidentDeduplicator:
+
+    def __init__(self, radius_meters=None, window_minutes=None):
+        self.radius_meters = radius_meters or settings.INCIDENT_DEDUP_RADIUS_METERS
+        self.window_minutes = window_minutes or settings.INCIDENT_DEDUP_WINDOW_MINUTES
+
+    def search_degrees(self, point):
+        cos_latitude = max(math.cos(math.radians(point.y)), 0.01)
+        return self.radius_meters / (METERS_PER_DEGREE * cos_latitude)
+
+    def find_primary(self, incident_type, point):
+        if point is None:
+            return None
+
+        since = timezone.now() - timedelta(minutes=self.window_minutes)
+        primary = Incident.objects.filter(
+            incident_type=incident_type,
+            is_active=True,
+            duplicate_of__isnull=True,
+            reported_at__gte=since,
+            location__dwithin=(point, self.search_degrees(point))
+        ).filter(
+            location__distance_lte=(point, D(m=self.radius_meters))
+        ).annotate(
+            distance=DistanceFunc('location', point)
+        ).order_by('distance', '-reported_at').first()
+
+        if primary:
+            logger.info(
+                f"Incidente duplicado detectado: {incident_type} a menos de {self.radius_meters}m "
+                f"del incidente {primary.id}"
+            )
+        return primary
+
+    def add_corroboration(self, primary):
+        Incident.objects.filter(pk=primary.pk).update(corroboration_count=F('corroboration_count') + 1)
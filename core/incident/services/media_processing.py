@@ -0,0 +1,112 @@
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from core.incident.models import IncidentMedia
+
+logger = logging.getLogger(__name__)
+
+
+class IncidentMediaProcessor:
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self):
+        self.display_max_px = settings.INCIDENT_MEDIA_DISPLAY_MAX_PX
+        self.thumbnail_max_px = settings.INCIDENT_MEDIA_THUMBNAIL_MAX_PX
+        self.quality = settings.INCIDENT_MEDIA_QUALITY
+
+    @classmethod
+    def _get_executor(cls):
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='incident-media')
+            return cls._executor
+
+    def schedule(self, media_id):
+        if settings.INCIDENT_MEDIA_ASYNC_PROCESSING:
+            transaction.on_commit(lambda: self._get_executor().submit(self._process_in_background, media_id))
+        else:
+            transaction.on_commit(lambda: self.process_by_id(media_id))
+
+    def _process_in_background(self, media_id):
+        try:
+            self.process_by_id(media_id)
+        finally:
+            connection.close()
+
+    def process_by_id(self, media_id):
+        media = IncidentMedia.objects.filter(pk=media_id).first()
+        if media is None:
+            logger.warning(f"Archivo multimedia {media_id} no encontrado para procesar")
+            return None
+        return self.process(media)
+
+    def process(self, media):
+        if media.media_type != 'image' or not media.file:
+            IncidentMedia.objects.filter(pk=media.pk).update(processing_status='skipped')
+            return media
+
+        try:
+            with media.file.open('rb') as source:
+                image = Image.open(source)
+                image.load()
+            image = ImageOps.exif_transpose(image)
+
+            image_format, extension = self._output_format()
+            base_name = os.path.splitext(os.path.basename(media.file.name))[0]
+            previous_variants = [name for name in (media.display_file.name, media.thumbnail.name) if name]
+
+            media.display_file.save(
+                f"{base_name}.{extension}",
+                ContentFile(self._render(image, self.display_max_px, image_format)),
+                save=False
+            )
+            media.thumbnail.save(
+                f"{base_name}_thumb.{extension}",
+                ContentFile(self._render(image, self.thumbnail_max_px, image_format)),
+                save=False
+            )
+            media.width, media.height = image.size
+            media.processing_status = 'processed'
+            media.processed_at = timezone.now()
+            media.save(update_fields=[
+                'display_file', 'thumbnail', 'width', 'height', 'processing_status', 'processed_at'
+            ])
+            for name in previous_variants:
+                media.display_file.storage.delete(name)
+            logger.info(f"Imagen {media.id} procesada: {media.width}x{media.height}")
+        except Exception as e:
+            logger.error(f"Error al procesar imagen {media.id}: {str(e)}")
+            IncidentMedia.objects.filter(pk=media.pk).update(processing_status='failed')
+            media.processing_status = 'failed'
+        return media
+
+    @staticmethod
+    def _output_format():
+        if features.check('webp'):
+            return 'WEBP', 'webp'
+        return 'JPEG', 'jpg'
+
+    def _render(self, image, max_px, image_format):
+        variant = image.copy()
+        variant.thumbnail((max_px, max_px), Image.Resampling.LANCZOS)
+        if image_format == 'JPEG' or variant.mode not in ('RGB', 'RGBA'):
+            variant = variant.convert('RGBA' if image_format == 'WEBP' and 'A' in variant.getbands() else 'RGB')
+
+        output = io.BytesIO()
+        options = {'quality': self.quality, 'optimize': True}
+        if image_format == 'JPEG':
+            options['progressive'] = True
+        else:
+            options['method'] = 4
+        variant.save(output, format=image_format, **options)
+        return output.getvalue()
@@ -0,0 +1,83 @@
+import logging
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from core.incident.models import IncidentNotification
+from core.incident.services.notification_unread import UnreadNotificationCounter
+
+logger = logging.getLogger(__name__)
+
+PENDING_STATUSES = ('queued', 'failed')
+DELIVERY_FIELDS = ['delivery_status', 'attempt_count', 'last_attempt_at', 'delivery_latency_ms']
+
+
+class NotificationDeliveryTracker:
+
+    def __init__(self, batch_size=500):
+        self.batch_size = batch_size
+
+    def queue(self, incident, user_ids):
+        existing_ids = set(
+            IncidentNotification.objects.filter(incident=incident, notified_user_id__in=user_ids)
+            .values_list('notified_user_id', flat=True)
+        )
+        new_ids = [user_id for user_id in user_ids if user_id not in existing_ids]
+        IncidentNotification.objects.bulk_create(
+            [IncidentNotification(incident=incident, notified_user_id=user_id) for user_id in new_ids],
+            ignore_conflicts=True,
+            batch_size=self.batch_size
+        )
+
+        notifications = IncidentNotification.objects.filter(
+            incident=incident,
+            notified_user_id__in=user_ids,
+            delivery_status__in=PENDING_STATUSES
+        ).only('id', 'notified_user_id', 'notification_sent_at', *DELIVERY_FIELDS)
+        return {notification.notified_user_id: notification for notification in notifications}
+
+    def record(self, notifications, user_results):
+        attempted_at = timezone.now()
+        statuses = Counter()
+        delivered_user_ids = []
+        for notification in notifications:
+            status = user_results.get(notification.notified_user_id, 'no_token')
+            if status == 'sent' and notification.delivery_status != 'sent':
+                delivered_user_ids.append(notification.notified_user_id)
+            notification.delivery_status = status
+            notification.attempt_count += 1
+            notification.last_attempt_at = attempted_at
+            if status == 'sent' and notification.delivery_latency_ms is None:
+                elapsed = attempted_at - notification.notification_sent_at
+                notification.delivery_latency_ms = max(int(elapsed.total_seconds() * 1000), 0)
+            statuses[status] += 1
+
+        IncidentNotification.objects.bulk_update(notifications, DELIVERY_FIELDS, batch_size=self.batch_size)
+        UnreadNotificationCounter().increment(delivered_user_ids)
+        return dict(statuses)
+
+    def failed(self, max_attempts):
+        stale_before = timezone.now() - timedelta(minutes=settings.INCIDENT_NOTIFICATION_QUEUED_STALE_MINUTES)
+        return IncidentNotification.objects.filter(
+            Q(delivery_status='failed') |
+            Q(delivery_status='queued', last_attempt_at__isnull=True, notification_sent_at__lt=stale_before),
+            attempt_count__lt=max_attempts,
+            incident__is_active=True
+        )
+
+    def failed_incident_ids(self, max_attempts):
+        return list(
+            self.failed(max_attempts).order_by('incident_id')
+            .values_list('incident_id', flat=True).distinct()
+        )
+
+    def failed_for_incident(self, incident_id, max_attempts):
+        return list(
+            self.failed(max_attempts).filter(incident_id=incident_id)
+            .select_related('notified_user')
+            .only('id', 'notified_user__id', 'notification_sent_at', *DELIVERY_FIELDS)
+            [:self.batch_size]
+        )
@@ -0,0 +1,125 @@
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from core.authentication.models import FCMToken
+from core.incident.models import IncidentNotification, PendingNotificationDigest
+from core.incident.services.notification_unread import UnreadNotificationCounter
+from core.incident.utils.FCM_notification import FCMNotificationUtils
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDigestSender:
+
+    def __init__(self, max_attempts=None):
+        self.max_attempts = max_attempts or settings.NOTIFICATION_DIGEST_MAX_ATTEMPTS
+
+    def send_pending(self, batch_size=500):
+        totals = {'users': 0, 'incidents': 0, 'success': 0, 'failed': 0}
+        last_user_id = 0
+        while True:
+            user_ids = list(
+                PendingNotificationDigest.objects.filter(user_id__gt=last_user_id).order_by('user_id')
+                .values_list('user_id', flat=True).distinct()[:batch_size]
+            )
+            if not user_ids:
+                break
+            last_user_id = user_ids[-1]
+            batch = self._send_batch(user_ids)
+            for key in totals:
+                totals[key] += batch[key]
+
+        logger.info(f"Resumen de notificaciones enviado: {totals}")
+        return totals
+
+    def _send_batch(self, user_ids):
+        entries = list(
+            PendingNotificationDigest.objects.filter(user_id__in=user_ids)
+            .values_list('id', 'user_id', 'incident_id', 'incident__is_active')
+        )
+        incidents_by_user = defaultdict(list)
+        entries_by_user = defaultdict(list)
+        done_entry_ids = []
+        for entry_id, user_id, incident_id, is_active in entries:
+            if is_active:
+                incidents_by_user[user_id].append(incident_id)
+                entries_by_user[user_id].append(entry_id)
+            else:
+                done_entry_ids.append(entry_id)
+
+        tokens_by_user = defaultdict(list)
+        for user_id, token in FCMToken.objects.filter(
+                user_id__in=incidents_by_user.keys(),
+                is_active=True
+        ).values_list('user_id', 'token'):
+            tokens_by_user[user_id].append(token)
+
+        result = {'users': 0, 'incidents': 0, 'success': 0, 'failed': 0}
+        notifications_to_create = []
+        delivered_user_ids = set()
+        undelivered_entry_ids = []
+        for user_id, incident_ids in incidents_by_user.items():
+            tokens = tokens_by_user.get(user_id)
+            if not tokens:
+                undelivered_entry_ids.extend(entries_by_user[user_id])
+                continue
+            send_result = FCMNotificationUtils.send_notification_to_tokens(
+                tokens=tokens,
+                title="⚠️ Nuevas alertas cerca de ti",
+                body=self._build_body(len(incident_ids)),
+                data={
+                    'incident_ids': ','.join(str(incident_id) for incident_id in incident_ids),
+                    'click_action': 'OPEN_INCIDENT_LIST'
+                }
+            )
+            result['success'] += send_result['success']
+            result['failed'] += send_result['failed']
+            status = FCMNotificationUtils.user_status(tokens, send_result.get('token_results', {}))
+            if status == 'invalid_token':
+                undelivered_entry_ids.extend(entries_by_user[user_id])
+                continue
+            done_entry_ids.extend(entries_by_user[user_id])
+            if status == 'sent':
+                result['users'] += 1
+                result['incidents'] += len(incident_ids)
+                delivered_user_ids.add(user_id)
+            attempted_at = timezone.now()
+            notifications_to_create.extend(
+                IncidentNotification(
+                    incident_id=incident_id,
+                    notified_user_id=user_id,
+                    delivery_status=status,
+                    attempt_count=1,
+                    last_attempt_at=attempted_at
+                )
+                for incident_id in incident_ids
+            )
+
+        if notifications_to_create:
+            IncidentNotification.objects.bulk_create(notifications_to_create, ignore_conflicts=True)
+            UnreadNotificationCounter().invalidate(delivered_user_ids)
+
+        PendingNotificationDigest.objects.filter(id__in=done_entry_ids).delete()
+        self._keep_for_next_run(undelivered_entry_ids)
+        return result
+
+    def _keep_for_next_run(self, entry_ids):
+        if not entry_ids:
+            return
+        PendingNotificationDigest.objects.filter(id__in=entry_ids).update(attempt_count=F('attempt_count') + 1)
+        expired, _ = PendingNotificationDigest.objects.filter(
+            id__in=entry_ids,
+            attempt_count__gte=self.max_attempts
+        ).delete()
+        if expired:
+            logger.warning(f"Se descartaron {expired} entradas de resumen tras {self.max_attempts} intentos fallidos")
+
+    @staticmethod
+    def _build_body(total):
+        if total == 1:
+            return "Se reportó 1 incidente cerca de tu ubicación."
+        return f"Se reportaron {total} incidentes cerca de tu ubicación."
@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationRateLimiter:
+    KEY_PREFIX = 'notif_bucket'
+    LOCAL_MAX_ENTRIES = 10000
+
+    _local_buckets = {}
+    _local_lock = threading.Lock()
+
+    def __init__(self, capacity=None, refill_seconds=None):
+        self.capacity = capacity or settings.NOTIFICATION_RATE_LIMIT_CAPACITY
+        self.refill_seconds = refill_seconds or settings.NOTIFICATION_RATE_LIMIT_REFILL_SECONDS
+        self.timeout = int(self.capacity * self.refill_seconds)
+
+    def _key(self, user_id):
+        return f'{self.KEY_PREFIX}:{user_id}'
+
+    def _available_tokens(self, state, now):
+        if state is None:
+            return float(self.capacity)
+        tokens, updated_at = state
+        elapsed = max(0.0, now - updated_at)
+        return min(float(self.capacity), tokens + elapsed / self.refill_seconds)
+
+    def partition(self, user_ids):
+        now = time.time()
+        keys = {user_id: self._key(user_id) for user_id in user_ids}
+        states = self._get_many(list(keys.values()))
+
+        allowed, limited = [], []
+        new_states = {}
+        for user_id, key in keys.items():
+            tokens = self._available_tokens(states.get(key), now)
+            if tokens >= 1:
+                tokens -= 1
+                allowed.append(user_id)
+            else:
+                limited.append(user_id)
+            new_states[key] = (round(tokens, 3), round(now, 1))
+
+        self._set_many(new_states)
+        return allowed, limited
+
+    def _get_many(self, keys):
+        try:
+            return cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Cache no disponible, usando limitador local: {str(e)}")
+            with self._local_lock:
+                return {key: self._local_buckets[key] for key in keys if key in self._local_buckets}
+
+    def _set_many(self, states):
+        try:
+            cache.set_many(states, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Cache no disponible, usando limitador local: {str(e)}")
+            with self._local_lock:
+                if len(self._local_buckets) > self.LOCAL_MAX_ENTRIES:
+                    self._prune_local()
+                self._local_buckets.update(states)
+
+    def _prune_local(self):
+        expired_before = time.time() - self.timeout
+        for key in [key for key, (_, updated_at) in self._local_buckets.items() if updated_at < expired_before]:
+            del self._local_buckets[key]
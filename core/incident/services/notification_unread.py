@@ -0,0 +1,63 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.incident.models import IncidentNotification
+from core.shared.cache import is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+
+class UnreadNotificationCounter:
+    KEY_PREFIX = 'notif_unread'
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout or settings.INCIDENT_NOTIFICATION_UNREAD_CACHE_SECONDS
+        self.enabled = is_shared_cache()
+
+    @staticmethod
+    def unread(user_id):
+        return IncidentNotification.objects.filter(
+            notified_user_id=user_id,
+            delivery_status='sent',
+            was_read=False
+        )
+
+    def _key(self, user_id):
+        return f'{self.KEY_PREFIX}:{user_id}'
+
+    def get(self, user_id):
+        if not self.enabled:
+            return self.unread(user_id).count()
+
+        key = self._key(user_id)
+        count = cache.get(key)
+        if count is None:
+            count = self.unread(user_id).count()
+            cache.set(key, count, self.timeout)
+        return count
+
+    def increment(self, user_ids, delta=1):
+        if not self.enabled:
+            return
+        for user_id in user_ids:
+            try:
+                cache.incr(self._key(user_id), delta)
+            except ValueError:
+                pass
+
+    def decrement(self, user_id, delta):
+        if not self.enabled or not delta:
+            return
+        key = self._key(user_id)
+        try:
+            if cache.decr(key, delta) < 0:
+                cache.delete(key)
+        except ValueError:
+            pass
+
+    def invalidate(self, user_ids):
+        keys = [self._key(user_id) for user_id in user_ids]
+        if self.enabled and keys:
+            cache.delete_many(keys)
@@ -1,6 +1,10 @@
 import logging
 
-from core.incident.models import IncidentNotification
+from django.conf import settings
+
+from core.incident.models import Incident, PendingNotificationDigest
+from core.incident.services.notification_delivery import NotificationDeliveryTracker
+from core.incident.services.notification_throttle import NotificationRateLimiter
 from core.incident.utils.FCM_notification import FCMNotificationUtils
 from core.incident.utils.location import LocationUtils
 
@@ -18,39 +22,28 @@ class NearbyUsersNotifier():
                 logger.info("No hay usuarios cercanos para notificar")
                 return
 
-            incident_type = getattr(incident, "incident_type", "incidente")
-            incident_type_lower = str(incident_type).lower()
-
-            title_map = {
-                "robo": "🚨 Alerta de Robo Cercano",
-                "asalto": "🚨 Alerta de Asalto Cercano",
-                "accidente": "🚑 Accidente de Tránsito Cercano",
-                "emergencia": "🆘 Emergencia Médica Cercana",
-                "medico": "🆘 Emergencia Médica Cercana",
-                "incendio": "🔥 Alerta de Incendio Cercano",
-                "seguridad": "🛡️ Alerta de Seguridad en tu Zona",
-            }
-
-            body_map = {
-                "robo": "Se ha reportado un posible robo cerca de tu ubicación. Mantente alerta.",
-                "asalto": "Se ha reportado un asalto en tu zona. Evita transitar por el área.",
-                "accidente": "Se registró un accidente de tránsito a menos de 2 km de tu ubicación.",
-                "emergencia": "Se ha reportado una emergencia médica cercana.",
-                "medico": "Atención: emergencia médica registrada en tu sector.",
-                "incendio": "Se reporta un posible incendio cerca de tu ubicación. Toma precauciones.",
-                "seguridad": "Se ha reportado una situación de seguridad en tu zona. Permanece atento y toma precauciones.",
-            }
-
-            title = title_map.get(incident_type_lower, "⚠️ Incidente Cercano")
-            body = body_map.get(incident_type_lower, "Se detectó un incidente cerca de tu ubicación.")
-
-            notification_data = {
-                'incident_id': str(incident.id),
-                'incident_type': str(incident.incident_type),
-                'latitude': str(latitude),
-                'longitude': str(longitude),
-                'click_action': 'OPEN_INCIDENT_DETAIL'
-            }
+            allowed_ids, limited_ids = NotificationRateLimiter().partition([user.id for user in nearby_users])
+            if limited_ids:
+                PendingNotificationDigest.objects.bulk_create(
+                    [PendingNotificationDigest(incident=incident, user_id=user_id) for user_id in limited_ids],
+                    ignore_conflicts=True
+                )
+                logger.info(f"{len(limited_ids)} usuarios superaron el límite, se enviará en el resumen")
+
+            allowed_ids = set(allowed_ids)
+            nearby_users = [user for user in nearby_users if user.id in allowed_ids]
+            if not nearby_users:
+                logger.info("Todos los usuarios cercanos superaron el límite de notificaciones")
+                return
+
+            tracker = NotificationDeliveryTracker()
+            pending = tracker.queue(incident, [user.id for user in nearby_users])
+            nearby_users = [user for user in nearby_users if user.id in pending]
+            if not nearby_users:
+                logger.info("Todos los usuarios cercanos ya fueron notificados")
+                return
+
+            title, body, notification_data = self.build_message(incident, latitude, longitude)
 
             result = FCMNotificationUtils.send_notification_to_users(
                 users=nearby_users,
@@ -59,26 +52,80 @@ class NearbyUsersNotifier():
                 data=notification_data
             )
 
-            notifications_to_create = []
-            for user in nearby_users:
-                notifications_to_create.append(
-                    IncidentNotification(
-                        incident=incident,
-                        notified_user=user
-                    )
-                )
-
-            if notifications_to_create:
-                IncidentNotification.objects.bulk_create(
-                    notifications_to_create,
-                    ignore_conflicts=True
-                )
+            statuses = tracker.record(list(pending.values()), result.get('user_results', {}))
 
             logger.info(
                 f"Notificaciones enviadas - Exitosas: {result['success']}, "
                 f"Fallidas: {result['failed']}, "
-                f"Registros guardados: {len(notifications_to_create)}"
+                f"Estados de entrega: {statuses}"
             )
 
         except Exception as e:
             logger.error(f"Error al notificar usuarios cercanos: {str(e)}")
+
+    def build_message(self, incident, latitude, longitude):
+        incident_type = getattr(incident, "incident_type", "incidente")
+        incident_type_lower = str(incident_type).lower()
+
+        title_map = {
+            "robo": "🚨 Alerta de Robo Cercano",
+            "asalto": "🚨 Alerta de Asalto Cercano",
+            "accidente": "🚑 Accidente de Tránsito Cercano",
+            "emergencia": "🆘 Emergencia Médica Cercana",
+            "medico": "🆘 Emergencia Médica Cercana",
+            "incendio": "🔥 Alerta de Incendio Cercano",
+            "seguridad": "🛡️ Alerta de Seguridad en tu Zona",
+        }
+
+        body_map = {
+            "robo": "Se ha reportado un posible robo cerca de tu ubicación. Mantente alerta.",
+            "asalto": "Se ha reportado un asalto en tu zona. Evita transitar por el área.",
+            "accidente": "Se registró un accidente de tránsito a menos de 2 km de tu ubicación.",
+            "emergencia": "Se ha reportado una emergencia médica cercana.",
+            "medico": "Atención: emergencia médica registrada en tu sector.",
+            "incendio": "Se reporta un posible incendio cerca de tu ubicación. Toma precauciones.",
+            "seguridad": "Se ha reportado una situación de seguridad en tu zona. Permanece atento y toma precauciones.",
+        }
+
+        title = title_map.get(incident_type_lower, "⚠️ Incidente Cercano")
+        body = body_map.get(incident_type_lower, "Se detectó un incidente cerca de tu ubicación.")
+
+        notification_data = {
+            'incident_id': str(incident.id),
+            'incident_type': str(incident.incident_type),
+            'latitude': str(latitude),
+            'longitude': str(longitude),
+            'click_action': 'OPEN_INCIDENT_DETAIL'
+        }
+
+        return title, body, notification_data
+
+    def retry_failed(self, max_attempts=None):
+        max_attempts = max_attempts or settings.INCIDENT_NOTIFICATION_MAX_ATTEMPTS
+        tracker = NotificationDeliveryTracker()
+        totals = {'incidents': 0, 'retried': 0, 'sent': 0}
+
+        for incident_id in tracker.failed_incident_ids(max_attempts):
+            incident = Incident.objects.select_related('incident_type').get(id=incident_id)
+            if not incident.location:
+                continue
+
+            notifications = tracker.failed_for_incident(incident_id, max_attempts)
+            if not notifications:
+                continue
+
+            title, body, notification_data = self.build_message(incident, incident.location.y, incident.location.x)
+            result = FCMNotificationUtils.send_notification_to_users(
+                users=[notification.notified_user for notification in notifications],
+                title=title,
+                body=body,
+                data=notification_data
+            )
+            statuses = tracker.record(notifications, result.get('user_results', {}))
+
+            totals['incidents'] += 1
+            totals['retried'] += len(notifications)
+            totals['sent'] += statuses.get('sent', 0)
+
+        logger.info(f"Reintento de notificaciones fallidas: {totals}")
+        return totals
@@ -0,0 +1,18 @@
+import logging
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from core.incident.models import IncidentMedia
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_delete, sender=IncidentMedia)
+def release_incident_media_files(sender, instance, **kwargs):
+    for field_file in (instance.file, instance.display_file, instance.thumbnail):
+        if field_file:
+            try:
+                field_file.storage.delete(field_file.name)
+            except Exception as e:
+                logger.error(f"Error al liberar archivo {field_file.name}: {str(e)}")
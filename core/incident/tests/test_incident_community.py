@@ -0,0 +1,70 @@
+import secrets
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.community.models import Community
+from core.incident.api.incident.feature.incident import CreateIncidentFeature
+from core.incident.models import Incident, IncidentStatus, IncidentType
+
+User = get_user_model()
+
+
+class IncidentCommunityTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='neighbor',
+            email='neighbor@example.com',
+            password=secrets.token_urlsafe(32),
+            dni='2020202020'
+        )
+        self.point = Point(-77.0428, -12.0464, srid=4326)
+        self.community = Community.objects.create(name='Centro', boundary_area=self.point.buffer(0.01))
+
+    def _incident(self, location):
+        return Incident.objects.create(
+            reported_by_user=self.user,
+            incident_type=IncidentType.objects.get_or_create(name='Robo', code='robo')[0],
+            incident_status=IncidentStatus.objects.get_or_create(name='Reported', code='reported')[0],
+            title='Robo',
+            description='',
+            location=location,
+        )
+
+    def test_new_incident_is_tagged_with_containing_community(self):
+        incident = CreateIncidentFeature(
+            data={'type': 'Robo', 'latitude': -12.0464, 'longitude': -77.0428},
+            user=self.user
+        ).save_incident()
+
+        self.assertEqual(incident.community, self.community)
+
+    def test_incident_outside_communities_has_no_community(self):
+        incident = CreateIncidentFeature(
+            data={'type': 'Robo', 'latitude': 10.0, 'longitude': 10.0},
+            user=self.user
+        ).save_incident()
+
+        self.assertIsNone(incident.community)
+
+    def test_backfill_tags_existing_incidents(self):
+        inside = self._incident(self.point)
+        outside = self._incident(Point(10.0, 10.0, srid=4326))
+        without_location = self._incident(None)
+
+        out = StringIO()
+        call_command('backfill_incident_communities', batch_size=1, stdout=out)
+
+        inside.refresh_from_db()
+        outside.refresh_from_db()
+        without_location.refresh_from_db()
+        self.assertEqual(inside.community, self.community)
+        self.assertIsNone(outside.community)
+        self.assertIsNone(without_location.community)
+        self.assertIn('Incidentes revisados: 2, con comunidad asignada: 1', out.getvalue())
@@ -0,0 +1,127 @@
+import json
+import secrets
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import Point
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.incident.api.incident.feature.incident import CreateIncidentFeature
+from core.incident.api.incident.views.incident import RegisterIncidentApiView
+from core.incident.models import Incident, IncidentType, IncidentStatus
+from core.incident.services.deduplicate import IncidentDeduplicator
+
+User = get_user_model()
+
+
+class IncidentDeduplicatorTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='dedup',
+            email='dedup@test.com',
+            password=secrets.token_urlsafe(32),
+            dni='7777777777'
+        )
+        self.incendio = IncidentType.objects.create(name='Incendio', code='incendio')
+        self.robo = IncidentType.objects.create(name='Robo', code='robo')
+        self.status = IncidentStatus.objects.create(name='Reported', code='reported')
+        self.point = Point(-77.0428, -12.0464, srid=4326)
+        self.primary = Incident.objects.create(
+            reported_by_user=self.user,
+            incident_type=self.incendio,
+            incident_status=self.status,
+            title='Incendio',
+            description='',
+            location=self.point,
+        )
+
+    def test_finds_primary_of_same_type_nearby(self):
+        nearby = Point(-77.0429, -12.0465, srid=4326)
+
+        primary = IncidentDeduplicator(radius_meters=150, window_minutes=30).find_primary(self.incendio, nearby)
+
+        self.assertEqual(primary, self.primary)
+
+    def test_ignores_other_incident_types(self):
+        primary = IncidentDeduplicator(radius_meters=150, window_minutes=30).find_primary(self.robo, self.point)
+
+        self.assertIsNone(primary)
+
+    def test_ignores_incidents_out_of_radius(self):
+        far = Point(-77.0628, -12.0464, srid=4326)
+
+        primary = IncidentDeduplicator(radius_meters=150, window_minutes=30).find_primary(self.incendio, far)
+
+        self.assertIsNone(primary)
+
+    def test_finds_primary_east_of_report_at_high_latitude(self):
+        Incident.objects.filter(pk=self.primary.pk).update(location=Point(10.0, 60.0, srid=4326))
+        east = Point(10.0025, 60.0, srid=4326)
+
+        primary = IncidentDeduplicator(radius_meters=150, window_minutes=30).find_primary(self.incendio, east)
+
+        self.assertEqual(primary, self.primary)
+
+    def test_ignores_incidents_out_of_time_window(self):
+        Incident.objects.filter(pk=self.primary.pk).update(reported_at=timezone.now() - timedelta(hours=2))
+
+        primary = IncidentDeduplicator(radius_meters=150, window_minutes=30).find_primary(self.incendio, self.point)
+
+        self.assertIsNone(primary)
+
+    def test_ignores_inactive_incidents(self):
+        Incident.objects.filter(pk=self.primary.pk).update(is_active=False)
+
+        primary = IncidentDeduplicator(radius_meters=150, window_minutes=30).find_primary(self.incendio, self.point)
+
+        self.assertIsNone(primary)
+
+    def test_without_location_returns_none(self):
+        self.assertIsNone(IncidentDeduplicator().find_primary(self.incendio, None))
+
+    def test_feature_attaches_duplicate_as_corroboration(self):
+        """Un reporte cercano del mismo tipo queda vinculado al incidente original"""
+        feature = CreateIncidentFeature(
+            data={'type': 'Incendio', 'latitude': -12.0465, 'longitude': -77.0429},
+            user=self.user
+        )
+
+        incident = feature.save_incident()
+
+        self.primary.refresh_from_db()
+        self.assertEqual(incident.duplicate_of, self.primary)
+        self.assertEqual(self.primary.corroboration_count, 1)
+
+
+class RegisterDuplicateIncidentApiViewTest(TestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = RegisterIncidentApiView.as_view()
+        self.user = User.objects.create_user(
+            username='reporter',
+            email='reporter@test.com',
+            password=secrets.token_urlsafe(32),
+            dni='8888888888'
+        )
+        self.data = {'data': json.dumps({'type': 'Accidente', 'latitude': -12.0464, 'longitude': -77.0428})}
+
+    def _post(self):
+        request = self.factory.post('/incidents/api/alert/create', self.data, format='json')
+        force_authenticate(request, user=self.user)
+        return self.view(request)
+
+    @patch('core.incident.api.incident.views.incident.NearbyUsersNotifier')
+    def test_duplicate_report_does_not_notify_again(self, mock_notifier):
+        first = self._post()
+        second = self._post()
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data['duplicate_of'], first.data['incident_id'])
+        self.assertEqual(mock_notifier.return_value.send_notifications.call_count, 1)
@@ -0,0 +1,158 @@
+import json
+from io import StringIO
+import secrets
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.incident.api.incident.feature.idempotency import IncidentIdempotencyFeature
+from core.incident.api.incident.views.incident import RegisterIncidentApiView
+from core.incident.models import Incident, IncidentIdempotencyKey
+from core.stats.models import UserStats
+
+User = get_user_model()
+
+
+@patch('core.incident.api.incident.views.incident.NearbyUsersNotifier')
+class IncidentIdempotencyTest(TestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = RegisterIncidentApiView.as_view()
+        self.user = User.objects.create_user(
+            username='idem',
+            email='idem@test.com',
+            password=secrets.token_urlsafe(32),
+            dni='5555555555'
+        )
+        self.payload = {
+            'data': json.dumps({
+                'type': 'Robo',
+                'description': 'Robo en la esquina',
+                'latitude': -12.0464,
+                'longitude': -77.0428
+            })
+        }
+
+    def _post(self, payload=None, key='key-123'):
+        headers = {'HTTP_IDEMPOTENCY_KEY': key} if key else {}
+        request = self.factory.post('/incidents/api/alert/create', payload or self.payload, format='json', **headers)
+        force_authenticate(request, user=self.user)
+        return self.view(request)
+
+    def test_retry_returns_original_response(self, mock_notifier):
+        """Un reintento con la misma clave devuelve la respuesta original sin crear otro incidente"""
+        first = self._post()
+        second = self._post()
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data['incident_id'], first.data['incident_id'])
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        self.assertEqual(Incident.objects.filter(reported_by_user=self.user).count(), 1)
+        self.assertEqual(UserStats.objects.get(user=self.user).total_alerts, 1)
+        self.assertEqual(mock_notifier.return_value.send_notifications.call_count, 1)
+
+    def test_different_keys_create_different_incidents(self, mock_notifier):
+        self._post(key='key-a')
+        self._post(key='key-b')
+
+        self.assertEqual(Incident.objects.filter(reported_by_user=self.user).count(), 2)
+
+    def test_requests_without_key_are_not_deduplicated(self, mock_notifier):
+        self._post(key=None)
+        self._post(key=None)
+
+        self.assertEqual(Incident.objects.filter(reported_by_user=self.user).count(), 2)
+        self.assertFalse(IncidentIdempotencyKey.objects.exists())
+
+    def test_same_key_with_different_payload_returns_422(self, mock_notifier):
+        self._post()
+        other_payload = {'data': json.dumps({'type': 'Incendio', 'latitude': 1, 'longitude': 1})}
+
+        response = self._post(payload=other_payload)
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Incident.objects.filter(reported_by_user=self.user).count(), 1)
+
+    def test_key_in_process_returns_409(self, mock_notifier):
+        IncidentIdempotencyKey.objects.create(
+            user=self.user,
+            key='key-123',
+            request_fingerprint=IncidentIdempotencyFeature.build_fingerprint(json.loads(self.payload['data'])),
+            expires_at=timezone.now() + timedelta(hours=1)
+        )
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Incident.objects.exists())
+
+    def test_expired_key_is_reused(self, mock_notifier):
+        first = self._post()
+        IncidentIdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        second = self._post()
+
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(second.data['incident_id'], first.data['incident_id'])
+        self.assertEqual(IncidentIdempotencyKey.objects.count(), 1)
+
+    def _abandoned_key(self, claimed_seconds_ago, incident=None):
+        return IncidentIdempotencyKey.objects.create(
+            user=self.user,
+            key='key-123',
+            request_fingerprint=IncidentIdempotencyFeature.build_fingerprint(json.loads(self.payload['data'])),
+            incident=incident,
+            claimed_at=timezone.now() - timedelta(seconds=claimed_seconds_ago),
+            expires_at=timezone.now() + timedelta(hours=1)
+        )
+
+    def test_abandoned_key_is_reclaimed_after_lease(self, mock_notifier):
+        self._abandoned_key(claimed_seconds_ago=3600)
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        record = IncidentIdempotencyKey.objects.get()
+        self.assertEqual(record.status, 'completed')
+        self.assertEqual(record.incident_id, response.data['incident_id'])
+
+    def test_key_with_linked_incident_returns_that_incident(self, mock_notifier):
+        first = self._post(key='otra')
+        incident = Incident.objects.get(pk=first.data['incident_id'])
+        self._abandoned_key(claimed_seconds_ago=3600, incident=incident)
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['incident_id'], incident.id)
+        self.assertEqual(response['Idempotent-Replayed'], 'true')
+        self.assertEqual(Incident.objects.filter(reported_by_user=self.user).count(), 1)
+        self.assertEqual(IncidentIdempotencyKey.objects.get(key='key-123').status, 'completed')
+
+    @patch('core.incident.api.incident.views.incident.CreateIncidentFeature')
+    def test_failed_request_releases_key(self, mock_feature, mock_notifier):
+        mock_feature.return_value.save_incident.side_effect = Exception('Error de prueba')
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(IncidentIdempotencyKey.objects.exists())
+
+    def test_purge_command_deletes_expired_keys(self, mock_notifier):
+        self._post(key='vigente')
+        self._post(key='expirada')
+        IncidentIdempotencyKey.objects.filter(key='expirada').update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        call_command('purge_idempotency_keys', stdout=StringIO())
+
+        self.assertEqual(list(IncidentIdempotencyKey.objects.values_list('key', flat=True)), ['vigente'])
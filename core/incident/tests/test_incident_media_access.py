@@ -0,0 +1,182 @@
+import secrets
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.contrib.gis.geos import Point
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.community.models import Community, CommunityMembership
+from core.incident.api.incident.views.media_file import IncidentMediaFileApiView
+from core.incident.models import Incident, IncidentMedia, IncidentNotification, IncidentType, IncidentStatus
+
+User = get_user_model()
+
+TEMP_MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(
+    MEDIA_ROOT=TEMP_MEDIA_ROOT,
+    MEDIA_ACCEL_REDIRECT=True,
+    MEDIA_ACCEL_PREFIX='/protected-media/',
+    MEDIA_PRIVATE_CACHE_SECONDS=60,
+)
+class IncidentMediaAccessTest(TestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.reporter = self._user('reporter', '1000000001')
+        self.stranger = self._user('stranger', '1000000002')
+        self.point = Point(-77.0428, -12.0464, srid=4326)
+        self.incident = Incident.objects.create(
+            reported_by_user=self.reporter,
+            incident_type=IncidentType.objects.create(name='Robo', code='robo'),
+            incident_status=IncidentStatus.objects.create(name='Reported', code='reported'),
+            title='Robo',
+            description='',
+            location=self.point,
+            is_anonymous=True,
+        )
+        self.media = IncidentMedia(incident=self.incident, media_type='image')
+        self.media.file.save('foto.jpg', ContentFile(b'original'), save=False)
+        self.media.display_file.save('foto.webp', ContentFile(b'display'), save=False)
+        self.media.thumbnail.save('foto_thumb.webp', ContentFile(b'thumb'), save=False)
+        self.media.save()
+
+    def _user(self, username, dni):
+        return User.objects.create_user(
+            username=username,
+            email=f'{username}@test.com',
+            password=secrets.token_urlsafe(32),
+            dni=dni
+        )
+
+    def _get(self, user, variant='display'):
+        request = self.factory.get(f'/incidents/api/alert/media/{self.media.id}', {'variant': variant})
+        force_authenticate(request, user=user)
+        return IncidentMediaFileApiView.as_view()(request, media_id=self.media.id)
+
+    def test_reporter_gets_accel_redirect(self):
+        response = self._get(self.reporter)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.media.display_file.name}')
+        self.assertEqual(response['Cache-Control'], 'private, max-age=31536000, immutable')
+        self.assertEqual(response.content, b'')
+
+    def test_legacy_file_uses_short_private_cache(self):
+        IncidentMedia.objects.filter(pk=self.media.pk).update(display_file='incidents/display/2024/01/01/foto.webp')
+
+        response = self._get(self.reporter)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Cache-Control'], 'private, max-age=60')
+
+    def test_stranger_is_denied(self):
+        response = self._get(self.stranger)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_notified_user_can_view_variants(self):
+        IncidentNotification.objects.create(incident=self.incident, notified_user=self.stranger, delivery_status='sent')
+
+        response = self._get(self.stranger, variant='thumbnail')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.media.thumbnail.name}')
+
+    def test_undelivered_notification_does_not_grant_access(self):
+        for delivery_status in ('queued', 'failed', 'no_token', 'invalid_token'):
+            IncidentNotification.objects.update_or_create(
+                incident=self.incident, notified_user=self.stranger, defaults={'delivery_status': delivery_status}
+            )
+
+            response = self._get(self.stranger, variant='thumbnail')
+
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN, delivery_status)
+
+    def test_verified_community_member_can_view(self):
+        community = Community.objects.create(name='Centro', boundary_area=self.point.buffer(0.01))
+        Incident.objects.filter(pk=self.incident.pk).update(community=community)
+        CommunityMembership.objects.create(user=self.stranger, community=community, is_verified=True)
+
+        response = self._get(self.stranger)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unverified_community_member_is_denied(self):
+        community = Community.objects.create(name='Centro', boundary_area=self.point.buffer(0.01))
+        Incident.objects.filter(pk=self.incident.pk).update(community=community)
+        CommunityMembership.objects.create(user=self.stranger, community=community, is_verified=False)
+
+        response = self._get(self.stranger)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_original_of_anonymous_incident_is_reserved(self):
+        """El original conserva metadatos, por eso solo lo ve quien reportó o un gestor"""
+        IncidentNotification.objects.create(incident=self.incident, notified_user=self.stranger, delivery_status='sent')
+
+        self.assertEqual(self._get(self.stranger, variant='original').status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self._get(self.reporter, variant='original').status_code, status.HTTP_200_OK)
+
+    def test_unprocessed_image_is_treated_as_original(self):
+        IncidentMedia.objects.filter(pk=self.media.pk).update(display_file='', thumbnail='')
+        IncidentNotification.objects.create(incident=self.incident, notified_user=self.stranger, delivery_status='sent')
+
+        response = self._get(self.stranger)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_can_view_original(self):
+        self.stranger.is_staff = True
+        self.stranger.save()
+
+        response = self._get(self.stranger, variant='original')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def _community_manager(self, community):
+        group = Group.objects.create(name='Gestores')
+        group.permissions.add(Permission.objects.get(codename='can_manage_community'))
+        self.stranger.groups.add(group)
+        CommunityMembership.objects.create(user=self.stranger, community=community, role='admin', is_verified=True)
+
+    def test_manager_of_incident_community_can_view_original(self):
+        community = Community.objects.create(name='Centro', boundary_area=self.point.buffer(0.01))
+        Incident.objects.filter(pk=self.incident.pk).update(community=community)
+        self._community_manager(community)
+
+        response = self._get(self.stranger, variant='original')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_manager_of_another_community_cannot_view_original(self):
+        incident_community = Community.objects.create(name='Centro', boundary_area=self.point.buffer(0.01))
+        Incident.objects.filter(pk=self.incident.pk).update(community=incident_community)
+        self._community_manager(Community.objects.create(name='Norte', boundary_area=Point(0, 0).buffer(0.01)))
+
+        response = self._get(self.stranger, variant='original')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid_variant(self):
+        response = self._get(self.reporter, variant='raw')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(MEDIA_ACCEL_REDIRECT=False)
+    def test_streams_file_without_accel(self):
+        response = self._get(self.reporter, variant='thumbnail')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), b'thumb')
@@ -0,0 +1,138 @@
+import io
+import secrets
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from core.incident.models import Incident, IncidentMedia, IncidentType, IncidentStatus
+from core.incident.services.media_processing import IncidentMediaProcessor
+
+User = get_user_model()
+
+TEMP_MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def build_jpeg(width, height, orientation=None):
+    image = Image.new('RGB', (width, height), color=(200, 30, 30))
+    output = io.BytesIO()
+    if orientation:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        image.save(output, format='JPEG', exif=exif)
+    else:
+        image.save(output, format='JPEG')
+    return output.getvalue()
+
+
+@override_settings(
+    MEDIA_ROOT=TEMP_MEDIA_ROOT,
+    INCIDENT_MEDIA_ASYNC_PROCESSING=False,
+    INCIDENT_MEDIA_DISPLAY_MAX_PX=1280,
+    INCIDENT_MEDIA_THUMBNAIL_MAX_PX=320,
+    INCIDENT_MEDIA_QUALITY=80,
+)
+class IncidentMediaProcessorTest(TestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='media',
+            email='media@test.com',
+            password=secrets.token_urlsafe(32),
+            dni='8888888888'
+        )
+        self.incident = Incident.objects.create(
+            reported_by_user=self.user,
+            incident_type=IncidentType.objects.create(name='Robo', code='robo'),
+            incident_status=IncidentStatus.objects.create(name='Reported', code='reported'),
+            title='Robo',
+            description='',
+        )
+
+    def create_media(self, content, media_type='image'):
+        return IncidentMedia.objects.create(
+            incident=self.incident,
+            media_type=media_type,
+            file=SimpleUploadedFile('foto.jpg', content, content_type='image/jpeg')
+        )
+
+    def test_generates_display_and_thumbnail(self):
+        media = self.create_media(build_jpeg(4000, 3000))
+
+        IncidentMediaProcessor().process(media)
+        media.refresh_from_db()
+
+        self.assertEqual(media.processing_status, 'processed')
+        self.assertEqual((media.width, media.height), (4000, 3000))
+        with Image.open(media.display_file.path) as display:
+            self.assertEqual(display.size, (1280, 960))
+        with Image.open(media.thumbnail.path) as thumbnail:
+            self.assertEqual(thumbnail.size, (320, 240))
+        self.assertIsNotNone(media.processed_at)
+
+    def test_applies_orientation_and_strips_exif(self):
+        media = self.create_media(build_jpeg(600, 400, orientation=6))
+
+        IncidentMediaProcessor().process(media)
+        media.refresh_from_db()
+
+        self.assertEqual((media.width, media.height), (400, 600))
+        with Image.open(media.display_file.path) as display:
+            self.assertEqual(display.size, (400, 600))
+            self.assertNotIn(0x0112, display.getexif())
+
+    def test_keeps_original_file(self):
+        content = build_jpeg(800, 600)
+        media = self.create_media(content)
+
+        IncidentMediaProcessor().process(media)
+        media.refresh_from_db()
+
+        with media.file.open('rb') as original:
+            self.assertEqual(original.read(), content)
+
+    def test_marks_invalid_image_as_failed(self):
+        media = self.create_media(b'no es una imagen')
+
+        IncidentMediaProcessor().process(media)
+        media.refresh_from_db()
+
+        self.assertEqual(media.processing_status, 'failed')
+        self.assertFalse(media.thumbnail)
+
+    def test_skips_non_image_media(self):
+        media = self.create_media(b'audio', media_type='audio')
+
+        IncidentMediaProcessor().process(media)
+        media.refresh_from_db()
+
+        self.assertEqual(media.processing_status, 'skipped')
+
+    def test_schedule_runs_after_commit(self):
+        media = self.create_media(build_jpeg(100, 100))
+
+        with patch.object(IncidentMediaProcessor, 'process_by_id') as process_by_id:
+            with self.captureOnCommitCallbacks(execute=True):
+                IncidentMediaProcessor().schedule(media.id)
+
+        process_by_id.assert_called_once_with(media.id)
+
+    def test_json_exposes_variant_urls(self):
+        media = self.create_media(build_jpeg(100, 100))
+        IncidentMediaProcessor().process(media)
+        media.refresh_from_db()
+
+        data = self.incident.to_json_map()
+
+        self.assertEqual(len(data['media']), 1)
+        self.assertEqual(data['media'][0]['url'], media.get_file_url('display'))
+        self.assertEqual(data['media'][0]['thumbnail_url'], media.get_file_url('thumbnail'))
@@ -0,0 +1,180 @@
+import os
+import secrets
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.incident.api.incident.feature.media_upload import MediaUploadFeature
+from core.incident.api.incident.views.media_upload import (
+    MediaUploadSessionApiView, MediaUploadApiView, MediaUploadCompleteApiView
+)
+from core.incident.models import Incident, IncidentMedia, IncidentType, IncidentStatus, MediaUploadSession
+
+User = get_user_model()
+
+TEMP_MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(
+    MEDIA_ROOT=TEMP_MEDIA_ROOT,
+    INCIDENT_UPLOAD_TMP_DIR=os.path.join(TEMP_MEDIA_ROOT, 'uploads', 'tmp'),
+    INCIDENT_UPLOAD_MAX_BYTES=1024,
+    INCIDENT_UPLOAD_MAX_CHUNK_BYTES=256,
+    INCIDENT_UPLOAD_SESSION_TTL_HOURS=24,
+)
+@patch('core.incident.api.incident.feature.media_upload.IncidentMediaProcessor')
+class MediaUploadApiTest(TestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            username='uploader',
+            email='uploader@test.com',
+            password=secrets.token_urlsafe(32),
+            dni='9999999999'
+        )
+        self.other = User.objects.create_user(
+            username='other',
+            email='other@test.com',
+            password=secrets.token_urlsafe(32),
+            dni='9999999998'
+        )
+        self.incident = Incident.objects.create(
+            reported_by_user=self.user,
+            incident_type=IncidentType.objects.create(name='Robo', code='robo'),
+            incident_status=IncidentStatus.objects.create(name='Reported', code='reported'),
+            title='Robo',
+            description='',
+        )
+        self.content = os.urandom(600)
+
+    def _create_session(self, user=None, total_size=None):
+        request = self.factory.post('/incidents/api/alert/media/uploads', {
+            'incident_id': self.incident.id,
+            'media_type': 'video',
+            'filename': '../video final.mp4',
+            'total_size': total_size or len(self.content),
+        }, format='json')
+        force_authenticate(request, user=user or self.user)
+        return MediaUploadSessionApiView.as_view()(request)
+
+    def _put_chunk(self, upload_id, offset, data):
+        request = self.factory.put(
+            f'/incidents/api/alert/media/uploads/{upload_id}',
+            data,
+            content_type='application/octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset)
+        )
+        force_authenticate(request, user=self.user)
+        return MediaUploadApiView.as_view()(request, upload_id=upload_id)
+
+    def _complete(self, upload_id):
+        request = self.factory.post(f'/incidents/api/alert/media/uploads/{upload_id}/complete')
+        force_authenticate(request, user=self.user)
+        return MediaUploadCompleteApiView.as_view()(request, upload_id=upload_id)
+
+    def _upload_all(self, upload_id):
+        for offset in range(0, len(self.content), 256):
+            response = self._put_chunk(upload_id, offset, self.content[offset:offset + 256])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_chunked_upload_attaches_media(self, mock_processor):
+        """Los fragmentos se ensamblan y al completar se adjunta el archivo al incidente"""
+        upload_id = self._create_session().data['upload_id']
+
+        self._upload_all(upload_id)
+        response = self._complete(upload_id)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        media = IncidentMedia.objects.get(incident=self.incident)
+        self.assertEqual(media.media_type, 'video')
+        with media.file.open('rb') as stored:
+            self.assertEqual(stored.read(), self.content)
+        self.assertFalse(os.path.exists(os.path.join(TEMP_MEDIA_ROOT, 'uploads', 'tmp', f'{upload_id}.part')))
+        mock_processor.return_value.schedule.assert_called_once_with(media.id)
+
+    def test_filename_is_sanitized(self, mock_processor):
+        upload_id = self._create_session().data['upload_id']
+
+        self.assertEqual(MediaUploadSession.objects.get(pk=upload_id).filename, 'video_final.mp4')
+
+    def test_wrong_offset_returns_conflict_with_current_offset(self, mock_processor):
+        upload_id = self._create_session().data['upload_id']
+        self._put_chunk(upload_id, 0, self.content[:256])
+
+        response = self._put_chunk(upload_id, 0, self.content[:256])
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response['Upload-Offset'], '256')
+
+    def test_status_reports_received_bytes_for_resume(self, mock_processor):
+        upload_id = self._create_session().data['upload_id']
+        self._put_chunk(upload_id, 0, self.content[:256])
+
+        request = self.factory.get(f'/incidents/api/alert/media/uploads/{upload_id}')
+        force_authenticate(request, user=self.user)
+        response = MediaUploadApiView.as_view()(request, upload_id=upload_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['received_bytes'], 256)
+        self.assertEqual(response['Upload-Offset'], '256')
+
+    def test_chunk_larger_than_limit_is_rejected(self, mock_processor):
+        upload_id = self._create_session().data['upload_id']
+
+        response = self._put_chunk(upload_id, 0, self.content[:300])
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    def test_total_size_over_limit_is_rejected(self, mock_processor):
+        response = self._create_session(total_size=2048)
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    def test_incomplete_upload_cannot_be_completed(self, mock_processor):
+        upload_id = self._create_session().data['upload_id']
+        self._put_chunk(upload_id, 0, self.content[:256])
+
+        response = self._complete(upload_id)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(IncidentMedia.objects.exists())
+
+    def test_complete_is_idempotent(self, mock_processor):
+        upload_id = self._create_session().data['upload_id']
+        self._upload_all(upload_id)
+
+        first = self._complete(upload_id)
+        second = self._complete(upload_id)
+
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data['media']['id'], first.data['media']['id'])
+        self.assertEqual(IncidentMedia.objects.count(), 1)
+
+    def test_cannot_attach_to_foreign_incident(self, mock_processor):
+        response = self._create_session(user=self.other)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_purge_removes_expired_sessions(self, mock_processor):
+        upload_id = self._create_session().data['upload_id']
+        MediaUploadSession.objects.filter(pk=upload_id).update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        call_command('purge_media_uploads', stdout=StringIO())
+
+        self.assertFalse(MediaUploadSession.objects.exists())
+        self.assertFalse(os.path.exists(MediaUploadFeature.temp_path(MediaUploadSession(id=upload_id))))
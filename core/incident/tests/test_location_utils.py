@@ -0,0 +1,54 @@
+import secrets
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import Point
+from django.test import TestCase
+
+from core.authentication.models import UserProfile
+from core.community.models import Community, CommunityMembership
+from core.incident.utils.location import LocationUtils
+
+User = get_user_model()
+
+
+class LocationUtilsTest(TestCase):
+
+    def setUp(self):
+        self.origin = (-12.0464, -77.0428)
+        self.near = self._user_at('near', -12.0470, -77.0430)
+        self.farther = self._user_at('farther', -12.0560, -77.0428)
+        self.outside = self._user_at('outside', -12.1200, -77.0428)
+        self._user_at('no-location', None, None)
+
+    @staticmethod
+    def _user_at(username, latitude, longitude):
+        user = User.objects.create_user(
+            username=username,
+            email=f'{username}@test.com',
+            password=secrets.token_urlsafe(10),
+            dni=secrets.token_urlsafe(8),
+        )
+        location = Point(longitude, latitude, srid=4326) if latitude is not None else None
+        UserProfile.objects.create(user=user, location=location)
+        return user
+
+    def test_nearby_users_are_filtered_and_ordered_by_distance(self):
+        users = LocationUtils(*self.origin, radius_km=2.0).get_nearby_users()
+
+        self.assertEqual(users, [self.near, self.farther])
+
+    def test_nearby_users_with_distance_in_km(self):
+        results = LocationUtils(*self.origin, radius_km=2.0).get_nearby_users_with_distance()
+
+        self.assertEqual([result['user'] for result in results], [self.near, self.farther])
+        self.assertLess(results[0]['distance_km'], 0.1)
+        self.assertAlmostEqual(results[1]['distance_km'], 1.06, delta=0.05)
+
+    def test_nearby_community_members_only_returns_verified_members(self):
+        community = Community.objects.create(name='Centro')
+        CommunityMembership.objects.create(user=self.farther, community=community, is_verified=True)
+        CommunityMembership.objects.create(user=self.near, community=community, is_verified=False)
+
+        members = LocationUtils(*self.origin, radius_km=2.0).get_nearby_community_members(community)
+
+        self.assertEqual(members, [self.farther])
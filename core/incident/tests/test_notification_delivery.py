@@ -0,0 +1,141 @@
+import secrets
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from firebase_admin import messaging
+
+from core.authentication.models import FCMToken
+from core.incident.models import Incident, IncidentType, IncidentStatus, IncidentNotification
+from core.incident.services.notify_users import NearbyUsersNotifier
+
+User = get_user_model()
+
+
+def fake_send(message):
+    if message.token == 'BROKEN_TOKEN':
+        raise Exception('timeout')
+    if message.token == 'GONE_TOKEN':
+        raise messaging.UnregisteredError('unregistered')
+    return 'msg-id'
+
+
+class NotificationDeliveryTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.reporter = self._user('reporter')
+        self.delivered = self._user('delivered', 'OK_TOKEN')
+        self.failing = self._user('failing', 'BROKEN_TOKEN')
+        self.invalid = self._user('invalid', 'GONE_TOKEN')
+        self.tokenless = self._user('tokenless')
+        self.incident = Incident.objects.create(
+            reported_by_user=self.reporter,
+            incident_type=IncidentType.objects.create(name='Robo', code='robo'),
+            incident_status=IncidentStatus.objects.create(name='Reportado', code='reported'),
+            title='Robo',
+            location=Point(-77.0428, -12.0464, srid=4326),
+        )
+        self.recipients = [self.delivered, self.failing, self.invalid, self.tokenless]
+
+    def _user(self, username, token=None):
+        user = User.objects.create_user(
+            username=username,
+            email=f'{username}@test.com',
+            password=secrets.token_urlsafe(16),
+            dni=secrets.token_hex(6),
+        )
+        if token:
+            FCMToken.objects.create(user=user, token=token, is_active=True)
+        return user
+
+    def _status(self, user):
+        return IncidentNotification.objects.get(incident=self.incident, notified_user=user)
+
+    def _notify(self):
+        with patch('core.incident.utils.location.LocationUtils.get_nearby_users', return_value=self.recipients):
+            NearbyUsersNotifier().send_notifications(self.incident, latitude='-12.0464', longitude='-77.0428')
+
+    @patch('firebase_admin.messaging.send', side_effect=fake_send)
+    def test_records_per_recipient_delivery_status(self, mock_send):
+        self._notify()
+
+        delivered = self._status(self.delivered)
+        self.assertEqual(delivered.delivery_status, 'sent')
+        self.assertEqual(delivered.attempt_count, 1)
+        self.assertIsNotNone(delivered.last_attempt_at)
+        self.assertIsNotNone(delivered.delivery_latency_ms)
+        self.assertEqual(self._status(self.failing).delivery_status, 'failed')
+        self.assertEqual(self._status(self.invalid).delivery_status, 'invalid_token')
+        self.assertEqual(self._status(self.tokenless).delivery_status, 'no_token')
+
+    @patch('firebase_admin.messaging.send', side_effect=fake_send)
+    def test_only_delivered_recipients_count_as_notified(self, mock_send):
+        self._notify()
+
+        delivered = self.incident.to_json_map(current_user_id=self.delivered.id)
+        self.assertTrue(delivered['was_notified'])
+        self.assertIsNotNone(delivered['notified_at'])
+        for user in (self.failing, self.invalid, self.tokenless):
+            data = self.incident.to_json_map(current_user_id=user.id)
+            self.assertFalse(data['was_notified'])
+            self.assertIsNone(data['notified_at'])
+            self.assertFalse(data['was_read'])
+
+    @patch('firebase_admin.messaging.send', side_effect=fake_send)
+    def test_retry_only_resends_failed_recipients(self, mock_send):
+        self._notify()
+        mock_send.reset_mock()
+        mock_send.side_effect = None
+        mock_send.return_value = 'msg-id'
+
+        result = NearbyUsersNotifier().retry_failed(max_attempts=3)
+
+        self.assertEqual(result, {'incidents': 1, 'retried': 1, 'sent': 1})
+        self.assertEqual([call.args[0].token for call in mock_send.call_args_list], ['BROKEN_TOKEN'])
+        retried = self._status(self.failing)
+        self.assertEqual(retried.delivery_status, 'sent')
+        self.assertEqual(retried.attempt_count, 2)
+        self.assertEqual(self._status(self.delivered).attempt_count, 1)
+
+    @patch('firebase_admin.messaging.send', side_effect=fake_send)
+    def test_retry_stops_after_max_attempts(self, mock_send):
+        self._notify()
+        NearbyUsersNotifier().retry_failed(max_attempts=2)
+        mock_send.reset_mock()
+
+        result = NearbyUsersNotifier().retry_failed(max_attempts=2)
+
+        self.assertEqual(result['retried'], 0)
+        mock_send.assert_not_called()
+        self.assertEqual(self._status(self.failing).attempt_count, 2)
+
+    @patch('firebase_admin.messaging.send', side_effect=fake_send)
+    def test_repeated_fan_out_skips_already_delivered_recipients(self, mock_send):
+        self._notify()
+        mock_send.reset_mock()
+
+        self._notify()
+
+        sent_tokens = {call.args[0].token for call in mock_send.call_args_list}
+        self.assertNotIn('OK_TOKEN', sent_tokens)
+        self.assertEqual(self._status(self.delivered).attempt_count, 1)
+
+    @patch('firebase_admin.messaging.send', return_value='msg-id')
+    def test_retry_picks_up_stale_queued_rows(self, mock_send):
+        IncidentNotification.objects.create(incident=self.incident, notified_user=self.delivered)
+        IncidentNotification.objects.create(incident=self.incident, notified_user=self.failing)
+        IncidentNotification.objects.filter(notified_user=self.delivered).update(
+            notification_sent_at=timezone.now() - timedelta(hours=1)
+        )
+
+        result = NearbyUsersNotifier().retry_failed(max_attempts=3)
+
+        self.assertEqual(result['retried'], 1)
+        self.assertEqual([call.args[0].token for call in mock_send.call_args_list], ['OK_TOKEN'])
+        self.assertEqual(self._status(self.delivered).delivery_status, 'sent')
+        self.assertEqual(self._status(self.failing).delivery_status, 'queued')
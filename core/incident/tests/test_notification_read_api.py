@@ -0,0 +1,119 @@
+import secrets
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.incident.models import Incident, IncidentType, IncidentStatus, IncidentNotification
+from core.incident.services.notification_delivery import NotificationDeliveryTracker
+
+User = get_user_model()
+
+
+class NotificationReadApiTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='reader', email='reader@test.com', password=secrets.token_urlsafe(16), dni='300'
+        )
+        self.other = User.objects.create_user(
+            username='other', email='other@test.com', password=secrets.token_urlsafe(16), dni='400'
+        )
+        self.incident_type = IncidentType.objects.create(name='Robo', code='robo')
+        self.incident_status = IncidentStatus.objects.create(name='Reportado', code='reported')
+        self.incidents = [self._incident() for _ in range(3)]
+        for incident in self.incidents:
+            IncidentNotification.objects.create(incident=incident, notified_user=self.user, delivery_status='sent')
+        IncidentNotification.objects.create(incident=self.incidents[0], notified_user=self.other, delivery_status='sent')
+        self.client.force_authenticate(user=self.user)
+        self.read_url = reverse('api_notifications_read')
+        self.count_url = reverse('api_notifications_unread_count')
+
+    def _incident(self):
+        return Incident.objects.create(
+            reported_by_user=self.other,
+            incident_type=self.incident_type,
+            incident_status=self.incident_status,
+            title='Robo',
+        )
+
+    def test_mark_selected_incidents_as_read(self):
+        response = self.client.post(
+            self.read_url, {'incident_ids': [self.incidents[0].id, self.incidents[1].id]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'updated': 2, 'unread': 1})
+        notification = IncidentNotification.objects.get(incident=self.incidents[0], notified_user=self.user)
+        self.assertTrue(notification.was_read)
+        self.assertIsNotNone(notification.read_at)
+        self.assertFalse(
+            IncidentNotification.objects.get(incident=self.incidents[0], notified_user=self.other).was_read
+        )
+
+    def test_mark_all_up_to_timestamp(self):
+        IncidentNotification.objects.filter(incident=self.incidents[2]).update(
+            notification_sent_at=timezone.now() + timedelta(hours=1)
+        )
+
+        response = self.client.post(self.read_url, {'up_to': timezone.now().isoformat()}, format='json')
+
+        self.assertEqual(response.data['updated'], 2)
+        self.assertEqual(response.data['unread'], 1)
+
+    def test_mark_read_uses_single_update(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(self.read_url, {'up_to': timezone.now().isoformat()}, format='json')
+
+        updates = [query for query in ctx.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+
+    def test_requires_ids_or_timestamp(self):
+        response = self.client.post(self.read_url, {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_undelivered_notifications_are_not_unread(self):
+        IncidentNotification.objects.create(incident=self._incident(), notified_user=self.user, delivery_status='failed')
+
+        self.assertEqual(self.client.get(self.count_url).data, {'unread': 3})
+        response = self.client.post(self.read_url, {'up_to': timezone.now().isoformat()}, format='json')
+        self.assertEqual(response.data['updated'], 3)
+
+    def test_unread_count_reads_database_without_shared_cache(self):
+        self.client.get(self.count_url)
+        IncidentNotification.objects.filter(notified_user=self.user).update(was_read=True)
+
+        self.assertEqual(self.client.get(self.count_url).data, {'unread': 0})
+
+    @patch('core.incident.services.notification_unread.is_shared_cache', return_value=True)
+    def test_unread_count_is_served_from_shared_cache(self, mock_shared):
+        self.assertEqual(self.client.get(self.count_url).data, {'unread': 3})
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.count_url)
+
+        self.assertEqual(response.data, {'unread': 3})
+        self.assertFalse([query for query in ctx.captured_queries if 'COUNT' in query['sql']])
+
+    @patch('core.incident.services.notification_unread.is_shared_cache', return_value=True)
+    def test_cached_count_follows_deliveries_and_reads(self, mock_shared):
+        self.client.get(self.count_url)
+        tracker = NotificationDeliveryTracker()
+
+        pending = tracker.queue(self._incident(), [self.user.id])
+        self.assertEqual(self.client.get(self.count_url).data, {'unread': 3})
+
+        tracker.record(list(pending.values()), {self.user.id: 'sent'})
+        self.assertEqual(self.client.get(self.count_url).data, {'unread': 4})
+
+        response = self.client.post(self.read_url, {'incident_ids': [self.incidents[0].id]}, format='json')
+        self.assertEqual(response.data['unread'], 3)
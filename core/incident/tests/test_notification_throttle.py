@@ -0,0 +1,162 @@
+import secrets
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from firebase_admin import messaging
+
+from core.authentication.models import FCMToken
+from core.incident.models import Incident, IncidentType, IncidentStatus, IncidentNotification, \
+    PendingNotificationDigest
+from core.incident.services.notification_digest import NotificationDigestSender
+from core.incident.services.notification_throttle import NotificationRateLimiter
+from core.incident.services.notify_users import NearbyUsersNotifier
+
+User = get_user_model()
+
+
+class NotificationRateLimiterTest(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        NotificationRateLimiter._local_buckets.clear()
+
+    def test_allows_up_to_capacity(self):
+        limiter = NotificationRateLimiter(capacity=2, refill_seconds=3600)
+
+        self.assertEqual(limiter.partition([1]), ([1], []))
+        self.assertEqual(limiter.partition([1]), ([1], []))
+        self.assertEqual(limiter.partition([1]), ([], [1]))
+
+    def test_buckets_are_per_user(self):
+        limiter = NotificationRateLimiter(capacity=1, refill_seconds=3600)
+        limiter.partition([1])
+
+        allowed, limited = limiter.partition([1, 2])
+
+        self.assertEqual(allowed, [2])
+        self.assertEqual(limited, [1])
+
+    @patch('core.incident.services.notification_throttle.time.time')
+    def test_tokens_refill_over_time(self, mock_time):
+        limiter = NotificationRateLimiter(capacity=1, refill_seconds=60)
+        mock_time.return_value = 1000.0
+        limiter.partition([1])
+        self.assertEqual(limiter.partition([1]), ([], [1]))
+
+        mock_time.return_value = 1061.0
+
+        self.assertEqual(limiter.partition([1]), ([1], []))
+
+    @patch('core.incident.services.notification_throttle.cache')
+    def test_falls_back_to_local_buckets_when_cache_fails(self, mock_cache):
+        mock_cache.get_many.side_effect = ConnectionError('cache caído')
+        mock_cache.set_many.side_effect = ConnectionError('cache caído')
+        limiter = NotificationRateLimiter(capacity=1, refill_seconds=3600)
+
+        self.assertEqual(limiter.partition([1]), ([1], []))
+        self.assertEqual(limiter.partition([1]), ([], [1]))
+
+
+class NotificationDigestTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.reporter = User.objects.create_user(
+            username='reporter', email='reporter@test.com', password=secrets.token_urlsafe(16), dni='100'
+        )
+        self.neighbor = User.objects.create_user(
+            username='neighbor', email='neighbor@test.com', password=secrets.token_urlsafe(16), dni='200'
+        )
+        FCMToken.objects.create(user=self.neighbor, token='NEIGHBOR_TOKEN', is_active=True)
+        self.incident_type = IncidentType.objects.create(name='Robo', code='robo')
+        self.incident_status = IncidentStatus.objects.create(name='Reportado', code='reported')
+
+    def _incident(self):
+        return Incident.objects.create(
+            reported_by_user=self.reporter,
+            incident_type=self.incident_type,
+            incident_status=self.incident_status,
+            title='Robo',
+            description='',
+        )
+
+    @patch('core.incident.services.notify_users.NotificationRateLimiter')
+    @patch('core.incident.utils.FCM_notification.FCMNotificationUtils.send_notification_to_users')
+    @patch('core.incident.utils.location.LocationUtils.get_nearby_users')
+    def test_limited_users_are_deferred_to_digest(self, mock_nearby, mock_send, mock_limiter):
+        """Los usuarios que superan el límite no reciben push ni registro de notificación"""
+        mock_nearby.return_value = [self.neighbor]
+        mock_limiter.return_value.partition.return_value = ([], [self.neighbor.id])
+        incident = self._incident()
+
+        NearbyUsersNotifier().send_notifications(incident, latitude='-12.0464', longitude='-77.0428')
+
+        mock_send.assert_not_called()
+        self.assertFalse(IncidentNotification.objects.filter(notified_user=self.neighbor).exists())
+        self.assertTrue(PendingNotificationDigest.objects.filter(user=self.neighbor, incident=incident).exists())
+
+    @patch('firebase_admin.messaging.send')
+    def test_digest_sends_one_push_per_user_and_records_notifications(self, mock_send):
+        mock_send.return_value = 'msg-id'
+        first, second = self._incident(), self._incident()
+        PendingNotificationDigest.objects.create(user=self.neighbor, incident=first)
+        PendingNotificationDigest.objects.create(user=self.neighbor, incident=second)
+
+        result = NotificationDigestSender().send_pending()
+
+        self.assertEqual(mock_send.call_count, 1)
+        self.assertEqual(result['users'], 1)
+        self.assertEqual(result['incidents'], 2)
+        self.assertEqual(IncidentNotification.objects.filter(notified_user=self.neighbor).count(), 2)
+        self.assertFalse(PendingNotificationDigest.objects.exists())
+
+    @patch('firebase_admin.messaging.send')
+    def test_digest_skips_inactive_incidents(self, mock_send):
+        incident = self._incident()
+        incident.is_active = False
+        incident.save()
+        PendingNotificationDigest.objects.create(user=self.neighbor, incident=incident)
+
+        NotificationDigestSender().send_pending()
+
+        mock_send.assert_not_called()
+        self.assertFalse(IncidentNotification.objects.exists())
+        self.assertFalse(PendingNotificationDigest.objects.exists())
+
+    @patch('firebase_admin.messaging.send')
+    def test_failed_digest_send_is_recorded_for_targeted_retry(self, mock_send):
+        mock_send.side_effect = Exception('timeout')
+        incident = self._incident()
+        PendingNotificationDigest.objects.create(user=self.neighbor, incident=incident)
+
+        NotificationDigestSender().send_pending()
+
+        notification = IncidentNotification.objects.get(notified_user=self.neighbor, incident=incident)
+        self.assertEqual(notification.delivery_status, 'failed')
+        self.assertEqual(notification.attempt_count, 1)
+        self.assertFalse(PendingNotificationDigest.objects.exists())
+
+    @patch('firebase_admin.messaging.send')
+    def test_digest_entries_with_invalid_tokens_are_kept_for_next_run(self, mock_send):
+        mock_send.side_effect = messaging.UnregisteredError('unregistered')
+        incident = self._incident()
+        PendingNotificationDigest.objects.create(user=self.neighbor, incident=incident)
+
+        NotificationDigestSender().send_pending()
+
+        entry = PendingNotificationDigest.objects.get(user=self.neighbor, incident=incident)
+        self.assertEqual(entry.attempt_count, 1)
+        self.assertFalse(IncidentNotification.objects.exists())
+
+    def test_digest_entries_without_token_are_dropped_after_max_attempts(self):
+        FCMToken.objects.filter(user=self.neighbor).update(is_active=False)
+        PendingNotificationDigest.objects.create(user=self.neighbor, incident=self._incident())
+        sender = NotificationDigestSender(max_attempts=2)
+
+        sender.send_pending()
+        self.assertTrue(PendingNotificationDigest.objects.exists())
+
+        sender.send_pending()
+        self.assertFalse(PendingNotificationDigest.objects.exists())
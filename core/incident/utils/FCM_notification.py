@@ -1,8 +1,10 @@
 import logging
+from collections import defaultdict
 
 from firebase_admin import messaging
 
 from core.authentication.models import FCMToken
+from core.authentication.services.fcm_token_lifecycle import FCMTokenLifecycleManager
 
 logger = logging.getLogger(__name__)
 
@@ -16,21 +18,39 @@ class FCMNotificationUtils:
             return {'success': 0, 'failed': 0}
 
         user_ids = [user.id for user in users]
-        tokens = FCMToken.objects.filter(
-            user_id__in=user_ids,
-            is_active=True
-        ).values_list('token', flat=True)
-
-        if not tokens:
+        tokens_by_user = defaultdict(list)
+        for user_id, token in FCMToken.objects.filter(
+                user_id__in=user_ids,
+                is_active=True
+        ).values_list('user_id', 'token'):
+            tokens_by_user[user_id].append(token)
+
+        if not tokens_by_user:
             logger.warning(f"No se encontraron tokens FCM para {len(users)} usuarios")
             return {'success': 0, 'failed': 0}
 
-        return FCMNotificationUtils.send_notification_to_tokens(
-            tokens=list(tokens),
+        result = FCMNotificationUtils.send_notification_to_tokens(
+            tokens=[token for tokens in tokens_by_user.values() for token in tokens],
             title=title,
             body=body,
             data=data
         )
+        result['user_results'] = {
+            user_id: FCMNotificationUtils.user_status(tokens_by_user.get(user_id), result['token_results'])
+            for user_id in user_ids
+        }
+        return result
+
+    @staticmethod
+    def user_status(tokens, token_results):
+        if not tokens:
+            return 'no_token'
+        statuses = {token_results.get(token, 'failed') for token in tokens}
+        if 'sent' in statuses:
+            return 'sent'
+        if statuses == {'invalid_token'}:
+            return 'invalid_token'
+        return 'failed'
 
     @staticmethod
     def send_notification_to_tokens(tokens, title, body, data=None):
@@ -40,6 +60,8 @@ class FCMNotificationUtils:
         success_count = 0
         failed_count = 0
         invalid_tokens = []
+        delivered_tokens = []
+        token_results = {}
 
         notification_data = data or {}
 
@@ -73,20 +95,24 @@ class FCMNotificationUtils:
 
                 response = messaging.send(message)
                 success_count += 1
+                delivered_tokens.append(token)
+                token_results[token] = 'sent'
                 logger.info(f"Notificación enviada exitosamente: {response}")
 
             except messaging.UnregisteredError:
                 logger.warning(f"Token no registrado o inválido: {token[:20]}...")
                 invalid_tokens.append(token)
+                token_results[token] = 'invalid_token'
                 failed_count += 1
 
             except Exception as e:
                 logger.error(f"Error al enviar notificación al token {token[:20]}...: {str(e)}")
+                token_results[token] = 'failed'
                 failed_count += 1
 
-        if invalid_tokens:
-            FCMToken.objects.filter(token__in=invalid_tokens).update(is_active=False)
-            logger.info(f"Desactivados {len(invalid_tokens)} tokens inválidos")
+        lifecycle = FCMTokenLifecycleManager()
+        lifecycle.record_deliveries(delivered_tokens)
+        lifecycle.deactivate(invalid_tokens)
 
         result = {
             'success': success_count,
@@ -95,4 +121,5 @@ class FCMNotificationUtils:
         }
 
         logger.info(f"Resumen de envío: {result}")
+        result['token_results'] = token_results
         return result
@@ -1,8 +1,10 @@
 import logging
 
-from django.contrib.gis.db.models.functions import Distance as DistanceFunc
+from django.contrib.gis.db import models as gis_models
+from django.contrib.gis.db.models.functions import GeoFunc
 from django.contrib.gis.geos import Point
 from django.contrib.gis.measure import Distance
+from django.db.models import FloatField, Value
 
 from core.authentication.models import UserProfile
 from core.community.models import CommunityMembership
@@ -10,6 +12,13 @@ from core.community.models import CommunityMembership
 logger = logging.getLogger(__name__)
 
 
+class KNNDistance(GeoFunc):
+    function = ''
+    arg_joiner = ' <-> '
+    template = '(%(expressions)s)'
+    output_field = FloatField()
+
+
 class LocationUtils:
 
     def __init__(self, latitude, longitude, radius_km=2.0):
@@ -18,17 +27,17 @@ class LocationUtils:
         self.radius_km = radius_km
         self.origin_point = Point(longitude, latitude, srid=4326)
 
+    def get_nearby_profiles(self):
+        origin = Value(self.origin_point, output_field=gis_models.PointField(geography=True, srid=4326))
+        return UserProfile.objects.filter(
+            location_geography__dwithin=(origin, Distance(km=self.radius_km))
+        ).annotate(
+            distance=KNNDistance('location_geography', origin)
+        ).defer('location_geography').select_related('user').order_by('distance')
+
     def get_nearby_users(self):
         try:
-            nearby_profiles = UserProfile.objects.filter(
-                location__distance_lte=(
-                    self.origin_point,
-                    Distance(km=self.radius_km)
-                )
-            ).annotate(
-                distance=DistanceFunc('location', self.origin_point)
-            ).select_related('user').order_by('distance')
-            users = [profile.user for profile in nearby_profiles]
+            users = [profile.user for profile in self.get_nearby_profiles()]
             logger.info(
                 f"Encontrados {len(users)} usuarios dentro de {self.radius_km}km "
                 f"de ({self.latitude}, {self.longitude})"
@@ -40,22 +49,13 @@ class LocationUtils:
 
     def get_nearby_users_with_distance(self):
         try:
-            nearby_profiles = UserProfile.objects.filter(
-                location__distance_lte=(
-                    self.origin_point,
-                    Distance(km=self.radius_km)
-                )
-            ).annotate(
-                distance=DistanceFunc('location', self.origin_point)
-            ).select_related('user').order_by('distance')
-
             users_with_distance = [
                 {
                     'user': profile.user,
-                    'distance_km': round(profile.distance.km, 2),
+                    'distance_km': round(profile.distance / 1000, 2),
                     'profile': profile
                 }
-                for profile in nearby_profiles
+                for profile in self.get_nearby_profiles()
             ]
 
             logger.info(f"Usuarios cercanos encontrados: {len(users_with_distance)}")
@@ -68,15 +68,13 @@ class LocationUtils:
 
     def get_nearby_community_members(self, community):
         try:
-            nearby_users = self.get_nearby_users()
-            community_user_ids = CommunityMembership.objects.filter(
-                community=community,
-                is_verified=True
-            ).values_list('user_id', flat=True)
-
             filtered_users = [
-                user for user in nearby_users
-                if user.id in community_user_ids
+                profile.user for profile in self.get_nearby_profiles().filter(
+                    user_id__in=CommunityMembership.objects.filter(
+                        community=community,
+                        is_verified=True
+                    ).values('user_id')
+                )
             ]
 
             logger.info(
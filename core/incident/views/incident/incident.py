@@ -19,7 +19,7 @@ class IncidentListView(PermissionMixin, ListView):
             'incident_type',
             'incident_status',
             'reported_by_user',
-        )
+        ).order_by('-reported_at')
 
         form = SearchIncidentForm(self.request.GET)
         if form.is_valid():
@@ -31,6 +31,10 @@ class IncidentListView(PermissionMixin, ListView):
             if incident_status:
                 queryset = queryset.filter(incident_status=incident_status)
 
+            community = form.cleaned_data.get('community')
+            if community:
+                queryset = queryset.filter(community=community)
+
         return queryset
 
     def get_context_data(self, **kwargs):
@@ -50,7 +54,8 @@ class IncidentDetailView(PermissionMixin, DetailView):
             'incident_type',
             'incident_status',
             'reported_by_user',
-        )
+            'community',
+        ).prefetch_related('media')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1 +1,2 @@
-from .base_model import *
\ No newline at end of file
+from .base_model import *
+from .stored_blob import *
\ No newline at end of file
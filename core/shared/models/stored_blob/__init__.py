@@ -0,0 +1 @@
+from .stored_blob import *
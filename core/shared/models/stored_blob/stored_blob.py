@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class StoredBlob(models.Model):
+    sha256 = models.CharField(max_length=64, primary_key=True, verbose_name="SHA-256")
+    name = models.CharField(max_length=255, verbose_name="Ruta")
+    size = models.PositiveBigIntegerField(verbose_name="Tamaño")
+    ref_count = models.PositiveIntegerField(default=0, verbose_name="Referencias")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creado en")
+
+    class Meta:
+        db_table = "shared_stored_blob"
+        verbose_name = "Archivo almacenado"
+        verbose_name_plural = "Archivos almacenados"
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count})"
@@ -0,0 +1 @@
+from .keyset import *
@@ -0,0 +1,66 @@
+import base64
+import json
+from dataclasses import dataclass
+
+from django.db.models import Q
+
+__all__ = ['KeysetPage', 'KeysetPaginator']
+
+
+@dataclass
+class KeysetPage:
+    items: list
+    next_cursor: str | None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+class KeysetPaginator:
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.fields = [name.lstrip('-') for name in self.ordering]
+        self.descending = [name.startswith('-') for name in self.ordering]
+
+    def _model_field(self, name):
+        return self.queryset.model._meta.get_field(name)
+
+    def encode_cursor(self, item):
+        values = [self._model_field(name).value_to_string(item) for name in self.fields]
+        return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            if len(values) != len(self.fields):
+                return None
+            return [self._model_field(name).to_python(value) for name, value in zip(self.fields, values)]
+        except Exception:
+            return None
+
+    def _after(self, values):
+        condition = Q()
+        for position, (name, descending) in enumerate(zip(self.fields, self.descending)):
+            lookup = 'lt' if descending else 'gt'
+            step = Q(**{f'{name}__{lookup}': values[position]})
+            for previous_name, previous_value in zip(self.fields[:position], values[:position]):
+                step &= Q(**{previous_name: previous_value})
+            condition |= step
+        return condition
+
+    def page(self, cursor=None):
+        queryset = self.queryset.order_by(*self.ordering)
+        values = self.decode_cursor(cursor) if cursor else None
+        if values is not None:
+            queryset = queryset.filter(self._after(values))
+
+        items = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(items) > self.per_page:
+            items = items[:self.per_page]
+            next_cursor = self.encode_cursor(items[-1])
+        return KeysetPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,81 @@
+import hashlib
+import logging
+import os
+import re
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+from django.utils.deconstruct import deconstructible
+
+from core.shared.models import StoredBlob
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['ContentAddressedStorage', 'content_addressed_storage']
+
+
+@deconstructible(path='core.shared.storage.ContentAddressedStorage')
+class ContentAddressedStorage(FileSystemStorage):
+    PREFIX = 'cas'
+    NAME_PATTERN = re.compile(r'^cas/[0-9a-f]{2}/[0-9a-f]{2}/(?P<digest>[0-9a-f]{64})(\.[a-z0-9]{1,10})?$')
+
+    def get_available_name(self, name, max_length=None):
+        return name
+
+    @staticmethod
+    def hash_content(content):
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in content.chunks():
+            digest.update(chunk)
+            size += len(chunk)
+        content.seek(0)
+        return digest.hexdigest(), size
+
+    @classmethod
+    def blob_name(cls, digest, original_name):
+        extension = os.path.splitext(original_name)[1].lower()
+        if not re.fullmatch(r'\.[a-z0-9]{1,10}', extension):
+            extension = ''
+        return f"{cls.PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+    @classmethod
+    def digest_from_name(cls, name):
+        match = cls.NAME_PATTERN.match(name or '')
+        return match.group('digest') if match else None
+
+    def _save(self, name, content):
+        digest, size = self.hash_content(content)
+        blob_name = self.blob_name(digest, name)
+
+        with transaction.atomic():
+            StoredBlob.objects.get_or_create(
+                sha256=digest,
+                defaults={'name': blob_name, 'size': size, 'ref_count': 0}
+            )
+            blob = StoredBlob.objects.select_for_update().get(pk=digest)
+            if not self.exists(blob.name):
+                super()._save(blob.name, content)
+            else:
+                logger.info(f"Archivo duplicado reutilizado: {blob.name}")
+            StoredBlob.objects.filter(pk=digest).update(ref_count=F('ref_count') + 1)
+        return blob.name
+
+    def delete(self, name):
+        digest = self.digest_from_name(name)
+        if digest is None:
+            return super().delete(name)
+
+        with transaction.atomic():
+            blob = StoredBlob.objects.select_for_update().filter(pk=digest).first()
+            if blob is None:
+                return super().delete(name)
+            if blob.ref_count > 1:
+                StoredBlob.objects.filter(pk=digest).update(ref_count=F('ref_count') - 1)
+                return
+            super().delete(blob.name)
+            blob.delete()
+
+
+content_addressed_storage = ContentAddressedStorage()
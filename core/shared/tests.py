@@ -1,3 +1,73 @@
-from django.test import TestCase
+import shutil
+import tempfile
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.shared.cache import is_shared_cache
+from core.shared.models import StoredBlob
+from core.shared.storage import ContentAddressedStorage
+
+
+class ContentAddressedStorageTest(TestCase):
+
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.storage = ContentAddressedStorage(location=self.location)
+
+    def tearDown(self):
+        shutil.rmtree(self.location, ignore_errors=True)
+
+    def test_identical_content_is_stored_once(self):
+        first = self.storage.save('incidents/2025/01/01/foto.JPG', ContentFile(b'misma foto'))
+        second = self.storage.save('incidents/2025/02/02/otra.jpg', ContentFile(b'misma foto'))
+
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith('cas/'))
+        self.assertTrue(first.endswith('.jpg'))
+        self.assertEqual(StoredBlob.objects.get(name=first).ref_count, 2)
+
+    def test_different_content_gets_different_names(self):
+        first = self.storage.save('foto.jpg', ContentFile(b'foto uno'))
+        second = self.storage.save('foto.jpg', ContentFile(b'foto dos'))
+
+        self.assertNotEqual(first, second)
+
+    def test_file_is_removed_after_last_reference(self):
+        name = self.storage.save('foto.jpg', ContentFile(b'foto'))
+        self.storage.save('foto.jpg', ContentFile(b'foto'))
+
+        self.storage.delete(name)
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(StoredBlob.objects.get(name=name).ref_count, 1)
+
+        self.storage.delete(name)
+        self.assertFalse(self.storage.exists(name))
+        self.assertFalse(StoredBlob.objects.filter(name=name).exists())
+
+    def test_missing_file_is_rewritten(self):
+        name = self.storage.save('foto.jpg', ContentFile(b'foto'))
+        super(ContentAddressedStorage, self.storage).delete(name)
+
+        self.storage.save('foto.jpg', ContentFile(b'foto'))
+
+        with self.storage.open(name, 'rb') as stored:
+            self.assertEqual(stored.read(), b'foto')
+
+    def test_legacy_names_are_deleted_directly(self):
+        legacy = super(ContentAddressedStorage, self.storage)._save('incidents/2024/foto.jpg', ContentFile(b'x'))
+
+        self.storage.delete(legacy)
+
+        self.assertFalse(self.storage.exists(legacy))
+
+
+class SharedCacheTest(SimpleTestCase):
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_locmem_is_process_local(self):
+        self.assertFalse(is_shared_cache())
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache'}})
+    def test_database_cache_is_shared(self):
+        self.assertTrue(is_shared_cache())